@@ -1,8 +1,14 @@
+import time
 import bpy
 
 from bpy.utils import register_class, unregister_class
 from bpy.path import abspath
 
+profile_start_time = time.perf_counter()  # read before importing the profiler, so that its own import is measured
+from .fast64_internal import startup_profiler
+
+startup_profiler.start(__name__, profile_start_time)  # does nothing unless FAST64_PROFILE_STARTUP is set
+
 from . import addon_updater_ops
 
 from .fast64_internal.game_data import game_data
@@ -16,19 +22,16 @@ from .fast64_internal.repo_settings import (
 )
 
 from .fast64_internal.sm64 import sm64_register, sm64_unregister, SM64_ActionProperty
-from .fast64_internal.sm64.sm64_constants import sm64_world_defaults
 from .fast64_internal.sm64.settings.properties import SM64_Properties
 from .fast64_internal.sm64.sm64_geolayout_bone import SM64_BoneProperties
 from .fast64_internal.sm64.sm64_objects import SM64_ObjectProperties
 
 from .fast64_internal.z64 import OOT_Properties, oot_register, oot_unregister
-from .fast64_internal.z64.constants import oot_world_defaults
 from .fast64_internal.z64.props_panel_main import OOT_ObjectProperties
 from .fast64_internal.z64.actor.properties import initOOTActorProperties
 from .fast64_internal.utility_anim import utility_anim_register, utility_anim_unregister, ArmatureApplyWithMeshOperator
 
 from .fast64_internal.mk64 import MK64_Properties, mk64_register, mk64_unregister
-from .fast64_internal.mk64.mk64_constants import mk64_world_defaults
 
 from .fast64_internal.f3d.f3d_material import (
     F3D_MAT_CUR_VERSION,
@@ -37,6 +40,7 @@ from .fast64_internal.f3d.f3d_material import (
     check_or_ask_color_management,
 )
 from .fast64_internal.f3d.f3d_writer import f3d_writer_register, f3d_writer_unregister
+from .fast64_internal.f3d.f3d_texture_jobs import texture_jobs_unregister
 from .fast64_internal.f3d.f3d_parser import f3d_parser_register, f3d_parser_unregister
 from .fast64_internal.f3d.flipbook import flipbook_register, flipbook_unregister
 from .fast64_internal.f3d.op_largetexture import op_largetexture_register, op_largetexture_unregister, ui_oplargetexture
@@ -116,6 +120,16 @@ class F3D_GlobalSettingsPanel(bpy.types.Panel):
         col.prop(context.scene, "ignoreTextureRestrictions")
         if context.scene.ignoreTextureRestrictions:
             col.box().label(text="Width/height must be < 1024. Must be png format.")
+        col.prop(context.scene.fast64.settings, "optimize_vertex_loads")
+        col.prop(context.scene.fast64.settings, "optimize_draw_order")
+        col.prop(context.scene.fast64.settings, "merge_identical_lists")
+        col.prop(context.scene.fast64.settings, "incremental_export")
+        prop_split(col, context.scene.fast64.settings, "texture_conversion_threads", "Texture Threads")
+        col.prop(context.scene.fast64.settings, "use_texture_cache")
+        if context.scene.fast64.settings.use_texture_cache:
+            prop_split(col, context.scene.fast64.settings, "texture_cache_size", "Cache Size (MB)")
+            if not bpy.data.filepath:
+                col.box().label(text="Save the blend file to enable the cache.", icon="INFO")
 
 
 class Fast64_GlobalSettingsPanel(bpy.types.Panel):
@@ -218,6 +232,39 @@ class Fast64Settings_Properties(bpy.types.PropertyGroup):
         description="When enabled, fast64 will default colored textures's format to RGBA even if they fit CI requirements, with the exception of textures that would not fit into TMEM otherwise",
     )
     dont_ask_color_management: bpy.props.BoolProperty(name="Don't ask to set color management properties")
+    use_texture_cache: bpy.props.BoolProperty(
+        name="Cache Converted Textures",
+        description="Store converted texture and palette data in a fast64_texture_cache folder next to the blend file, so unchanged images are not converted again on the next export",
+    )
+    texture_cache_size: bpy.props.IntProperty(
+        name="Texture Cache Size",
+        description="Maximum size of the texture cache in megabytes, least recently used textures are removed first",
+        default=256,
+        min=1,
+    )
+    texture_conversion_threads: bpy.props.IntProperty(
+        name="Texture Conversion Threads",
+        description="Number of threads converting textures in the background during exports. 1 converts each texture right away on the main thread",
+        default=4,
+        min=1,
+        max=64,
+    )
+    optimize_vertex_loads: bpy.props.BoolProperty(
+        name="Optimize Vertex Loads",
+        description="Reorder each material's triangles to minimize the amount of vertices loaded by the microcode's vertex buffer. Each change is printed to the console",
+    )
+    optimize_draw_order: bpy.props.BoolProperty(
+        name="Optimize Draw Order",
+        description="When materials are bled, draw the opaque materials of each display list in the order that removes the most state changes and texture loads. Each change is printed to the console",
+    )
+    merge_identical_lists: bpy.props.BoolProperty(
+        name="Merge Identical Lists",
+        description="Write display lists and vertex lists that ended up identical only once, calls to the duplicates use the first one instead. The bytes saved are printed to the console",
+    )
+    incremental_export: bpy.props.BoolProperty(
+        name="Reuse Unchanged Geometry",
+        description="Keep converted geometry in memory and reuse it in later exports of meshes that have not changed since, only edited meshes are converted again",
+    )
 
     repo_settings_tab: bpy.props.BoolProperty(default=True, name="Repo Settings")
     repo_settings_path: bpy.props.StringProperty(name="Path", subtype="FILE_PATH", update=repo_path_update)
@@ -236,12 +283,18 @@ class Fast64Settings_Properties(bpy.types.PropertyGroup):
         data["autoPickTextureFormat"] = self.auto_pick_texture_format
         if self.auto_pick_texture_format:
             data["preferRGBAOverCI"] = self.prefer_rgba_over_ci
+        data["optimizeVertexLoads"] = self.optimize_vertex_loads
+        data["optimizeDrawOrder"] = self.optimize_draw_order
+        data["mergeIdenticalLists"] = self.merge_identical_lists
         return data
 
     def from_repo_settings(self, data: dict):
         set_prop_if_in_data(self, "auto_repo_load_settings", data, "autoLoad")
         set_prop_if_in_data(self, "auto_pick_texture_format", data, "autoPickTextureFormat")
         set_prop_if_in_data(self, "prefer_rgba_over_ci", data, "preferRGBAOverCI")
+        set_prop_if_in_data(self, "optimize_vertex_loads", data, "optimizeVertexLoads")
+        set_prop_if_in_data(self, "optimize_draw_order", data, "optimizeDrawOrder")
+        set_prop_if_in_data(self, "merge_identical_lists", data, "mergeIdenticalLists")
 
 
 class Fast64_Properties(bpy.types.PropertyGroup):
@@ -401,12 +454,18 @@ def after_load(_a, _b):
 def set_game_defaults(scene: bpy.types.Scene, set_ucode=True):
     world_defaults = None
     if scene.gameEditorMode == "SM64":
+        from .fast64_internal.sm64.sm64_constants import sm64_world_defaults
+
         f3d_type = "F3D"
         world_defaults = sm64_world_defaults
     elif scene.gameEditorMode == "MK64":
+        from .fast64_internal.mk64.mk64_constants import mk64_world_defaults
+
         f3d_type = "F3DEX"
         world_defaults = mk64_world_defaults
     elif scene.gameEditorMode in {"OOT", "MM"}:
+        from .fast64_internal.z64.constants import oot_world_defaults
+
         f3d_type = "F3DEX2/LX2"
         world_defaults = oot_world_defaults
     elif scene.gameEditorMode == "MK64":
@@ -443,30 +502,38 @@ def register():
 
     # Register addon updater first,
     # this way if a broken version fails to register the user can still pick another version.
-    register_class(ExampleAddonPreferences)
-    addon_updater_ops.register(bl_info)
+    with startup_profiler.timed("addon updater"):
+        register_class(ExampleAddonPreferences)
+        addon_updater_ops.register(bl_info)
 
     register_class(Matrix4x4Property)
-    initOOTActorProperties()
-    utility_anim_register()
-    mat_register()
-    bsdf_conv_register()
-    sm64_register(True)
-    oot_register(True)
-    mk64_register(True)
-
-    gltf_extension_register()
-
-    repo_settings_operators_register()
-
-    for cls in classes:
-        register_class(cls)
-
-    bsdf_conv_panel_regsiter()
-    f3d_writer_register()
-    flipbook_register()
-    f3d_parser_register()
-    op_largetexture_register()
+    with startup_profiler.timed("oot actor properties"):
+        initOOTActorProperties()
+    with startup_profiler.timed("materials"):
+        utility_anim_register()
+        mat_register()
+        bsdf_conv_register()
+    with startup_profiler.timed("sm64"):
+        sm64_register(True)
+    with startup_profiler.timed("oot"):
+        oot_register(True)
+    with startup_profiler.timed("mk64"):
+        mk64_register(True)
+
+    with startup_profiler.timed("gltf"):
+        gltf_extension_register()
+
+    with startup_profiler.timed("settings, f3d operators and panels"):
+        repo_settings_operators_register()
+
+        for cls in classes:
+            register_class(cls)
+
+        bsdf_conv_panel_regsiter()
+        f3d_writer_register()
+        flipbook_register()
+        f3d_parser_register()
+        op_largetexture_register()
 
     # ROM
 
@@ -492,6 +559,8 @@ def register():
     bpy.types.Action.fast64 = bpy.props.PointerProperty(type=Fast64_ActionProperties, name="Fast64 Action Properties")
     bpy.app.handlers.load_post.append(after_load)
 
+    startup_profiler.finish()
+
 
 # called on add-on disabling
 def unregister():
@@ -499,6 +568,7 @@ def unregister():
     op_largetexture_unregister()
     flipbook_unregister()
     f3d_writer_unregister()
+    texture_jobs_unregister()
     f3d_parser_unregister()
     sm64_unregister(True)
     oot_unregister(True)
@@ -1,5 +1,19 @@
+import bpy
+import hashlib
+import os
+import pickle
+import sys
+
 from xml.etree.ElementTree import parse as parseXML, Element
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Type, TypeVar
+
+XML_DIR = Path(__file__).parent / "xml"
+CACHE_DIR_NAME = os.path.join("fast64", "z64_cache")
+CACHE_VERSION = 1  # bump when the cached data depends on another module that changed
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -18,3 +32,80 @@ def get_xml_root(xmlPath: str) -> Element:
         from ...utility import PluginError
 
         raise PluginError(f"ERROR: File '{xmlPath}' is missing or malformed.")
+
+
+def get_xml_path(game: str, xml_name: str) -> Path:
+    return (XML_DIR / f"{game.lower()}_{xml_name}.xml").resolve()
+
+
+def get_file_signature(path: Path, known: Optional[tuple[int, int, str]] = None) -> tuple[int, int, str]:
+    """(mtime, size, sha1) of a file, the hash is reused from ``known`` if the mtime and size did not change"""
+    stat = path.stat()
+    if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+        return known
+    return (stat.st_mtime_ns, stat.st_size, hashlib.sha1(path.read_bytes()).hexdigest())
+
+
+def get_cache_dir() -> Optional[Path]:
+    """
+    Per user folder for the snapshots, the addon's own folder can be read-only or replaced by the updater.
+    None if Blender does not provide one.
+    """
+    try:
+        return Path(bpy.utils.user_resource("DATAFILES", path=CACHE_DIR_NAME))
+    except Exception as exc:
+        print(f"Could not find a folder for the Z64 data snapshots: {exc}")
+        return None
+
+
+def load_cached_data(data_type: Type[T], game: str) -> T:
+    """
+    Returns ``data_type(game)``, loaded from a pickled snapshot when the XML file and the module defining
+    ``data_type`` did not change since it was made. Otherwise the XML is parsed and the snapshot is rebuilt.
+    """
+
+    sources = [
+        get_xml_path(game, data_type.xml_name),
+        Path(sys.modules[data_type.__module__].__file__),
+        Path(__file__),  # for Z64_BaseElement
+    ]
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return data_type(game)
+    cache_path = cache_dir / f"{game.lower()}_{data_type.xml_name}.pickle"
+
+    try:
+        with open(cache_path, "rb") as file:
+            version, signatures = pickle.load(file)
+            if version == CACHE_VERSION and len(signatures) == len(sources):
+                new_signatures = [get_file_signature(path, known) for path, known in zip(sources, signatures)]
+                if [signature[2] for signature in new_signatures] == [signature[2] for signature in signatures]:
+                    data = pickle.load(file)
+                    if new_signatures != signatures:  # only the mtime changed, avoid hashing again next time
+                        save_cached_data(cache_path, new_signatures, data)
+                    return data
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        print(f"Could not load {cache_path.name}, parsing the XML instead: {exc}")
+
+    data = data_type(game)
+    save_cached_data(cache_path, [get_file_signature(path) for path in sources], data)
+    return data
+
+
+def save_cached_data(cache_path: Path, signatures: list[tuple[int, int, str]], data: Any):
+    """A snapshot that can't be written is skipped, the XML is parsed again next time"""
+    temp_path = cache_path.with_suffix(".tmp")
+    try:
+        os.makedirs(cache_path.parent, exist_ok=True)
+        with open(temp_path, "wb") as file:
+            pickle.dump((CACHE_VERSION, signatures), file)
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception as exc:
+        print(f"Could not save {cache_path.name}: {exc}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
@@ -7,6 +7,7 @@ from bpy.types import Context
 from .enum_data import Z64_EnumData
 from .object_data import Z64_ObjectData
 from .actor_data import Z64_ActorData
+from .common import load_cached_data
 
 # ---
 
@@ -818,6 +819,8 @@ class Z64_Data:
     def __init__(self, game: str):
         self.game = game
         self.is_registering = True
+        # game : XML data, kept so that switching games doesn't rebuild them
+        self.tables_by_game: dict[str, tuple[Z64_EnumData, Z64_ObjectData, Z64_ActorData]] = {}
         self.update(None, game, True)  # forcing the update as we're in the init function
 
         self.enum_floor_effect = enum_floor_effect
@@ -864,9 +867,13 @@ class Z64_Data:
         }
 
         self.game = next_game
-        self.enums = Z64_EnumData(self.game)
-        self.objects = Z64_ObjectData(self.game)
-        self.actors = Z64_ActorData(self.game)
+        if self.game not in self.tables_by_game:
+            self.tables_by_game[self.game] = (
+                load_cached_data(Z64_EnumData, self.game),
+                load_cached_data(Z64_ObjectData, self.game),
+                load_cached_data(Z64_ActorData, self.game),
+            )
+        self.enums, self.objects, self.actors = self.tables_by_game[self.game]
 
         if self.game == "OOT":
             self.cs_index_start = 4
@@ -1,7 +1,5 @@
 from dataclasses import dataclass, field
-from os import path
-from pathlib import Path
-from .common import Z64_BaseElement, get_xml_root
+from .common import Z64_BaseElement, get_xml_root, get_xml_path
 
 
 @dataclass
@@ -67,13 +65,13 @@ class Z64_EnumElement(Z64_BaseElement):
 class Z64_EnumData:
     """Cutscene and misc enum data"""
 
+    xml_name = "enum_data"  # ``<game>_enum_data.xml``
+
     def __init__(self, game: str):
         # general enumData list
         self.enumDataList: list[Z64_EnumElement] = []
 
-        # Path to the ``EnumData.xml`` file
-        xml_path = Path(f"{path.dirname(path.abspath(__file__))}/xml/{game.lower()}_enum_data.xml")
-        enum_data_root = get_xml_root(xml_path.resolve())
+        enum_data_root = get_xml_root(get_xml_path(game, self.xml_name))
 
         for enum in enum_data_root.iterfind("Enum"):
             self.enumDataList.append(
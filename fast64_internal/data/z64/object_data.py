@@ -1,8 +1,6 @@
 from dataclasses import dataclass
-from os import path
-from pathlib import Path
 from ...utility import PluginError
-from .common import Z64_BaseElement, get_xml_root
+from .common import Z64_BaseElement, get_xml_root, get_xml_path
 
 # Note: "object" in this context refers to an OoT Object file (like ``gameplay_keep``)
 
@@ -15,13 +13,13 @@ class Z64_ObjectElement(Z64_BaseElement):
 class Z64_ObjectData:
     """Everything related to OoT objects"""
 
+    xml_name = "object_list"  # ``<game>_object_list.xml``
+
     def __init__(self, game: str):
         # general object list
         self.objectList: list[Z64_ObjectElement] = []
 
-        # Path to the ``ObjectList.xml`` file
-        xml_path = Path(f"{path.dirname(path.abspath(__file__))}/xml/{game.lower()}_object_list.xml")
-        object_root = get_xml_root(xml_path.resolve())
+        object_root = get_xml_root(get_xml_path(game, self.xml_name))
 
         for obj in object_root.iterfind("Object"):
             objName = f"{obj.attrib['Name']} - {obj.attrib['ID'].removeprefix('OBJECT_')}"
@@ -91,6 +91,10 @@ def get_geo_cmds(
 
 
 GEO_CMDS = (SPGeometryMode, SPSetGeometryMode, SPClearGeometryMode, SPLoadGeometryMode)
+GEOMETRY_ONLY_CMDS = (SPVertex, SP1Triangle, SP2Triangles, SPEndDisplayList)
+TEXTURE_LOAD_CMDS = (DPLoadBlock, DPLoadTile, DPLoadTLUTCmd)
+TEXTURE_LOAD_COST = 8  # loading texels stalls the rdp far longer than a state change
+PASSTHROUGH_RENDER_MODES = {"G_RM_PASS", "G_RM_NOOP", "G_RM_FOG_SHADE_A", "G_RM_FOG_PRIM_A"}  # first cycle modes
 WRITE_DIFF_OTHERMODE_CMDS = (SPSetOtherModeSub, DPSetRenderMode)
 
 
@@ -262,6 +266,8 @@ class BleedGraphics:
     ):
         if bled_mat := self.bled_gfx_lists.get(id(cmd_list)):
             return bled_mat
+        if bpy.context.scene.fast64.settings.optimize_draw_order:
+            self.optimize_draw_order(last_mat, cmd_list, fmodel_materials, mat_write_method, default_render_mode)
         bleed_state = self.bleed_start
         cur_fmat = None
         bleed_gfx_lists = BleedGfxLists()
@@ -305,6 +311,112 @@ class BleedGraphics:
         self.bled_gfx_lists[id(cmd_list)] = cur_fmat
         return last_mat
 
+    def optimize_draw_order(
+        self,
+        last_mat: FMaterial,
+        cmd_list: GfxList,
+        fmodel_materials,
+        mat_write_method: GfxMatWriteMethod,
+        default_render_mode: tuple[str] = None,
+    ):
+        """
+        Reorders the material groups of an FMesh.draw list so that bleeding removes as many commands as possible.
+        Each material call and the tri lists and revert following it are moved together. Only draw lists where
+        every material is opaque and z buffered are reordered, since the order of those does not change the result.
+        """
+        groups = self.get_draw_order_groups(cmd_list, fmodel_materials, default_render_mode)
+        if groups is None or len(groups) < 2:
+            return
+
+        costs = {}  # (last material, material) : (weighted cost, command count)
+
+        def transition_cost(last: FMaterial, cur: FMaterial):
+            key = (id(last), id(cur))
+            if key not in costs:
+                tex_cmds = self.bleed_textures(cur, last, self.bleed_start)
+                mat_cmds = self.bleed_mat(cur, last, [], mat_write_method, default_render_mode, self.bleed_start)
+                cmds = [cmd for cmd in tex_cmds + mat_cmds if not isinstance(cmd, (SPEndDisplayList, DPPipeSync))]
+                loads = sum(isinstance(cmd, TEXTURE_LOAD_CMDS) for cmd in cmds)
+                # a pipe sync is needed before any material that changes rdp state
+                costs[key] = (len(cmds) + loads * TEXTURE_LOAD_COST + (len(cmds) > 0), len(cmds))
+            return costs[key]
+
+        def order_cost(order: list[int]):
+            weighted = count = 0
+            last = last_mat
+            for i in order:
+                group_weighted, group_count = transition_cost(last, groups[i][0])
+                weighted, count, last = weighted + group_weighted, count + group_count, groups[i][0]
+            return weighted, count
+
+        # greedy nearest neighbor, starting from the material drawn before this list
+        remaining = list(range(len(groups)))
+        order = []
+        last = last_mat
+        while remaining:
+            i = min(remaining, key=lambda i: transition_cost(last, groups[i][0])[0])
+            remaining.remove(i)
+            order.append(i)
+            last = groups[i][0]
+
+        before, after = order_cost(list(range(len(groups)))), order_cost(order)
+        if after[0] >= before[0]:
+            return
+        print(
+            f"Draw order optimization for {cmd_list.name}: {len(groups)} material groups reordered, "
+            f"about {before[1] - after[1]} material commands removed"
+        )
+        first = cmd_list.commands.index(groups[0][1][0])
+        end_cmds = [cmd for cmd in cmd_list.commands[first:] if type(cmd) == SPEndDisplayList]
+        cmd_list.commands[first:] = [cmd for i in order for cmd in groups[i][1]] + end_cmds
+
+    def get_draw_order_groups(
+        self, cmd_list: GfxList, fmodel_materials, default_render_mode: tuple[str] = None
+    ) -> list[tuple[FMaterial, list[SPDisplayList]]] | None:
+        """Splits the draw list into (material, calls) groups, returns None if it can't be reordered"""
+        groups = []
+        for cmd in cmd_list.commands:
+            if type(cmd) == SPEndDisplayList:
+                continue
+            if type(cmd) != SPDisplayList:
+                if groups:  # static commands after the first call would be drawn with a different material
+                    return None
+                continue
+            tag = cmd.displayList.tag
+            if tag & GfxListTag.Material:
+                _, fmat = find_material_from_jump_cmd(fmodel_materials, cmd)
+                if fmat is None or not self.is_order_independent(fmat, default_render_mode):
+                    return None
+                groups.append((fmat, [cmd]))
+            elif tag & GfxListTag.Geometry:
+                # tri lists that change state, like cel shading or large textures, are kept in place
+                if not groups or any(not isinstance(c, GEOMETRY_ONLY_CMDS) for c in cmd.displayList.commands):
+                    return None
+                groups[-1][1].append(cmd)
+            elif groups and cmd.displayList is groups[-1][0].revert:
+                groups[-1][1].append(cmd)
+            else:
+                return None
+        return groups
+
+    def is_order_independent(self, fmat: FMaterial, default_render_mode: tuple[str] = None):
+        """Whether the material is drawn opaque with z buffering, so drawing it earlier or later looks the same"""
+        render_mode = default_render_mode
+        for cmd in fmat.mat_only_DL.commands:
+            if isinstance(cmd, DPSetRenderMode):
+                if not cmd.use_preset:
+                    return False
+                render_mode = cmd.flagList
+            elif isinstance(cmd, SPSetOtherMode) and cmd.sets_rendermode(self.f3d):
+                return False
+        if not render_mode:
+            return False
+        return all(
+            mode in PASSTHROUGH_RENDER_MODES
+            or ("_ZB_" in mode and ("OPA" in mode or "TEX_EDGE" in mode) and "XLU" not in mode and "DEC" not in mode)
+            for mode in render_mode
+        ) and any(mode not in PASSTHROUGH_RENDER_MODES for mode in render_mode)
+
     def build_tmem_dict(self, cmd_list: GfxList):
         im_buffer = None
         tmem_dict = dict()
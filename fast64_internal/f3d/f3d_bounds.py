@@ -0,0 +1,204 @@
+"""
+Bounding volumes of exported geometry, computed from NumPy arrays of points so no per vertex objects are kept.
+Spheres are the minimal sphere enclosing the points. Boxes are aligned with the principal axes of the points when that
+gives a smaller box than the axis aligned one.
+"""
+
+import itertools
+from typing import Optional
+
+import numpy as np
+
+# the points furthest along these directions start the set of points the minimal sphere is searched for
+CORE_SET_DIRECTIONS = np.array(
+    [
+        (1, 0, 0),
+        (0, 1, 0),
+        (0, 0, 1),
+        (1, 1, 0),
+        (1, -1, 0),
+        (1, 0, 1),
+        (1, 0, -1),
+        (0, 1, 1),
+        (0, 1, -1),
+        (1, 1, 1),
+        (1, 1, -1),
+        (1, -1, 1),
+        (-1, 1, 1),
+    ],
+    dtype=np.float64,
+)
+CORE_SET_GROWTH = 8  # points outside of the sphere added to the set at a time
+EPSILON = 1e-7
+
+
+def transform_points(points: np.ndarray, matrix) -> np.ndarray:
+    """Applies a 4x4 matrix (mathutils or NumPy) to (n, 3) points"""
+    matrix = np.array(matrix, dtype=np.float64)
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def get_tolerance(radius: float):
+    return EPSILON * max(radius, 1.0)
+
+
+def get_circumsphere(support: list[np.ndarray]) -> tuple[np.ndarray, float]:
+    """Smallest sphere with all support points on its surface, a radius of -1 for no points"""
+    if len(support) == 0:
+        return np.zeros(3), -1.0
+    if len(support) == 1:
+        return support[0], 0.0
+    if len(support) == 2:
+        center = (support[0] + support[1]) / 2
+        return center, float(np.linalg.norm(support[0] - center))
+
+    if len(support) == 3:
+        a, b, c = support
+        ab, ac = b - a, c - a
+        normal = np.cross(ab, ac)
+        denominator = 2 * normal.dot(normal)
+        if denominator > EPSILON * max(ab.dot(ab), ac.dot(ac)) ** 2:
+            center = a + (np.cross(normal, ab) * ac.dot(ac) + np.cross(ac, normal) * ab.dot(ab)) / denominator
+            return center, float(np.linalg.norm(a - center))
+        # collinear, the sphere through the two points furthest apart encloses the third
+        return max((get_circumsphere(list(pair)) for pair in itertools.combinations(support, 2)), key=lambda s: s[1])
+
+    origin = support[0]
+    rows = np.array([point - origin for point in support[1:]])
+    if abs(np.linalg.det(rows)) > EPSILON * (rows**2).sum(axis=1).max() ** 1.5:
+        offset = np.linalg.solve(2 * rows, (rows**2).sum(axis=1))
+        return origin + offset, float(np.linalg.norm(offset))
+    # coplanar, use the smallest sphere through three of the points that encloses the fourth
+    spheres = [get_circumsphere(list(triple)) for triple in itertools.combinations(support, 3)]
+    enclosing = [
+        (center, radius)
+        for center, radius in spheres
+        if all(np.linalg.norm(point - center) <= radius + get_tolerance(radius) for point in support)
+    ]
+    return min(enclosing or spheres, key=lambda sphere: sphere[1])
+
+
+def get_welzl_sphere(points: np.ndarray, count: int, support: list[np.ndarray]) -> tuple[np.ndarray, float]:
+    """Minimal sphere enclosing the first count points with the support points on its surface"""
+    center, radius = get_circumsphere(support)
+    if len(support) == 4:
+        return center, radius
+    for i in range(count):
+        if radius < 0 or np.linalg.norm(points[i] - center) > radius + get_tolerance(radius):
+            center, radius = get_welzl_sphere(points, i, support + [points[i]])
+    return center, radius
+
+
+def get_extreme_points(points: np.ndarray) -> np.ndarray:
+    projections = points @ CORE_SET_DIRECTIONS.T
+    return points[np.unique(np.concatenate([projections.argmin(axis=0), projections.argmax(axis=0)]))]
+
+
+def get_minimal_sphere(points: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Exact minimal enclosing sphere of (n, 3) points.
+    Welzl's algorithm runs on a small set of points, starting with the extreme points and growing with the points
+    left outside until the sphere of the set encloses all of them.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if len(points) == 0:
+        raise ValueError("Cannot compute the bounding sphere of no points")
+    core = get_extreme_points(points)
+    # a fixed order so exports are reproducible, shuffled to keep Welzl's algorithm fast
+    rng = np.random.default_rng(0)
+    while True:
+        core = core[rng.permutation(len(core))]
+        center, radius = get_welzl_sphere(core, len(core), [])
+        distances = np.sqrt(((points - center) ** 2).sum(axis=1))
+        outside = np.flatnonzero(distances > radius + get_tolerance(radius))
+        if len(outside) == 0:
+            return center, radius
+        furthest = outside[np.argsort(distances[outside])[-CORE_SET_GROWTH:]]
+        core = np.concatenate([core, points[furthest]])
+
+
+def get_enclosing_sphere_of_spheres(
+    sphere_a: tuple[np.ndarray, float], sphere_b: tuple[np.ndarray, float]
+) -> tuple[np.ndarray, float]:
+    (center_a, radius_a), (center_b, radius_b) = sphere_a, sphere_b
+    distance = float(np.linalg.norm(center_b - center_a))
+    if distance + radius_b <= radius_a:
+        return sphere_a
+    if distance + radius_a <= radius_b:
+        return sphere_b
+    radius = (distance + radius_a + radius_b) / 2
+    return center_a + (center_b - center_a) * (radius - radius_a) / distance, radius
+
+
+def get_oriented_box(points: np.ndarray) -> np.ndarray:
+    """
+    8 corners of a box enclosing (n, 3) points, aligned with their principal axes if that box is smaller.
+    Flat boxes are compared as if they were a little thick.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if len(points) == 0:
+        raise ValueError("Cannot compute the bounding box of no points")
+    centered = points - points.mean(axis=0)
+    _, principal_axes = np.linalg.eigh(centered.T @ centered)
+
+    best_axes, best_size, best_bounds = None, None, None
+    for axes in (np.identity(3), principal_axes):
+        projected = points @ axes
+        low, high = projected.min(axis=0), projected.max(axis=0)
+        extents = high - low
+        size = np.prod(extents + extents.max() * 0.01)
+        if best_size is None or size < best_size * (1 - EPSILON):
+            best_axes, best_size, best_bounds = axes, size, (low, high)
+    low, high = best_bounds
+    corners = np.array(list(itertools.product((low[0], high[0]), (low[1], high[1]), (low[2], high[2]))))
+    return corners @ best_axes.T
+
+
+class BoundingVolume:
+    """
+    Bounds of points added in batches, only the bounds of each batch are kept.
+    The sphere is exact for a single batch. For several, it is the smallest of a few spheres enclosing the sphere of
+    every batch, one of them centered on the minimal sphere of the extreme points of all batches.
+    """
+
+    def __init__(self):
+        self.min: Optional[np.ndarray] = None
+        self.max: Optional[np.ndarray] = None
+        self.spheres: list[tuple[np.ndarray, float]] = []
+        self.extreme_points: list[np.ndarray] = []
+
+    def add_points(self, points: np.ndarray):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if len(points) == 0:
+            return
+        low, high = points.min(axis=0), points.max(axis=0)
+        self.min = low if self.min is None else np.minimum(self.min, low)
+        self.max = high if self.max is None else np.maximum(self.max, high)
+        self.spheres.append(get_minimal_sphere(points))
+        self.extreme_points.append(get_extreme_points(points))
+
+    def is_empty(self):
+        return len(self.spheres) == 0
+
+    def get_sphere(self) -> tuple[np.ndarray, float]:
+        if self.is_empty():
+            raise ValueError("Cannot compute the bounding sphere of no points")
+        if len(self.spheres) == 1:
+            return self.spheres[0]
+
+        combined = self.spheres[0]
+        for sphere in self.spheres[1:]:
+            combined = get_enclosing_sphere_of_spheres(combined, sphere)
+        centers = [combined[0], get_minimal_sphere(np.concatenate(self.extreme_points))[0], (self.min + self.max) / 2]
+        return min(
+            (
+                (
+                    center,
+                    max(
+                        float(np.linalg.norm(center - sphere_center)) + radius for sphere_center, radius in self.spheres
+                    ),
+                )
+                for center in centers
+            ),
+            key=lambda sphere: sphere[1],
+        )
@@ -0,0 +1,170 @@
+"""
+Merges the display lists and vertex lists of a model that ended up identical, so each is only written once.
+Runs after the bleed pass, right before the model is written. Calls to a merged list are pointed at the list it
+duplicates and the merged list is not exported. Override draw lists are referenced from outside of the model, so
+a duplicate one is kept as a single branch to the list it duplicates.
+Lists with scrolling commands or scrolling vertices are left alone, their scroll code refers to them by name.
+"""
+
+from dataclasses import dataclass
+from typing import Iterator
+
+import bpy
+
+from .f3d_gbi import (
+    GFX_SIZE,
+    DLFormat,
+    FMaterial,
+    FModel,
+    GfxList,
+    GfxListTag,
+    SPBranchList,
+    SPDisplayList,
+    SPVertex,
+    VtxList,
+)
+
+
+@dataclass
+class MergeStats:
+    display_lists: int = 0
+    vertex_lists: int = 0
+    bytes_saved: int = 0
+
+
+def iter_models(fModel: FModel) -> Iterator[FModel]:
+    yield fModel
+    for subModel in fModel.subModels:
+        yield from iter_models(subModel)
+
+
+def get_all_gfx_lists(fModel: FModel) -> list[GfxList]:
+    """Every list of the model tree that can call another list"""
+    gfx_lists = []
+    for model in iter_models(fModel):
+        for fMaterial, _ in model.materials.values():
+            gfx_lists.append(fMaterial.material)
+            if fMaterial.revert is not None:
+                gfx_lists.append(fMaterial.revert)
+        for fMesh in model.meshes.values():
+            gfx_lists.append(fMesh.draw)
+            gfx_lists.extend(fMesh.draw_overrides)
+            for triGroup in fMesh.triangleGroups:
+                gfx_lists.append(triGroup.triList)
+                gfx_lists.extend(triGroup.celTriLists)
+        for lod in model.LODGroups.values():
+            gfx_lists.extend(gfx_list for gfx_list in [lod.draw] + lod.subdraws if gfx_list is not None)
+        if model.materialRevert is not None:
+            gfx_lists.append(model.materialRevert)
+    return gfx_lists
+
+
+def get_mergeable_gfx_lists(model: FModel) -> list[GfxList]:
+    """Lists only called by other lists of the model"""
+    gfx_lists = []
+    for fMaterial, _ in model.materials.values():
+        gfx_lists.append(fMaterial.material)
+        if fMaterial.revert is not None:
+            gfx_lists.append(fMaterial.revert)
+    for fMesh in model.meshes.values():
+        for triGroup in fMesh.triangleGroups:
+            gfx_lists.append(triGroup.triList)
+            gfx_lists.extend(triGroup.celTriLists)
+    return [gfx_list for gfx_list in gfx_lists if gfx_list.tag.Export and not has_gfx_scroll(gfx_list)]
+
+
+def has_gfx_scroll(gfx_list: GfxList):
+    return any(cmd.tags for cmd in gfx_list.commands)
+
+
+def has_vertex_scroll(fMaterial: FMaterial):
+    if fMaterial is None or fMaterial.scrollData is None:
+        return False
+    return any(field.animType != "None" for fields in fMaterial.scrollData.fields for field in fields)
+
+
+def get_gfx_key(gfx_list: GfxList):
+    """Commands compare the lists and vertices they point to by identity, so those must be merged first"""
+    return gfx_list.DLFormat, "\n".join(repr(cmd) for cmd in gfx_list.commands)
+
+
+def merge_vertex_lists(model: FModel, stats: MergeStats) -> dict[VtxList, VtxList]:
+    merged = {}
+    canonical: dict[bytes, VtxList] = {}
+    for fMesh in model.meshes.values():
+        for triGroup in fMesh.triangleGroups:
+            vertexList = triGroup.vertexList
+            if not vertexList.export or has_vertex_scroll(triGroup.fMaterial):
+                continue
+            key = bytes(vertexList.vertices.data)
+            if key not in canonical:
+                canonical[key] = vertexList
+                continue
+            merged[vertexList] = canonical[key]
+            vertexList.export = False
+            stats.vertex_lists += 1
+            stats.bytes_saved += vertexList.size()
+    return merged
+
+
+def merge_gfx_lists(model: FModel, stats: MergeStats) -> dict[GfxList, GfxList]:
+    merged = {}
+    canonical: dict[tuple, GfxList] = {}
+    for gfx_list in get_mergeable_gfx_lists(model):
+        key = get_gfx_key(gfx_list)
+        if key not in canonical:
+            canonical[key] = gfx_list
+            continue
+        merged[gfx_list] = canonical[key]
+        gfx_list.tag |= GfxListTag.NoExport
+        stats.display_lists += 1
+        stats.bytes_saved += gfx_list.size(model.f3d)
+    return merged
+
+
+def branch_duplicate_overrides(model: FModel, stats: MergeStats):
+    canonical: dict[tuple, GfxList] = {}
+    for fMesh in model.meshes.values():
+        for gfx_list in [fMesh.draw] + fMesh.draw_overrides:
+            if gfx_list.DLFormat != DLFormat.Static or not gfx_list.tag.Export or has_gfx_scroll(gfx_list):
+                continue
+            key = get_gfx_key(gfx_list)
+            if key not in canonical:
+                canonical[key] = gfx_list
+            elif gfx_list is not fMesh.draw and len(gfx_list.commands) > 1:
+                stats.display_lists += 1
+                stats.bytes_saved += gfx_list.size(model.f3d) - GFX_SIZE
+                gfx_list.commands = [SPBranchList(canonical[key])]
+
+
+def repoint_commands(gfx_lists: list[GfxList], merged_vertex_lists: dict, merged_gfx_lists: dict):
+    """Replaces commands instead of editing them, the same command object can be in several lists"""
+    for gfx_list in gfx_lists:
+        for i, cmd in enumerate(gfx_list.commands):
+            if isinstance(cmd, SPVertex) and cmd.vertList in merged_vertex_lists:
+                gfx_list.commands[i] = SPVertex(merged_vertex_lists[cmd.vertList], cmd.offset, cmd.count, cmd.index)
+            elif isinstance(cmd, (SPDisplayList, SPBranchList)) and cmd.displayList in merged_gfx_lists:
+                gfx_list.commands[i] = type(cmd)(merged_gfx_lists[cmd.displayList])
+
+
+def merge_identical_lists(fModel: FModel) -> MergeStats:
+    """Does nothing unless enabled in the fast64 settings, call once per export with the top model"""
+    stats = MergeStats()
+    if not bpy.context.scene.fast64.settings.merge_identical_lists:
+        return stats
+
+    # lists of different models can end up in different files or segments, only lists of the same model are merged
+    all_gfx_lists = get_all_gfx_lists(fModel)
+    for model in iter_models(fModel):
+        repoint_commands(all_gfx_lists, merge_vertex_lists(model, stats), {})
+        # merging lists can make the lists calling them identical
+        while merged_gfx_lists := merge_gfx_lists(model, stats):
+            repoint_commands(all_gfx_lists, {}, merged_gfx_lists)
+        branch_duplicate_overrides(model, stats)
+
+    if stats.display_lists or stats.vertex_lists:
+        print(
+            f"Merged {stats.display_lists} display lists and {stats.vertex_lists} vertex lists into identical ones, "
+            f"saving {stats.bytes_saved} bytes of ROM and RAM"
+        )
+    return stats
@@ -0,0 +1,87 @@
+"""
+In memory cache of converted geometry, so exporting again only converts the meshes that changed since the last export.
+Entries are keyed by a fingerprint of the mesh data read for the conversion and every setting the conversion depends on,
+an edited mesh gets a new key and is converted again, the least recently used entries are removed past a limit.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+import bpy
+import numpy as np
+
+from .f3d_gbi import FTriGroup, GbiMacro, SPVertex
+from .f3d_mesh_data import MeshArrays
+
+CACHE_VERSION = 1  # bump when the converted geometry changes
+MAX_ENTRIES = 4096
+
+
+class CachedTriGroup:
+    """Vertex data and triangle commands of a FTriGroup, SPVertex commands are stored as (offset, count, index)"""
+
+    def __init__(self, triGroup: FTriGroup):
+        self.vertexData = bytes(triGroup.vertexList.vertices.data)
+        self.commands: list[GbiMacro | tuple[int, int, int]] = [
+            (command.offset, command.count, command.index) if isinstance(command, SPVertex) else command
+            for command in triGroup.triList.commands
+        ]
+
+    def apply(self, triGroup: FTriGroup):
+        triGroup.vertexList.vertices.data = bytearray(self.vertexData)
+        triGroup.triList.commands.extend(
+            SPVertex(triGroup.vertexList, *command) if isinstance(command, tuple) else command
+            for command in self.commands
+        )
+
+
+class GeometryCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries: OrderedDict[tuple, CachedTriGroup] = OrderedDict()  # least recently used first
+
+    def get(self, key: tuple) -> Optional[CachedTriGroup]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple, entry: CachedTriGroup):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+geometry_cache = GeometryCache(MAX_ENTRIES)
+
+
+def get_geometry_cache() -> Optional[GeometryCache]:
+    """Returns None if incremental exports are disabled"""
+    if not bpy.context.scene.fast64.settings.incremental_export:
+        return None
+    return geometry_cache
+
+
+def get_mesh_fingerprint(arrays: MeshArrays, *settings) -> str:
+    """Hash of every array the conversion reads, settings are values derived from the materials"""
+    mesh_hash = hashlib.blake2b(digest_size=16)
+    for array in (
+        arrays.positions,
+        arrays.loop_vertices,
+        arrays.loop_normals,
+        arrays.uvs,
+        arrays.colors,
+        arrays.alphas,
+        arrays.tri_loops,
+        arrays.tri_vertices,
+        arrays.tri_materials,
+    ):
+        if array is None:
+            mesh_hash.update(b"\0")
+        else:
+            mesh_hash.update(repr(array.shape).encode())
+            mesh_hash.update(np.ascontiguousarray(array).tobytes())
+    mesh_hash.update(repr((CACHE_VERSION, settings)).encode())
+    return mesh_hash.hexdigest()
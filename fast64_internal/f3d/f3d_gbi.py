@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from typing import Sequence, Union, Tuple
 from dataclasses import dataclass, fields, field
-import bpy, os, enum, copy
+import bpy, os, enum, copy, struct
+import numpy as np
 from ..utility import *
 
 from typing import TYPE_CHECKING
@@ -2087,6 +2088,8 @@ class GfxFormatter:
 
 
 class Vtx:
+    __slots__ = ("position", "uv", "colorOrNormal", "packedNormal")
+
     def __init__(self, position, uv, colorOrNormal, packedNormal=0):
         self.position = position
         self.uv = uv
@@ -2115,17 +2118,52 @@ class Vtx:
         return "{{ " + ", ".join([spc(self.position), flag, spc(self.uv), spc(self.colorOrNormal)]) + " }}"
 
 
+class VtxArray:
+    """
+    Packed storage for the vertices of a VtxList, a Vtx appended to it is stored as one record instead of objects.
+    Position and UV are kept as 32 bit values so out of range values still make it to the C output unchanged,
+    the binary export checks them instead.
+    """
+
+    record = struct.Struct(">3iH2i4B")
+    dtype = np.dtype([("position", ">i4", 3), ("flag", ">u2"), ("uv", ">i4", 2), ("color", "u1", 4)])
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def __len__(self):
+        return len(self.data) // self.record.size
+
+    def __iter__(self):
+        for position_x, position_y, position_z, flag, u, v, *color in self.record.iter_unpack(self.data):
+            yield Vtx([position_x, position_y, position_z], [u, v], color, flag)
+
+    def append(self, vert: Vtx):
+        self.data += self.record.pack(*vert.position, vert.packedNormal, *vert.uv, *vert.colorOrNormal)
+
+    def extend(self, verts: Sequence[Vtx]):
+        for vert in verts:
+            self.append(vert)
+
+    def array(self):
+        return np.frombuffer(bytes(self.data), dtype=self.dtype)
+
+
 class VtxList:
+    binaryDtype = np.dtype([("position", ">i2", 3), ("flag", ">u2"), ("uv", ">i2", 2), ("color", "u1", 4)])
+    cFormat = "\t{{ {%d, %d, %d}, %s, {%d, %d}, {%d, %d, %d, %d} }},\n"
+
     def __init__(self, name):
-        self.vertices = []
+        self.vertices = VtxArray()
         self.name = name
         self.startAddress = 0
+        self.export = True  # False once merged into an identical list
 
     def set_addr(self, startAddress):
         startAddress = get64bitAlignedAddr(startAddress)
         self.startAddress = startAddress
-        print("VtxList " + self.name + ": " + str(startAddress) + ", " + str(self.size()))
-        return startAddress, startAddress + self.size()
+        size = self.size()
+        return startAddress, startAddress + size
 
     def save_binary(self, romfile):
         romfile.seek(self.startAddress)
@@ -2135,18 +2173,33 @@ class VtxList:
         return len(self.vertices) * VTX_SIZE
 
     def to_binary(self):
-        data = bytearray(0)
-        for vert in self.vertices:
-            data.extend(vert.to_binary())
-        return data
-
-    def to_c(self):
-        data = CData()
-        data.header = f"extern Vtx {self.name}[{len(self.vertices)}];\n"
-        data.source = f"Vtx {self.name}[{len(self.vertices)}] = {{\n"
-        for vert in self.vertices:
-            data.source += f"\t{vert.to_c()},\n"
-        data.source += "};\n\n"
+        verts = self.vertices.array()
+        if np.any((verts["position"] < -(2**15)) | (verts["position"] >= 2**15)):
+            raise PluginError(f"Vertex list {self.name} has positions that don't fit in 16 bits.")
+        data = np.empty(len(verts), dtype=self.binaryDtype)
+        data["position"] = verts["position"]
+        data["flag"] = verts["flag"]
+        # UVs wrap around, keeping their sign
+        data["uv"] = np.fmod(verts["uv"], 2**15)
+        data["color"] = verts["color"]
+        return bytearray(data.tobytes())
+
+    def to_c_lines(self):
+        verts = self.vertices.array()
+        flags = ["0" if flag == 0 else f"{flag:#06x}" for flag in verts["flag"].tolist()]
+        yield f"Vtx {self.name}[{len(verts)}] = {{\n"
+        for position, flag, uv, color in zip(
+            verts["position"].tolist(), flags, verts["uv"].tolist(), verts["color"].tolist()
+        ):
+            yield self.cFormat % (*position, flag, *uv, *color)
+        yield "};\n\n"
+
+    def to_c(self, data: Optional[CData] = None):
+        """Writes the vertex list to data, or to a new CData, and returns it"""
+        if data is None:
+            data = CData()
+        data.write_header(f"extern Vtx {self.name}[{len(self.vertices)}];\n")
+        data.writelines(self.to_c_lines())
         return data
 
 
@@ -2161,16 +2214,15 @@ class GfxList:
     def set_addr(self, startAddress, f3d):
         startAddress = get64bitAlignedAddr(startAddress)
         self.startAddress = startAddress
-        print(f"GfxList {self.name}: {str(startAddress)}, {str(self.size(f3d))}")
-        return startAddress, startAddress + self.size(f3d)
+        size = self.size(f3d)
+        return startAddress, startAddress + size
 
     def save_binary(self, romfile, f3d, segments):
-        print(f"GfxList {self.name}: {str(self.startAddress)}, {str(self.size(f3d))}")
         romfile.seek(self.startAddress)
         romfile.write(self.to_binary(f3d, segments))
 
     def size(self, f3d):
-        return sum([command.size(f3d) for command in self.commands])
+        return sum(command.size(f3d) for command in self.commands)
 
     # Size, including display lists called with SPDisplayList
     def size_total(self, f3d):
@@ -2200,33 +2252,33 @@ class GfxList:
             data.extend(command.to_binary(f3d, segments))
         return data
 
-    def to_c_static(self, name: str):
-        data = f"Gfx {name}[] = {{\n"
+    def to_c_static_lines(self, name: str):
+        yield f"Gfx {name}[] = {{\n"
         for command in self.commands:
             if command.default_formatting:
-                data += f"\t{command.to_c(True)},\n"
+                yield f"\t{command.to_c(True)},\n"
             else:
-                data += command.to_c(True)
-        data += "};\n\n"
-        return data
+                yield command.to_c(True)
+        yield "};\n\n"
 
-    def to_c_dynamic(self):
-        data = f"Gfx* {self.name}(Gfx* glistp) {{\n"
+    def to_c_dynamic_lines(self):
+        yield f"Gfx* {self.name}(Gfx* glistp) {{\n"
         for command in self.commands:
-            data += f"\t{command.to_c(False)};\n"
-        data += "\treturn glistp;\n}\n\n"
-        return data
+            yield f"\t{command.to_c(False)};\n"
+        yield "\treturn glistp;\n}\n\n"
 
-    def to_c(self, f3d, name_override: Optional[str] = None):
-        data = CData()
+    def to_c(self, f3d, name_override: Optional[str] = None, data: Optional[CData] = None):
+        """Writes the display list to data, or to a new CData, and returns it"""
+        if data is None:
+            data = CData()
         name = name_override if name_override is not None else self.name
 
         if self.DLFormat == DLFormat.Static:
-            data.header = f"extern Gfx {name}[];\n"
-            data.source = self.to_c_static(name)
+            data.write_header(f"extern Gfx {name}[];\n")
+            data.writelines(self.to_c_static_lines(name))
         elif self.DLFormat == DLFormat.Dynamic:
-            data.header = f"Gfx* {name}(Gfx* glistp);\n"
-            data.source = self.to_c_dynamic()
+            data.write_header(f"Gfx* {name}(Gfx* glistp);\n")
+            data.writelines(self.to_c_dynamic_lines())
         else:
             raise PluginError("Invalid GfxList format: " + str(self.DLFormat))
 
@@ -2619,75 +2671,83 @@ class FModel:
         for subModel in self.subModels:
             subModel.save_binary(romfile, segments)
 
-    def to_c_lights(self):
-        data = CData()
+    def to_c_lights(self, data: Optional[CData] = None):
+        if data is None:
+            data = CData()
         for name, light in self.lights.items():
             data.append(light.to_c())
         return data
 
-    def to_c_textures(self, texCSeparate, savePNG, texDir, texArrayBitSize):
+    def to_c_textures(self, texCSeparate, savePNG, texDir, texArrayBitSize, data: Optional[CData] = None):
         # since decomp is linux, don't use os.path.join
         # on windows this results in '\', which is incorrect (should be '/')
         if len(texDir) > 0 and texDir[-1] != "/":
             texDir += "/"
-        data = CData()
+        if data is None:
+            data = CData()
         for _, fImage in self.textures.items():
             if savePNG:
-                data.append(fImage.to_c_tex_separate(texDir, texArrayBitSize))
+                fImage.to_c_tex_separate(texDir, texArrayBitSize, data)
             else:
-                data.append(fImage.to_c(texArrayBitSize))
+                fImage.to_c(texArrayBitSize, data)
         return data
 
-    def to_c_materials(self, gfxFormatter):
-        data = CData()
+    def to_c_materials(self, gfxFormatter, data: Optional[CData] = None):
+        if data is None:
+            data = CData()
         for materialKey, (fMaterial, texDimensions) in self.materials.items():
-            data.append(fMaterial.to_c(self.f3d))
+            fMaterial.to_c(self.f3d, data)
         return data
 
-    def to_c_material_revert(self, gfxFormatter):
-        data = CData()
+    def to_c_material_revert(self, gfxFormatter, data: Optional[CData] = None):
+        if data is None:
+            data = CData()
         if self.materialRevert is not None:
-            data.append(self.materialRevert.to_c(self.f3d))
+            self.materialRevert.to_c(self.f3d, data)
         return data
 
-    def to_c(self, textureExportSettings: TextureExportSettings, gfxFormatter: GfxFormatter):
+    def to_c(
+        self,
+        textureExportSettings: TextureExportSettings,
+        gfxFormatter: GfxFormatter,
+        exportData: Optional[ExportCData] = None,
+    ):
+        """
+        Writes the model's C to exportData, or to new CData, and returns it.
+        Pass CData that write to files to stream the model to them instead of keeping it in memory.
+        """
         texCSeparate = textureExportSettings.texCSeparate
         savePNG = textureExportSettings.savePNG
         texDir = textureExportSettings.includeDir
 
-        staticData = CData()
-        dynamicData = CData()
-        texC = CData()
+        if exportData is None:
+            exportData = ExportCData(CData(), CData(), CData())
+        staticData = exportData.staticData
+        dynamicData = exportData.dynamicData
+        texC = exportData.textureData
 
         # Source
-        staticData.append(self.to_c_lights())
+        self.to_c_lights(staticData)
 
-        texData = self.to_c_textures(texCSeparate, savePNG, texDir, gfxFormatter.texArrayBitSize)
-        staticData.header += texData.header
-        if texCSeparate:
-            texC.source += texData.source
-        else:
-            staticData.source += texData.source
+        # the texture declarations always go with the static data, even when their source is separate
+        texData = CData(texC.source_writer, staticData.header_writer) if texCSeparate else staticData
+        self.to_c_textures(texCSeparate, savePNG, texDir, gfxFormatter.texArrayBitSize, texData)
 
-        dynamicData.append(self.to_c_materials(gfxFormatter))
+        self.to_c_materials(gfxFormatter, dynamicData)
 
         for name, lod in self.LODGroups.items():
-            lodStatic, lodDynamic = lod.to_c(self.f3d, gfxFormatter)
-            staticData.append(lodStatic)
-            dynamicData.append(lodDynamic)
+            lod.to_c(self.f3d, gfxFormatter, staticData, dynamicData)
 
         for name, mesh in self.meshes.items():
-            meshStatic, meshDynamic = mesh.to_c(self.f3d, gfxFormatter)
-            staticData.append(meshStatic)
-            dynamicData.append(meshDynamic)
+            mesh.to_c(self.f3d, gfxFormatter, staticData, dynamicData)
 
-        dynamicData.append(self.to_c_material_revert(gfxFormatter))
+        self.to_c_material_revert(gfxFormatter, dynamicData)
 
         if savePNG:
             self.texturesSavedLastExport = self.save_textures(textureExportSettings.exportPath)
 
         self.freePalettes()
-        return ExportCData(staticData, dynamicData, texC)
+        return exportData
 
     def to_c_scroll(self, funcName: str, gfxFormatter: GfxFormatter) -> CScrollData:
         data = CScrollData()
@@ -2778,10 +2838,10 @@ class FTexRect(FModel):
             texDir += "/"
         for _, fImage in self.textures.items():
             if savePNG:
-                staticData.append(fImage.to_c_tex_separate(texDir, gfxFormatter.texArrayBitSize))
+                fImage.to_c_tex_separate(texDir, gfxFormatter.texArrayBitSize, staticData)
             else:
-                staticData.append(fImage.to_c(gfxFormatter.texArrayBitSize))
-        dynamicData.append(self.draw.to_c(self.f3d))
+                fImage.to_c(gfxFormatter.texArrayBitSize, staticData)
+        self.draw.to_c(self.f3d, data=dynamicData)
         return ExportCData(staticData, dynamicData, CData())
 
 
@@ -2832,16 +2892,18 @@ class FLODGroup:
                 displayList.save_binary(romfile, f3d, segments)
         self.vertexList.save_binary(romfile)
 
-    def to_c(self, f3d, gfxFormatter):
+    def to_c(self, f3d, gfxFormatter, staticData: Optional[CData] = None, dynamicData: Optional[CData] = None):
         self.create_data()
 
-        staticData = CData()
-        dynamicData = CData()
-        staticData.append(self.vertexList.to_c())
+        if staticData is None:
+            staticData = CData()
+        if dynamicData is None:
+            dynamicData = CData()
+        self.vertexList.to_c(staticData)
         for displayList in self.subdraws:
             if displayList is not None:
-                dynamicData.append(displayList.to_c(f3d))
-        dynamicData.append(self.draw.to_c(f3d))
+                displayList.to_c(f3d, data=dynamicData)
+        self.draw.to_c(f3d, data=dynamicData)
         return staticData, dynamicData
 
     def create_data(self):
@@ -2948,20 +3010,29 @@ class FMesh:
         for cmd_list in self.draw_overrides:
             cmd_list.save_binary(romfile, f3d, segments)
 
-    def to_c(self, f3d: F3D, gfxFormatter: GfxFormatter):
-        staticData = CData()
+    def to_c(
+        self,
+        f3d: F3D,
+        gfxFormatter: GfxFormatter,
+        staticData: Optional[CData] = None,
+        dynamicData: Optional[CData] = None,
+    ):
+        if staticData is None:
+            staticData = CData()
+        if dynamicData is None:
+            dynamicData = CData()
 
         if self.cullVertexList is not None:
-            staticData.append(self.cullVertexList.to_c())
+            self.cullVertexList.to_c(staticData)
 
         for triGroup in self.triangleGroups:
-            staticData.append(triGroup.to_c(f3d, gfxFormatter))
+            triGroup.to_c(f3d, gfxFormatter, staticData)
 
         draw_layer = "Opaque" if "Opaque" in self.name else "Transparent" if "Transparent" in self.name else "Overlay"
-        dynamicData = gfxFormatter.drawToC(f3d, self.draw, layer=draw_layer)
+        dynamicData.append(gfxFormatter.drawToC(f3d, self.draw, layer=draw_layer))
 
         for cmd_list in self.draw_overrides:
-            dynamicData.append(cmd_list.to_c(f3d))
+            cmd_list.to_c(f3d, data=dynamicData)
 
         return staticData, dynamicData
 
@@ -2980,29 +3051,42 @@ class FTriGroup:
         return ret
 
     def get_ptr_addresses(self, f3d):
-        return self.triList.get_ptr_addresses(f3d)
+        addresses = self.triList.get_ptr_addresses(f3d) if self.triList.tag.Export else []
+        for celTriList in self.celTriLists:
+            if celTriList.tag.Export:
+                addresses.extend(celTriList.get_ptr_addresses(f3d))
+        return addresses
 
     def set_addr(self, startAddress, f3d):
         addrRange = (startAddress, startAddress)
+        for celTriList in self.celTriLists:
+            if celTriList.tag.Export:
+                addrRange = celTriList.set_addr(addrRange[1], f3d)
         if self.triList.tag.Export:
-            addrRange = self.triList.set_addr(startAddress, f3d)
-        addrRange = self.vertexList.set_addr(addrRange[1])
+            addrRange = self.triList.set_addr(addrRange[1], f3d)
+        if self.vertexList.export:
+            addrRange = self.vertexList.set_addr(addrRange[1])
         return startAddress, addrRange[1]
 
     def save_binary(self, romfile, f3d, segments):
         for celTriList in self.celTriLists:
-            celTriList.save_binary(romfile, f3d, segments)
+            if celTriList.tag.Export:
+                celTriList.save_binary(romfile, f3d, segments)
         if self.triList.tag.Export:
             self.triList.save_binary(romfile, f3d, segments)
-        self.vertexList.save_binary(romfile)
-
-    def to_c(self, f3d, gfxFormatter):
-        data = CData()
-        data.append(self.vertexList.to_c())
+        if self.vertexList.export:
+            self.vertexList.save_binary(romfile)
+
+    def to_c(self, f3d, gfxFormatter, data: Optional[CData] = None):
+        if data is None:
+            data = CData()
+        if self.vertexList.export:
+            self.vertexList.to_c(data)
         for celTriList in self.celTriLists:
-            data.append(celTriList.to_c(f3d))
+            if celTriList.tag.Export:
+                celTriList.to_c(f3d, data=data)
         if self.triList.tag.Export:
-            data.append(self.triList.to_c(f3d))
+            self.triList.to_c(f3d, data=data)
         return data
 
 
@@ -3098,7 +3182,7 @@ class FMaterial:
         self.scrollData.tile_scroll_tex1.interval = tex1.tile_scroll.interval
 
     def get_ptr_addresses(self, f3d):
-        addresses = self.material.get_ptr_addresses(f3d)
+        addresses = self.material.get_ptr_addresses(f3d) if self.material.tag.Export else []
         if self.revert is not None and self.revert.tag.Export:
             addresses.extend(self.revert.get_ptr_addresses(f3d))
         return addresses
@@ -3117,12 +3201,13 @@ class FMaterial:
         if self.revert is not None and self.revert.tag.Export:
             self.revert.save_binary(romfile, f3d, segments)
 
-    def to_c(self, f3d):
-        data = CData()
+    def to_c(self, f3d, data: Optional[CData] = None):
+        if data is None:
+            data = CData()
         if self.material.tag.Export:
-            data.append(self.material.to_c(f3d))
+            self.material.to_c(f3d, data=data)
         if self.revert is not None and self.revert.tag.Export:
-            data.append(self.revert.to_c(f3d))
+            self.revert.to_c(f3d, data=data)
         return data
 
 
@@ -3203,8 +3288,8 @@ class Lights:
     def set_addr(self, startAddress):
         startAddress = get64bitAlignedAddr(startAddress)
         self.startAddress = startAddress
-        print(f"Lights {self.name}: {str(startAddress)}, {str(self.size())}")
-        return (startAddress, startAddress + self.size())
+        size = self.size()
+        return (startAddress, startAddress + size)
 
     def save_binary(self, romfile):
         romfile.seek(self.startAddress)
@@ -3298,10 +3383,24 @@ class FImage:
     width: int
     height: int
     filename: str
-    data: bytearray = field(init=False, compare=False, default_factory=bytearray)
+    _data: bytearray = field(init=False, compare=False, repr=False, default_factory=bytearray)
     startAddress: int = field(init=False, compare=False, default=0)
     isLargeTexture: bool = field(init=False, compare=False, default=False)
     converted: bool = field(init=False, compare=False, default=False)
+    # Background conversion of the data (see f3d_texture_jobs.py), waited for the first time data is read
+    conversion: Optional[Any] = field(init=False, compare=False, repr=False, default=None)
+
+    @property
+    def data(self) -> bytearray:
+        if self.conversion is not None:
+            self._data = bytearray(self.conversion.result())
+            self.conversion = None
+        return self._data
+
+    @data.setter
+    def data(self, data: bytearray):
+        self.conversion = None
+        self._data = data
 
     @property
     def aligner_name(self):
@@ -3313,61 +3412,66 @@ class FImage:
     def to_binary(self):
         return self.data
 
-    def to_c(self, texArrayBitSize):
-        return self.to_c_helper(self.to_c_data(texArrayBitSize), texArrayBitSize)
+    def to_c(self, texArrayBitSize, data: Optional[CData] = None):
+        """Writes the texture to data, or to a new CData, and returns it"""
+        return self.to_c_helper(self.to_c_data_lines(texArrayBitSize), texArrayBitSize, data)
 
-    def to_c_tex_separate(self, texPath, texArrayBitSize):
-        return self.to_c_helper('#include "' + texPath + self.filename + '"', texArrayBitSize)
+    def to_c_tex_separate(self, texPath, texArrayBitSize, data: Optional[CData] = None):
+        return self.to_c_helper(['#include "' + texPath + self.filename + '"'], texArrayBitSize, data)
 
-    def to_c_helper(self, texData, bitsPerValue):
-        code = CData()
-        code.header = f"extern u{str(bitsPerValue)} {self.name}[];\n"
+    def to_c_helper(self, texData: Iterable[str], bitsPerValue, data: Optional[CData] = None):
+        if data is None:
+            data = CData()
+        data.write_header(f"extern u{str(bitsPerValue)} {self.name}[];\n")
 
         # This is to force 8 byte alignment
         if bitsPerValue != 64:
-            code.source = f"Gfx {self.aligner_name}[] = {{gsSPEndDisplayList()}};\n"
-        code.source += f"u{str(bitsPerValue)} {self.name}[] = {{\n\t"
-        code.source += texData
-        code.source += "\n};\n\n"
-        return code
+            data.write(f"Gfx {self.aligner_name}[] = {{gsSPEndDisplayList()}};\n")
+        data.write(f"u{str(bitsPerValue)} {self.name}[] = {{\n\t")
+        data.writelines(texData)
+        data.write("\n};\n\n")
+        return data
 
     def to_c_data(self, bitsPerValue):
+        return "".join(self.to_c_data_lines(bitsPerValue))
+
+    def to_c_data_lines(self, bitsPerValue):
+        """Yields the texture's values, one line of 8 at a time"""
         if not self.converted:
             raise PluginError(
                 "Error: Trying to write texture data to C, but haven't actually converted the image file to bytes yet."
             )
 
+        texData = self.data
         bytesPerValue = int(bitsPerValue / 8)
-        numValues = int(len(self.data) / bytesPerValue)
-        remainderCount = len(self.data) - numValues * bytesPerValue
+        numValues = int(len(texData) / bytesPerValue)
+        remainderCount = len(texData) - numValues * bytesPerValue
         digits = 2 + 2 * bytesPerValue
 
-        code = "".join(
-            [
-                format(
-                    int.from_bytes(self.data[i * bytesPerValue : (i + 1) * bytesPerValue], "big"),
-                    "#0" + str(digits) + "x",
-                )
-                + ", "
-                + ("\n\t" if i % 8 == 7 else "")
-                for i in range(numValues)
-            ]
-        )
+        for lineStart in range(0, numValues, 8):
+            lineEnd = min(lineStart + 8, numValues)
+            yield "".join(
+                [
+                    format(
+                        int.from_bytes(texData[i * bytesPerValue : (i + 1) * bytesPerValue], "big"),
+                        "#0" + str(digits) + "x",
+                    )
+                    + ", "
+                    for i in range(lineStart, lineEnd)
+                ]
+            ) + ("\n\t" if lineEnd - lineStart == 8 else "")
 
         if remainderCount > 0:
             start = numValues * bytesPerValue
             end = (numValues + 1) * bytesPerValue
-            code += format(
-                int.from_bytes(self.data[start:end], "big") << (8 * (bytesPerValue - remainderCount)),
+            yield format(
+                int.from_bytes(texData[start:end], "big") << (8 * (bytesPerValue - remainderCount)),
                 "#0" + str(digits) + "x",
             )
 
-        return code
-
     def set_addr(self, startAddress):
         startAddress = get64bitAlignedAddr(startAddress)
         self.startAddress = startAddress
-        print("Image " + self.name + ": " + str(startAddress) + ", " + str(self.size()))
         return startAddress, startAddress + self.size()
 
     def save_binary(self, romfile):
@@ -3400,6 +3504,9 @@ def gsSPNoOp(f3d):
 # base class for gbi macros
 @dataclass(unsafe_hash=True)
 class GbiMacro:
+    # The commands used the most declare their fields as slots, so that they don't need a __dict__ each
+    __slots__ = ()
+
     _segptrs = False
     _ptr_amp = False
     _hex = 0  # If nonzero, write int values as hex with specified digits
@@ -3458,6 +3565,8 @@ class GbiMacro:
 
 @dataclass(unsafe_hash=True)
 class SPMatrix(GbiMacro):
+    __slots__ = ("matrix", "param")
+
     matrix: int
     param: int
 
@@ -3475,6 +3584,8 @@ class SPMatrix(GbiMacro):
 
 @dataclass(unsafe_hash=True)
 class SPVertex(GbiMacro):
+    __slots__ = ("vertList", "offset", "count", "index")
+
     # v = seg pointer, n = count, v0  = ?
     vertList: VtxList
     offset: int
@@ -3530,6 +3641,8 @@ class SPViewport(GbiMacro):
 
 @dataclass(unsafe_hash=True)
 class SPDisplayList(GbiMacro):
+    __slots__ = ("displayList",)
+
     displayList: GfxList
 
     def to_binary(self, f3d, segments):
@@ -3551,6 +3664,8 @@ class SPDisplayList(GbiMacro):
 
 @dataclass(unsafe_hash=True)
 class SPBranchList(GbiMacro):
+    __slots__ = ("displayList",)
+
     displayList: GfxList
     _ptr_amp = True  # add an ampersand to names
 
@@ -3561,6 +3676,8 @@ class SPBranchList(GbiMacro):
 
 @dataclass(unsafe_hash=True)
 class SPEndDisplayList(GbiMacro):
+    __slots__ = ()
+
     def to_binary(self, f3d, segments):
         words = _SHIFTL(f3d.G_ENDDL, 24, 8), 0
         return words[0].to_bytes(4, "big") + words[1].to_bytes(4, "big")
@@ -3672,6 +3789,8 @@ def _gsSP1Quadrangle_w2f(v0, v1, v2, v3, flag):
 
 @dataclass(unsafe_hash=True)
 class SP1Triangle(GbiMacro):
+    __slots__ = ("v0", "v1", "v2", "flag")
+
     v0: int
     v1: int
     v2: int
@@ -3724,6 +3843,8 @@ class SPLineW3D(GbiMacro):
 
 @dataclass(unsafe_hash=True)
 class SP2Triangles(GbiMacro):
+    __slots__ = ("v00", "v01", "v02", "flag0", "v10", "v11", "v12", "flag1")
+
     v00: int
     v01: int
     v02: int
@@ -5627,18 +5748,24 @@ class DPFullSync(GbiMacro):
 
 @dataclass(unsafe_hash=True)
 class DPTileSync(GbiMacro):
+    __slots__ = ()
+
     def to_binary(self, f3d, segments):
         return gsDPNoParam(f3d.G_RDPTILESYNC)
 
 
 @dataclass(unsafe_hash=True)
 class DPPipeSync(GbiMacro):
+    __slots__ = ()
+
     def to_binary(self, f3d, segments):
         return gsDPNoParam(f3d.G_RDPPIPESYNC)
 
 
 @dataclass(unsafe_hash=True)
 class DPLoadSync(GbiMacro):
+    __slots__ = ()
+
     def to_binary(self, f3d, segments):
         return gsDPNoParam(f3d.G_RDPLOADSYNC)
 
@@ -0,0 +1,255 @@
+"""
+Static estimate of what display lists cost at runtime.
+Commands are walked in the order the RSP runs them, following display list calls, while the vertex buffer,
+the texture loads into TMEM and the state set by each command are simulated. The work done is counted per list.
+"""
+
+import json
+from dataclasses import asdict, dataclass, fields
+from typing import Optional
+
+from ..utility import writeFile
+from .f3d_gbi import (
+    F3D,
+    FModel,
+    GfxList,
+    GbiMacro,
+    VTX_SIZE,
+    DPLoadBlock,
+    DPLoadSync,
+    DPLoadTile,
+    DPLoadTLUTCmd,
+    DPPipeSync,
+    DPSetBlendColor,
+    DPSetCombineMode,
+    DPSetEnvColor,
+    DPSetFogColor,
+    DPSetPrimColor,
+    DPSetPrimDepth,
+    DPSetRenderMode,
+    DPSetTextureImage,
+    DPSetTile,
+    DPSetTileSize,
+    DPTileSync,
+    SP1Triangle,
+    SP2Triangles,
+    SPBranchList,
+    SPClearGeometryMode,
+    SPDisplayList,
+    SPEndDisplayList,
+    SPGeometryMode,
+    SPLine3D,
+    SPLineW3D,
+    SPLoadGeometryMode,
+    SPSetGeometryMode,
+    SPSetOtherModeSub,
+    SPTexture,
+    SPVertex,
+)
+
+TMEM_SIZE = 4096
+TEXEL_BITS = {"G_IM_SIZ_4b": 4, "G_IM_SIZ_8b": 8, "G_IM_SIZ_16b": 16, "G_IM_SIZ_32b": 32}
+
+# commands that only set one piece of state, a command equal to the last one with the same key changes nothing
+STATE_CMDS = (
+    DPSetBlendColor,
+    DPSetCombineMode,
+    DPSetEnvColor,
+    DPSetFogColor,
+    DPSetPrimColor,
+    DPSetPrimDepth,
+    DPSetRenderMode,
+    DPSetTextureImage,
+    SPTexture,
+)
+TILE_STATE_CMDS = (DPSetTile, DPSetTileSize)
+
+
+@dataclass
+class GfxStats:
+    commands: int = 0
+    display_list_calls: int = 0
+    vertex_loads: int = 0
+    vertices_loaded: int = 0
+    vertex_dma_bytes: int = 0
+    vertices_unused: int = 0  # loaded, then replaced or left in the buffer without any triangle using them
+    triangles: int = 0
+    lines: int = 0
+    texture_loads: int = 0
+    tlut_loads: int = 0
+    texture_load_bytes: int = 0
+    tmem_overflows: int = 0
+    pipe_syncs: int = 0
+    load_syncs: int = 0
+    tile_syncs: int = 0
+    redundant_state_cmds: int = 0
+
+    @property
+    def vertex_reuse(self):
+        """Average amount of triangle corners using each loaded vertex"""
+        return self.triangles * 3 / self.vertices_loaded if self.vertices_loaded else 0
+
+    def add(self, other: "GfxStats"):
+        for field in fields(self):
+            setattr(self, field.name, getattr(self, field.name) + getattr(other, field.name))
+
+
+class GfxAnalyzer:
+    """Simulates one run of display lists, starting from an unknown state"""
+
+    def __init__(self, f3d: F3D):
+        self.f3d = f3d
+        self.stats = GfxStats()
+        self.vertex_used: list[Optional[bool]] = [None] * (f3d.vert_buffer_size or 32)  # None for empty slots
+        self.state: dict = {}
+        self.geo_set: set[str] = set()
+        self.geo_clear: set[str] = set()
+        self.texel_bits = 16
+        self.tile_tmem: dict[int, int] = {}
+
+    def analyze(self, gfx_list: GfxList, depth=0):
+        if depth > 16:  # the RSP's display list stack is shorter than this
+            return
+        for cmd in gfx_list.commands:
+            self.stats.commands += 1
+            if isinstance(cmd, SPDisplayList):
+                self.stats.display_list_calls += 1
+                self.analyze(cmd.displayList, depth + 1)
+            elif isinstance(cmd, SPBranchList):
+                self.analyze(cmd.displayList, depth + 1)
+                return
+            elif isinstance(cmd, SPEndDisplayList):
+                return
+            else:
+                self.analyze_cmd(cmd)
+
+    def finish(self) -> GfxStats:
+        self.stats.vertices_unused += sum(used is False for used in self.vertex_used)
+        return self.stats
+
+    def analyze_cmd(self, cmd: GbiMacro):
+        if isinstance(cmd, SPVertex):
+            self.load_vertices(cmd)
+        elif isinstance(cmd, SP1Triangle):
+            self.stats.triangles += 1
+            self.use_vertices(cmd.v0, cmd.v1, cmd.v2)
+        elif isinstance(cmd, SP2Triangles):
+            self.stats.triangles += 2
+            self.use_vertices(cmd.v00, cmd.v01, cmd.v02, cmd.v10, cmd.v11, cmd.v12)
+        elif isinstance(cmd, (SPLine3D, SPLineW3D)):
+            self.stats.lines += 1
+            self.use_vertices(cmd.v0, cmd.v1)
+        elif isinstance(cmd, DPPipeSync):
+            self.stats.pipe_syncs += 1
+        elif isinstance(cmd, DPLoadSync):
+            self.stats.load_syncs += 1
+        elif isinstance(cmd, DPTileSync):
+            self.stats.tile_syncs += 1
+        elif isinstance(cmd, (DPLoadBlock, DPLoadTile, DPLoadTLUTCmd)):
+            self.load_texture(cmd)
+        elif isinstance(cmd, (SPSetGeometryMode, SPClearGeometryMode, SPGeometryMode, SPLoadGeometryMode)):
+            self.set_geometry_mode(cmd)
+        else:
+            if isinstance(cmd, DPSetTextureImage):
+                self.texel_bits = TEXEL_BITS.get(cmd.siz, 16)
+            elif isinstance(cmd, DPSetTile):
+                self.tile_tmem[cmd.tile] = cmd.tmem
+
+            if isinstance(cmd, STATE_CMDS + (SPSetOtherModeSub,)):
+                key = type(cmd)
+            elif isinstance(cmd, TILE_STATE_CMDS):
+                key = (type(cmd), cmd.tile)
+            else:
+                return
+            if self.state.get(key) == cmd:
+                self.stats.redundant_state_cmds += 1
+            self.state[key] = cmd
+
+    def load_vertices(self, cmd: SPVertex):
+        self.stats.vertex_loads += 1
+        self.stats.vertices_loaded += cmd.count
+        self.stats.vertex_dma_bytes += cmd.count * VTX_SIZE
+        for slot in range(cmd.index, min(cmd.index + cmd.count, len(self.vertex_used))):
+            if self.vertex_used[slot] is False:
+                self.stats.vertices_unused += 1
+            self.vertex_used[slot] = False
+
+    def use_vertices(self, *indices: int):
+        for index in indices:
+            if 0 <= index < len(self.vertex_used) and self.vertex_used[index] is not None:
+                self.vertex_used[index] = True
+
+    def load_texture(self, cmd: DPLoadBlock | DPLoadTile | DPLoadTLUTCmd):
+        if isinstance(cmd, DPLoadTLUTCmd):
+            self.stats.tlut_loads += 1
+            size = (cmd.count + 1) * 2
+            tmem_size = (cmd.count + 1) * 8  # each palette entry is copied four times in TMEM
+        elif isinstance(cmd, DPLoadBlock):
+            self.stats.texture_loads += 1
+            size = tmem_size = (cmd.lrs - cmd.uls + 1) * self.texel_bits // 8
+        else:
+            self.stats.texture_loads += 1
+            width, height = ((cmd.lrs - cmd.uls) >> 2) + 1, ((cmd.lrt - cmd.ult) >> 2) + 1
+            line = (width * self.texel_bits + 7) // 8
+            size = line * height
+            tmem_size = (line + 7) // 8 * 8 * height  # rows are padded to 64 bits
+        self.stats.texture_load_bytes += size
+        if self.tile_tmem.get(cmd.tile, 0) * 8 + tmem_size > TMEM_SIZE:
+            self.stats.tmem_overflows += 1
+        self.state.pop((DPSetTileSize, cmd.tile), None)  # loads set the size of the load tile
+
+    def set_geometry_mode(self, cmd: GbiMacro):
+        if isinstance(cmd, SPLoadGeometryMode):
+            redundant = self.state.get(SPLoadGeometryMode) == cmd
+            self.geo_set, self.geo_clear = set(cmd.flagList), set()
+            self.state[SPLoadGeometryMode] = cmd
+        else:
+            if isinstance(cmd, SPGeometryMode):
+                set_flags, clear_flags = set(cmd.setFlagList), set(cmd.clearFlagList)
+            elif isinstance(cmd, SPSetGeometryMode):
+                set_flags, clear_flags = set(cmd.flagList), set()
+            else:
+                set_flags, clear_flags = set(), set(cmd.flagList)
+            redundant = set_flags <= self.geo_set and clear_flags <= self.geo_clear
+            self.geo_set = (self.geo_set - clear_flags) | set_flags
+            self.geo_clear = (self.geo_clear - set_flags) | clear_flags
+            self.state.pop(SPLoadGeometryMode, None)
+        if redundant:
+            self.stats.redundant_state_cmds += 1
+
+
+def analyze_gfx_list(gfx_list: GfxList, f3d: F3D) -> GfxStats:
+    analyzer = GfxAnalyzer(f3d)
+    analyzer.analyze(gfx_list)
+    return analyzer.finish()
+
+
+def analyze_fmodel(fModel: FModel) -> dict[str, GfxStats]:
+    """Stats of each mesh draw list of the model and its sub models, each starting from an unknown state"""
+    results = {name: analyze_gfx_list(fMesh.draw, fModel.f3d) for name, fMesh in fModel.meshes.items()}
+    for subModel in fModel.subModels:
+        results.update(analyze_fmodel(subModel))
+    return results
+
+
+def get_gfx_report_text(results: dict[str, GfxStats]) -> str:
+    total = GfxStats()
+    for stats in results.values():
+        total.add(stats)
+    lines = []
+    for name, stats in list(results.items()) + [("Total", total)]:
+        lines.append(
+            f"{name}: {stats.commands} commands, {stats.triangles} triangles, "
+            f"{stats.vertices_loaded} vertices in {stats.vertex_loads} loads ({stats.vertex_dma_bytes} bytes, "
+            f"{stats.vertex_reuse:.2f} uses per vertex, {stats.vertices_unused} unused), "
+            f"{stats.texture_loads} texture and {stats.tlut_loads} palette loads ({stats.texture_load_bytes} bytes, "
+            f"{stats.tmem_overflows} TMEM overflows), {stats.pipe_syncs} pipe syncs, "
+            f"{stats.redundant_state_cmds} redundant state commands"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def write_gfx_report(results: dict[str, GfxStats], json_path: str, text_path: str):
+    data = {name: asdict(stats) | {"vertex_reuse": stats.vertex_reuse} for name, stats in results.items()}
+    writeFile(json_path, json.dumps(data, indent=4) + "\n")
+    writeFile(text_path, get_gfx_report_text(results))
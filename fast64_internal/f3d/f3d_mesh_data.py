@@ -0,0 +1,59 @@
+"""
+Reads the mesh data needed for F3D conversion into NumPy arrays with foreach_get, instead of one loop at a time.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import bpy
+import numpy as np
+
+from ..utility import PluginError
+
+
+@dataclass
+class MeshArrays:
+    positions: np.ndarray  # (vertex count, 3)
+    loop_vertices: np.ndarray  # (loop count,) vertex index of each loop
+    loop_normals: np.ndarray  # (loop count, 3)
+    uvs: np.ndarray  # (loop count, 2), raw blender uvs
+    colors: Optional[np.ndarray]  # (loop count, 4) "Col" layer, None if the mesh has none
+    alphas: Optional[np.ndarray]  # (loop count, 4) "Alpha" layer, None if the mesh has none
+    tri_loops: np.ndarray  # (triangle count, 3)
+    tri_vertices: np.ndarray  # (triangle count, 3)
+    tri_materials: np.ndarray  # (triangle count,)
+
+
+def get_attribute_array(collection, attribute: str, width: int, dtype=np.float32) -> np.ndarray:
+    array = np.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attribute, array)
+    return array.reshape(-1, width) if width > 1 else array
+
+
+def get_color_array(mesh: bpy.types.Mesh, color_layer) -> Optional[np.ndarray]:
+    """color_layer is the result of getColorLayer, colors are read per loop, see convertLoopColor"""
+    if color_layer is None:
+        return None
+    if len(color_layer) != len(mesh.loops):
+        raise PluginError(
+            f"Color attributes used for export must be stored per face corner, {mesh.name} has one stored per"
+            f" {'vertex' if len(color_layer) == len(mesh.vertices) else 'element'}."
+        )
+    return get_attribute_array(color_layer, "color", 4)
+
+
+def get_mesh_arrays(
+    mesh: bpy.types.Mesh, uv_data: bpy.types.bpy_prop_collection, color_layer, alpha_layer
+) -> MeshArrays:
+    """mesh.calc_loop_triangles() must have been called"""
+    return MeshArrays(
+        positions=get_attribute_array(mesh.vertices, "co", 3),
+        loop_vertices=get_attribute_array(mesh.loops, "vertex_index", 1, np.int32),
+        loop_normals=get_attribute_array(mesh.loops, "normal", 3),
+        uvs=get_attribute_array(uv_data, "uv", 2),
+        colors=get_color_array(mesh, color_layer),
+        alphas=get_color_array(mesh, alpha_layer),
+        tri_loops=get_attribute_array(mesh.loop_triangles, "loops", 3, np.int32),
+        tri_vertices=get_attribute_array(mesh.loop_triangles, "vertices", 3, np.int32),
+        tri_materials=get_attribute_array(mesh.loop_triangles, "material_index", 1, np.int32),
+    )
@@ -1976,8 +1976,54 @@ def parseF3D(
         f3dContext.clearMaterial()
 
 
+class CSymbolIndex:
+    """
+    Positions of the C declarations in some import data, by declared name.
+    Built in one pass so that finding a symbol only runs its pattern where that name is declared,
+    instead of searching the whole data for every display list, vertex list, texture and light.
+    """
+
+    declarationPattern = re.compile(r"\b([A-Za-z_]\w*)\s+([A-Za-z_]\w*)\s*[\[=]")
+
+    def __init__(self, data: str):
+        self.data = data
+        self.declarations: dict[str, list[tuple[str, int]]] = {}  # name : [(type, start of the declaration)]
+        for match in self.declarationPattern.finditer(data):
+            self.declarations.setdefault(match.group(2), []).append((match.group(1), match.start(1)))
+
+    def search(self, pattern: re.Pattern, name: str) -> Optional[re.Match]:
+        """
+        First match of pattern at a declaration of name, pattern starts at the type of the declaration.
+        Falls back to pattern.search(data), so patterns look behind the type and the name for word characters
+        to not match the tail of a longer symbol there either.
+        """
+        for _, start in self.declarations.get(name, []):
+            matchResult = pattern.match(self.data, start)
+            if matchResult is not None:
+                return matchResult
+        # declarations the index can't see, like a type directly followed by a comment
+        return pattern.search(self.data)
+
+
+symbolIndexCache: list[CSymbolIndex] = []
+SYMBOL_INDEX_CACHE_SIZE = 4
+
+
+def getSymbolIndex(data: str) -> CSymbolIndex:
+    """Index of the data, reused as long as the same data string is being parsed"""
+    for symbolIndex in symbolIndexCache:
+        if symbolIndex.data is data:
+            return symbolIndex
+    symbolIndex = CSymbolIndex(data)
+    symbolIndexCache.insert(0, symbolIndex)
+    del symbolIndexCache[SYMBOL_INDEX_CACHE_SIZE:]
+    return symbolIndex
+
+
 def parseDLData(dlData: str, dlName: str):
-    matchResult = re.search(r"Gfx\s*" + re.escape(dlName) + r"\s*\[\s*\w*\s*\]\s*=\s*\{([^\}]*)\}", dlData)
+    matchResult = getSymbolIndex(dlData).search(
+        re.compile(r"(?<!\w)Gfx\s*(?<!\w)" + re.escape(dlName) + r"\s*\[\s*\w*\s*\]\s*=\s*\{([^\}]*)\}"), dlName
+    )
     if matchResult is None:
         raise PluginError("Cannot find display list named " + dlName)
 
@@ -1998,8 +2044,11 @@ def parseVertexData(dlData: str, vertexDataName: str, f3dContext: F3DContext):
     if vertexDataName in f3dContext.vertexData:
         return f3dContext.vertexData[vertexDataName]
 
-    matchResult = re.search(
-        r"Vtx\s*" + re.escape(vertexDataName) + r"\s*\[\s*[0-9x]*\s*\]\s*=\s*\{([^;]*);", dlData, re.DOTALL
+    matchResult = getSymbolIndex(dlData).search(
+        re.compile(
+            r"(?<!\w)Vtx\s*(?<!\w)" + re.escape(vertexDataName) + r"\s*\[\s*[0-9x]*\s*\]\s*=\s*\{([^;]*);", re.DOTALL
+        ),
+        vertexDataName,
     )
     if matchResult is None:
         raise PluginError("Cannot find vertex list named " + vertexDataName)
@@ -2042,10 +2091,14 @@ def parseLightsData(lightsData, lightsName, f3dContext):
     # if lightsName in f3dContext.lightData:
     # 	return f3dContext.lightData[lightsName]
 
-    matchResult = re.search(
-        r"Lights([0-9n])\s*" + re.escape(lightsName) + r"\s*=\s*gdSPDefLights[0-9]\s*\(([^\)]*)\)\s*;\s*",
-        lightsData,
-        re.DOTALL,
+    matchResult = getSymbolIndex(lightsData).search(
+        re.compile(
+            r"(?<!\w)Lights([0-9n])\s*(?<!\w)"
+            + re.escape(lightsName)
+            + r"\s*=\s*gdSPDefLights[0-9]\s*\(([^\)]*)\)\s*;\s*",
+            re.DOTALL,
+        ),
+        lightsName,
     )
     if matchResult is None:
         raise PluginError("Cannot find lights data named " + lightsName)
@@ -2096,12 +2149,14 @@ def CI4toRGBA32(value):
 
 
 def parseTextureData(dlData, textureName, f3dContext, imageFormat, imageSize, width, isLUT, f3d):
-    matchResult = re.search(
-        r"([A-Za-z0-9\_]+)\s*"
-        + re.escape(textureName)
-        + r"\s*\[\s*[0-9a-zA-Z_\(\),\s]*\s*\]\s*=\s*\{([^\}]*)\s*\}\s*;\s*",
-        dlData,
-        re.DOTALL,
+    matchResult = getSymbolIndex(dlData).search(
+        re.compile(
+            r"(?<!\w)([A-Za-z0-9\_]+)\s*(?<!\w)"
+            + re.escape(textureName)
+            + r"\s*\[\s*[0-9a-zA-Z_\(\),\s]*\s*\]\s*=\s*\{([^\}]*)\s*\}\s*;\s*",
+            re.DOTALL,
+        ),
+        textureName,
     )
     if matchResult is None:
         print("Cannot find texture named " + textureName)
@@ -2263,12 +2318,7 @@ def parseMacroArgs(data: str):
 
 
 def getImportData(filepaths):
-    data = ""
-    for path in filepaths:
-        if os.path.exists(path):
-            data += readFile(path)
-
-    return data
+    return "".join(readFile(path) for path in filepaths if os.path.exists(path))
 
 
 def parseMatrices(sceneData: str, f3dContext: F3DContext, importScale: float = 1):
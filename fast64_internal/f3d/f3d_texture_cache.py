@@ -0,0 +1,111 @@
+"""
+Persistent cache of converted texture data, keyed by the hash of the image pixels and the conversion settings.
+Entries are files in a folder next to the .blend file, the least recently used ones are removed past a size limit.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import bpy
+import numpy as np
+
+CACHE_DIR_NAME = "fast64_texture_cache"
+CACHE_VERSION = 1  # bump when the converted data format changes
+
+
+class TextureCache:
+    def __init__(self, directory: str, max_size: int):
+        self.directory = directory
+        self.max_size = max_size
+        self.entries: Optional[OrderedDict[str, int]] = None  # file name : size, least recently used first
+        self.size = 0
+
+    def load_entries(self):
+        if self.entries is not None:
+            return
+        entries = []
+        if os.path.isdir(self.directory):
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.is_file() and not entry.name.endswith(".tmp"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, entry.name, stat.st_size))
+        entries.sort()
+        self.entries = OrderedDict((name, size) for _, name, size in entries)
+        self.size = sum(self.entries.values())
+
+    def get(self, key: str) -> Optional[bytes]:
+        self.load_entries()
+        if key not in self.entries:
+            return None
+        path = os.path.join(self.directory, key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            os.utime(path)  # mark as recently used for future sessions
+        except OSError:
+            self.size -= self.entries.pop(key)
+            return None
+        self.entries.move_to_end(key)
+        return data
+
+    def put(self, key: str, data: bytes):
+        self.load_entries()
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, key)
+        try:
+            with open(path + ".tmp", "wb") as file:
+                file.write(data)
+            os.replace(path + ".tmp", path)
+        except OSError as exc:
+            print(f"Could not write to texture cache: {exc}")
+            return
+        self.size += len(data) - self.entries.pop(key, 0)
+        self.entries[key] = len(data)
+        self.evict()
+
+    def evict(self):
+        while self.size > self.max_size and len(self.entries) > 1:
+            name, size = self.entries.popitem(last=False)
+            self.size -= size
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+
+texture_cache: Optional[TextureCache] = None
+
+
+def get_texture_cache() -> Optional[TextureCache]:
+    """Returns None if caching is disabled or the .blend file was never saved"""
+    global texture_cache
+    settings = bpy.context.scene.fast64.settings
+    if not settings.use_texture_cache or not bpy.data.filepath:
+        return None
+    directory = os.path.join(os.path.dirname(bpy.data.filepath), CACHE_DIR_NAME)
+    if texture_cache is None or texture_cache.directory != directory:
+        texture_cache = TextureCache(directory, 0)
+    texture_cache.max_size = settings.texture_cache_size * 1024 * 1024
+    return texture_cache
+
+
+def get_cache_key(pixels: np.ndarray, *settings) -> str:
+    pixel_hash = hashlib.sha1(np.ascontiguousarray(pixels).tobytes())
+    pixel_hash.update(repr((CACHE_VERSION, pixels.shape, settings)).encode())
+    return pixel_hash.hexdigest()
+
+
+def cached_texture_data(pixels: np.ndarray, settings: tuple, convert: Callable[[], bytes]) -> bytes:
+    """Returns the cached result of convert for these pixels and settings, or converts and caches it"""
+    cache = get_texture_cache()
+    if cache is None:
+        return convert()
+    key = get_cache_key(pixels, *settings)
+    data = cache.get(key)
+    if data is None:
+        data = bytes(convert())
+        cache.put(key, data)
+    return data
@@ -0,0 +1,127 @@
+"""
+NumPy texture encoding, converts whole images at once instead of pixel by pixel.
+Results are byte identical to the per pixel conversions in f3d_texture_writer.py (see scripts/benchmarks).
+"""
+
+import bpy
+import numpy as np
+
+from ..utility import PluginError, colorToLuminance
+
+
+def get_image_pixels(image: bpy.types.Image) -> np.ndarray:
+    """Returns a (width * height, channels) float32 array, top row first (N64 is -Y, Blender is +Y)"""
+    width, height = image.size
+    pixels = np.empty(width * height * image.channels, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, image.channels)[::-1].reshape(-1, image.channels)
+
+
+def to_fixed(values: np.ndarray, scale: int) -> np.ndarray:
+    """int(round(value * scale)), round half to even like python's round"""
+    return np.rint(values.astype(np.float64) * scale).astype(np.int64)
+
+
+def get_luminance(rgb: np.ndarray) -> np.ndarray:
+    """
+    colorToLuminance of every pixel.
+    It is evaluated once per unique color with the same function, so results are exact and not just close.
+    """
+    rgb = np.ascontiguousarray(rgb[:, :3], dtype=np.float32)
+    if len(rgb) == 0:
+        return np.zeros(0, dtype=np.float64)
+    unique, inverse = np.unique(rgb.view(np.dtype((np.void, rgb.itemsize * 3))).ravel(), return_inverse=True)
+    unique_rgb = unique.view(np.float32).reshape(-1, 3)
+    luminance = np.array([colorToLuminance(color) for color in unique_rgb.tolist()], dtype=np.float64)
+    return luminance[inverse.reshape(-1)]
+
+
+def compact_nibbles(values: np.ndarray) -> bytearray:
+    values = (values & 0xF).astype(np.uint8)
+    if len(values) % 2 == 1:
+        values = np.append(values, np.uint8(0))
+    return bytearray(((values[0::2] << 4) | values[1::2]).tobytes())
+
+
+def encode_non_ci_texture(pixels: np.ndarray, fmt: str, bit_size: str) -> bytearray:
+    """pixels must have 4 channels"""
+    alpha = pixels[:, 3]
+    if fmt == "G_IM_FMT_RGBA":
+        if bit_size == "G_IM_SIZ_16b":
+            r, g, b = (to_fixed(pixels[:, i], 0x1F) & 0x1F for i in range(3))
+            data = np.empty((len(pixels), 2), dtype=np.uint8)
+            data[:, 0] = (r << 3) | (g >> 2)
+            data[:, 1] = ((g & 0x03) << 6) | (b << 1) | (alpha > 0.5)
+        elif bit_size == "G_IM_SIZ_32b":
+            data = (to_fixed(pixels, 0xFF) & 0xFF).astype(np.uint8)
+        else:
+            raise PluginError("Invalid combo: " + fmt + ", " + bit_size)
+
+    elif fmt == "G_IM_FMT_YUV":
+        raise PluginError("YUV not yet implemented.")
+
+    elif fmt == "G_IM_FMT_CI":
+        raise PluginError("Internal error, writeNonCITextureData called for CI image.")
+
+    elif fmt == "G_IM_FMT_IA":
+        luminance = get_luminance(pixels)
+        if bit_size == "G_IM_SIZ_4b":
+            return compact_nibbles(((to_fixed(luminance, 0x7) & 0x7) << 1) | (alpha > 0.5))
+        elif bit_size == "G_IM_SIZ_8b":
+            data = (((to_fixed(luminance, 0xF) & 0xF) << 4) | (to_fixed(alpha, 0xF) & 0xF)).astype(np.uint8)
+        elif bit_size == "G_IM_SIZ_16b":
+            data = np.empty((len(pixels), 2), dtype=np.uint8)
+            data[:, 0] = to_fixed(luminance, 0xFF) & 0xFF
+            data[:, 1] = to_fixed(alpha, 0xFF) & 0xFF
+        else:
+            raise PluginError("Invalid combo: " + fmt + ", " + bit_size)
+
+    elif fmt == "G_IM_FMT_I":
+        luminance = get_luminance(pixels)
+        if bit_size == "G_IM_SIZ_4b":
+            return compact_nibbles(to_fixed(luminance, 0xF) & 0xF)
+        elif bit_size == "G_IM_SIZ_8b":
+            data = (to_fixed(luminance, 0xFF) & 0xFF).astype(np.uint8)
+        else:
+            raise PluginError("Invalid combo: " + fmt + ", " + bit_size)
+    else:
+        raise PluginError("Invalid image format " + fmt)
+
+    return bytearray(data.tobytes())
+
+
+def get_ci_colors(pixels: np.ndarray, pal_fmt: str) -> np.ndarray:
+    """Palette color of every pixel, missing channels default to 1 like extractConvertCIPixel"""
+    color = np.ones((len(pixels), 4), dtype=np.float32)
+    channels = min(pixels.shape[1], 4)
+    color[:, :channels] = pixels[:, :channels]
+    alpha = color[:, 3]
+    if pal_fmt == "RGBA16":
+        r, g, b = (to_fixed(color[:, i], 0x1F) & 0x1F for i in range(3))
+        return (r << 11) | (g << 6) | (b << 1) | (alpha > 0.5)
+    elif pal_fmt == "IA16":
+        return (to_fixed(get_luminance(color), 0xFF) << 8) | (alpha.astype(np.float64) * 0xFF).astype(np.int64)
+    else:
+        raise PluginError("Internal error, palette format is " + pal_fmt)
+
+
+def get_palette(pixels: np.ndarray, pal_fmt: str) -> list[int]:
+    """Unique palette colors in order of first use"""
+    unique, first_use = np.unique(get_ci_colors(pixels, pal_fmt), return_index=True)
+    return unique[np.argsort(first_use, kind="stable")].tolist()
+
+
+def get_color_indices(pixels: np.ndarray, palette: list[int], pal_fmt: str) -> np.ndarray:
+    """Palette index of every pixel, -1 if the color is missing from the palette"""
+    unique, inverse = np.unique(get_ci_colors(pixels, pal_fmt), return_inverse=True)
+    palette_indices: dict[int, int] = {}
+    for i, color in enumerate(palette):
+        palette_indices.setdefault(color, i)
+    unique_indices = np.array([palette_indices.get(color, -1) for color in unique.tolist()], dtype=np.int64)
+    return unique_indices[inverse.reshape(-1)]
+
+
+def encode_ci_texture(indices: np.ndarray, tex_fmt: str) -> bytearray:
+    if tex_fmt == "CI4":
+        return compact_nibbles(indices)
+    return bytearray(indices.astype(np.uint8).tobytes())
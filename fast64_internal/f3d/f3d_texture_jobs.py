@@ -0,0 +1,80 @@
+"""
+Background texture conversion.
+Pixels are read from the images on the main thread, then the encoding runs in a thread pool while the export continues.
+An FImage waits for its own conversion the first time its data is read, so the output is the same as converting
+every texture in order, only the time at which the work happens changes.
+The encoding is NumPy work that releases the GIL, which is what lets threads run it in parallel.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+import bpy
+import numpy as np
+
+from .f3d_gbi import FImage
+from .f3d_texture_cache import TextureCache, get_texture_cache, get_cache_key
+
+executor: Optional[ThreadPoolExecutor] = None
+executor_workers = 0
+
+
+class TextureConversion:
+    """Pending result of a conversion, saved to the texture cache once it is used"""
+
+    def __init__(self, future: Future, cache: Optional[TextureCache], key: Optional[str]):
+        self.future = future
+        self.cache = cache
+        self.key = key
+
+    def result(self) -> bytes:
+        data = bytes(self.future.result())
+        if self.cache is not None:
+            self.cache.put(self.key, data)
+            self.cache = None
+        return data
+
+
+def get_executor() -> Optional[ThreadPoolExecutor]:
+    """Returns None when textures should be converted right away"""
+    global executor, executor_workers
+    workers = bpy.context.scene.fast64.settings.texture_conversion_threads
+    if workers <= 1:
+        return None
+    if executor is None or executor_workers != workers:
+        if executor is not None:
+            executor.shutdown(wait=False)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fast64_texture")
+        executor_workers = workers
+    return executor
+
+
+def queue_texture_data(fImage: FImage, pixels: np.ndarray, settings: tuple, convert: Callable[[], bytes]):
+    """
+    Sets fImage's data to the cached result of convert for these pixels and settings, or converts it.
+    convert must only use data it was given, not Blender data, since it can run on another thread.
+    """
+    cache = get_texture_cache()
+    key = get_cache_key(pixels, *settings) if cache is not None else None
+    data = cache.get(key) if cache is not None else None
+    if data is not None:
+        fImage.data = bytearray(data)
+        return
+
+    pool = get_executor()
+    if pool is None:
+        data = bytes(convert())
+        if cache is not None:
+            cache.put(key, data)
+        fImage.data = bytearray(data)
+    else:
+        fImage.conversion = TextureConversion(pool.submit(convert), cache, key)
+
+
+def texture_jobs_unregister():
+    """Waits for the conversion threads to stop, so disabling or reloading the addon doesn't leave them running"""
+    global executor, executor_workers
+    if executor is not None:
+        executor.shutdown(wait=True)
+    executor = None
+    executor_workers = 0
@@ -1,6 +1,7 @@
 from typing import Union, Optional
 from dataclasses import dataclass, field
 import bpy
+import numpy as np
 from math import ceil, floor
 
 from .f3d_enums import *
@@ -16,6 +17,15 @@ from .f3d_material import (
 from .f3d_gbi import *
 from .f3d_gbi import _DPLoadTextureBlock
 from .flipbook import TextureFlipbook
+from .f3d_texture_encoding import (
+    get_image_pixels,
+    encode_non_ci_texture,
+    get_palette,
+    get_color_indices,
+    encode_ci_texture,
+)
+from .f3d_texture_cache import cached_texture_data
+from .f3d_texture_jobs import queue_texture_data
 
 from ..utility import *
 
@@ -1110,35 +1120,31 @@ def extractConvertCIPixel(image, pixels, i, j, palFormat):
 
 
 def getColorsUsedInImage(image, palFormat):
-    palette = []
-    # N64 is -Y, Blender is +Y
-    pixels = image.pixels[:]
-    for j in reversed(range(image.size[1])):
-        for i in range(image.size[0]):
-            pixelColor = extractConvertCIPixel(image, pixels, i, j, palFormat)
-            if pixelColor not in palette:
-                palette.append(pixelColor)
-    return palette
+    pixels = get_image_pixels(image)
+    data = cached_texture_data(
+        pixels,
+        ("palette", tuple(image.size), palFormat),
+        lambda: np.array(get_palette(pixels, palFormat), dtype=">i8").tobytes(),
+    )
+    return np.frombuffer(data, dtype=">i8").tolist()
 
 
 def mergePalettes(pal0, pal1):
     palette = [c for c in pal0]
+    colors = set(palette)
     for c in pal1:
-        if c not in palette:
+        if c not in colors:
             palette.append(c)
+            colors.add(c)
     return palette
 
 
-def getColorIndicesOfTexture(image, palette, palFormat):
-    texture = []
-    # N64 is -Y, Blender is +Y
-    pixels = image.pixels[:]
-    for j in reversed(range(image.size[1])):
-        for i in range(image.size[0]):
-            pixelColor = extractConvertCIPixel(image, pixels, i, j, palFormat)
-            if pixelColor not in palette:
-                raise PluginError(f"Bug: {image.name} palette len {len(palette)} missing CI")
-            texture.append(palette.index(pixelColor))
+def getColorIndicesOfTexture(image, palette, palFormat, pixels: Optional[np.ndarray] = None):
+    if pixels is None:
+        pixels = get_image_pixels(image)
+    texture = get_color_indices(pixels, palette, palFormat)
+    if (texture < 0).any():
+        raise PluginError(f"Bug: {image.name} palette len {len(palette)} missing CI")
     return texture
 
 
@@ -1172,16 +1178,43 @@ def writeCITextureData(
     if fImage.converted:
         return
 
-    texture = getColorIndicesOfTexture(image, palette, palFmt)
+    pixels = get_image_pixels(image)
+    imageName = image.name
+    palette = tuple(palette)  # the conversion can run later, after the caller's list changed
 
-    if texFmt == "CI4":
-        fImage.data = compactNibbleArray(texture, image.size[0], image.size[1])
-    else:
-        fImage.data = bytearray(texture)
+    def convert():
+        texture = get_color_indices(pixels, palette, palFmt)
+        if (texture < 0).any():
+            raise PluginError(f"Bug: {imageName} palette len {len(palette)} missing CI")
+        return encode_ci_texture(texture, texFmt)
+
+    queue_texture_data(fImage, pixels, ("ci", tuple(image.size), texFmt, palFmt, palette), convert)
     fImage.converted = True
 
 
 def writeNonCITextureData(image: bpy.types.Image, fImage: FImage, texFmt: str):
+    if fImage.converted:
+        return
+    pixels = get_image_pixels(image)
+
+    settings = ("texture", tuple(image.size), texFmt)
+
+    # Images without exactly 4 channels are rare, the per pixel path handles their quirks on the main thread
+    if image.channels != 4:
+
+        def convertPerPixel():
+            writeNonCITextureDataPerPixel(image, fImage, texFmt)
+            return fImage.data
+
+        fImage.data = bytearray(cached_texture_data(pixels, settings, convertPerPixel))
+    else:
+        fmt, bitSize = texFormatOf[texFmt], texBitSizeF3D[texFmt]
+        queue_texture_data(fImage, pixels, settings, lambda: encode_non_ci_texture(pixels, fmt, bitSize))
+    fImage.converted = True
+
+
+def writeNonCITextureDataPerPixel(image: bpy.types.Image, fImage: FImage, texFmt: str):
+    """Per pixel conversion, used for images that do not have exactly 4 channels"""
     if fImage.converted:
         return
     fmt = texFormatOf[texFmt]
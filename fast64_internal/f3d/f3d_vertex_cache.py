@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Hashable, Sequence
+
+# Vertices here are BufferVertex like objects, they must be hashable and have a groupIndex.
+FaceVerts = Sequence[Hashable]
+
+
+@dataclass
+class VertexLoadStats:
+    loads: int = 0  # SPVertex commands
+    vertices: int = 0  # vertices sent to the RSP
+    triangles: int = 0
+
+    def triangle_commands(self, use_sp2_triangle: bool) -> int:
+        return (self.triangles + 1) // 2 if use_sp2_triangle else self.triangles
+
+    def dl_size(self, use_sp2_triangle: bool) -> int:
+        """Size in bytes of the vertex and triangle commands plus the vertex data they load"""
+        return (self.loads + self.triangle_commands(use_sp2_triangle)) * 8 + self.vertices * 16
+
+
+def simulate_vertex_loads(
+    face_verts: list[FaceVerts], buffer_size: int, preloaded: set, existing_count: int = 0
+) -> VertexLoadStats:
+    """
+    Mirrors how TriangleConverter.addFace fills the vertex buffer, without writing anything.
+    preloaded is the set of vertices already in the buffer (ex. sm64 skinning), existing_count is their amount.
+    """
+    stats = VertexLoadStats()
+    loaded, batch_verts, batch_tris = set(), [], 0
+
+    def flush():
+        if batch_tris == 0:
+            return
+        stats.loads += max(1, len({vert.groupIndex for vert in batch_verts}))
+        stats.vertices += len(batch_verts)
+        stats.triangles += batch_tris
+
+    for verts in face_verts:
+        added = [vert for vert in verts if vert not in loaded and vert not in preloaded]
+        if existing_count + len(batch_verts) + len(added) > buffer_size:
+            flush()
+            batch_verts = [vert for vert in verts if vert not in preloaded]
+            loaded, batch_tris = set(batch_verts), 1
+        else:
+            batch_verts.extend(added)
+            loaded.update(added)
+            batch_tris += 1
+    flush()
+    return stats
+
+
+def optimize_vertex_cache_order(
+    face_verts: list[FaceVerts], buffer_size: int, preloaded: set, existing_count: int = 0
+) -> list[int]:
+    """
+    Greedy clustering of triangles into vertex buffer loads, returns the new order as indices into face_verts.
+    Each load is grown from the triangles sharing its vertices, always picking the triangle that adds the fewest
+    new vertices, then the one whose vertices have the fewest remaining triangles (so that vertices get finished
+    off, like Forsyth's algorithm). When the cheapest triangle does not fit in buffer_size, it starts the next load.
+    """
+    vert_faces: dict[Hashable, list[int]] = {}
+    for i, verts in enumerate(face_verts):
+        for vert in set(verts):
+            vert_faces.setdefault(vert, []).append(i)
+    remaining_faces = {vert: len(faces) for vert, faces in vert_faces.items()}
+
+    emitted = [False] * len(face_verts)
+    order: list[int] = []
+    batch: set = set()
+    batch_len = existing_count
+    candidates: dict[int, int] = {}  # face index : amount of new vertices it would add to the current load
+    next_seed = 0
+
+    def get_cost(i: int):
+        return sum(1 for vert in face_verts[i] if vert not in batch and vert not in preloaded)
+
+    def get_valence(i: int):
+        return sum(remaining_faces[vert] for vert in face_verts[i])
+
+    while len(order) < len(face_verts):
+        if len(candidates) > 0:
+            face = min(candidates, key=lambda i: (candidates[i], get_valence(i), i))
+            cost = candidates[face]
+        else:
+            while emitted[next_seed]:
+                next_seed += 1
+            face = next_seed
+            cost = get_cost(face)
+
+        if batch_len + cost > buffer_size:
+            batch, batch_len, candidates = set(), existing_count, {}
+            cost = get_cost(face)
+
+        emitted[face] = True
+        order.append(face)
+        candidates.pop(face, None)
+        batch_len += cost
+        unique_verts = set(face_verts[face])
+        for vert in unique_verts:
+            remaining_faces[vert] -= 1
+            if vert not in preloaded:
+                batch.add(vert)
+        for vert in unique_verts:
+            for other_face in vert_faces[vert]:
+                if not emitted[other_face]:
+                    candidates[other_face] = get_cost(other_face)
+
+    return order
@@ -1,7 +1,7 @@
 from typing import Union, Optional, Callable, Any, List
-from dataclasses import dataclass
 import functools
-import bpy, mathutils, os, re, copy, math
+import bpy, mathutils, os, re, math
+import numpy as np
 from mathutils import Vector
 from math import ceil
 from bpy.utils import register_class, unregister_class
@@ -18,6 +18,12 @@ from .f3d_material import (
 from .f3d_texture_writer import MultitexManager, TileLoad, maybeSaveSingleLargeTextureSetup
 from .f3d_gbi import *
 from .f3d_bleed import BleedGraphics, get_geo_cmds
+from .f3d_dedup import merge_identical_lists
+from .f3d_vertex_cache import simulate_vertex_loads, optimize_vertex_cache_order
+from .f3d_mesh_data import MeshArrays, get_attribute_array, get_mesh_arrays
+from .f3d_bounds import get_oriented_box
+from .f3d_export_cache import CachedTriGroup, geometry_cache, get_geometry_cache, get_mesh_fingerprint
+from .f3d_gfx_analysis import GfxStats, analyze_fmodel, get_gfx_report_text, write_gfx_report
 
 from ..utility import *
 
@@ -74,6 +80,8 @@ class MeshInfo:
         self.texDimensions = {}  # texture dimensions for each material
 
         self.vertexGroupInfo = None
+        self.vertexBoneGroups = {}  # armature name : bone of each vertex, see sm64 getVertexBoneGroups
+        self.fingerprint = None  # hash of the mesh data, only set for incremental exports
 
 
 def get_original_name(obj: bpy.types.Object):
@@ -165,44 +173,96 @@ def getInfoDict_impl(obj: bpy.types.Object):
                 uv_data = uv_layer.data
         if uv_data is None:
             raise PluginError("Object '" + get_original_name(obj) + "' does not have a UV layer named 'UVMap.'")
-    for face in mesh.loop_triangles:
+    arrays = get_mesh_arrays(mesh, uv_data, getColorLayer(mesh, layer="Col"), getColorLayer(mesh, layer="Alpha"))
+    faces = list(mesh.loop_triangles)
+    triLoops = arrays.tri_loops.tolist()
+    triVerts = arrays.tri_vertices.tolist()
+    triMaterials = arrays.tri_materials.tolist()
+
+    # f3d verts and their keys, built from the mesh arrays
+    loopVerts = arrays.loop_vertices.tolist()
+    uvs = getLoopUVs(arrays.uvs).tolist()
+    normals = getLoopNormals(arrays.loop_normals).tolist()
+    colors, colorIndices = getUniqueLoopColors(arrays)
+    colorIndices = colorIndices.tolist()
+    positions: list[Optional[Vector]] = [None] * len(mesh.vertices)
+    vertSettings = {}  # material index : (has_rgb, has_normal)
+    loopKeys = {}  # loop index : F3DVert.key()
+    for faceIndex, face in enumerate(faces):
         validNeighborDict[face] = []
-        material = obj.material_slots[face.material_index].material
-        if material is None:
-            raise PluginError(
-                f"There are some faces on your mesh object {get_original_name(obj)}"
-                " that are assigned to an empty material slot."
-            )
-        for vertIndex in face.vertices:
-            if vertIndex not in vertDict:
-                vertDict[vertIndex] = []
-            if face not in vertDict[vertIndex]:
-                vertDict[vertIndex].append(face)
-        for edgeKey in face.edge_keys:
-            if edgeKey not in edgeDict:
-                edgeDict[edgeKey] = []
-            if face not in edgeDict[edgeKey]:
-                edgeDict[edgeKey].append(face)
+        materialIndex = triMaterials[faceIndex]
+        if materialIndex not in vertSettings:
+            material = material_slots[materialIndex].material
+            if material is None:
+                raise PluginError(
+                    f"There are some faces on your mesh object {get_original_name(obj)}"
+                    " that are assigned to an empty material slot."
+                )
+            vertSettings[materialIndex] = getRgbNormalSettings(material.f3d_mat)[:2]
+        has_rgb, has_normal = vertSettings[materialIndex]
 
-        for loopIndex in face.loops:
-            convertInfo = LoopConvertInfo(uv_data, obj, obj.material_slots[face.material_index].material)
-            f3dVertDict[loopIndex] = getF3DVert(mesh.loops[loopIndex], face, convertInfo, mesh)
-    for face in mesh.loop_triangles:
-        for edgeKey in face.edge_keys:
-            for otherFace in edgeDict[edgeKey]:
-                if otherFace == face:
+        for loopIndex in triLoops[faceIndex]:
+            if loopIndex in f3dVertDict:  # loops can be shared by triangles of the same polygon
+                continue
+            vertIndex = loopVerts[loopIndex]
+            if positions[vertIndex] is None:
+                positions[vertIndex] = Vector(arrays.positions[vertIndex]).freeze()
+            rgb, alpha = colors[colorIndices[loopIndex]]
+            f3dVert = F3DVert(
+                positions[vertIndex],
+                Vector(uvs[loopIndex]).freeze(),
+                rgb if has_rgb else None,
+                Vector(normals[loopIndex]).freeze() if has_normal else None,
+                alpha,
+            )
+            f3dVertDict[loopIndex] = f3dVert
+            loopKeys[loopIndex] = f3dVert.key()
+
+    if get_geometry_cache() is not None:
+        infoDict.fingerprint = get_mesh_fingerprint(arrays, sorted(vertSettings.items()))
+
+    # all faces connected to a vert / to an edge, as indices into faces
+    vertFaces: dict[int, list[int]] = {}
+    edgeFaces: dict[tuple[int, int], list[int]] = {}
+    for faceIndex, (v0, v1, v2) in enumerate(triVerts):
+        for vertIndex in (v0, v1, v2):
+            vertFaceList = vertFaces.setdefault(vertIndex, [])
+            if len(vertFaceList) == 0 or vertFaceList[-1] != faceIndex:
+                vertFaceList.append(faceIndex)
+        # same order as MeshLoopTriangle.edge_keys
+        for edgeKey in ((v0, v1), (v1, v2), (v2, v0)):
+            edgeKey = edgeKey if edgeKey[0] < edgeKey[1] else (edgeKey[1], edgeKey[0])
+            edgeFaceList = edgeFaces.setdefault(edgeKey, [])
+            if len(edgeFaceList) == 0 or edgeFaceList[-1] != faceIndex:
+                edgeFaceList.append(faceIndex)
+    for vertIndex, faceIndices in vertFaces.items():
+        vertDict[vertIndex] = [faces[i] for i in faceIndices]
+    for edgeKey, faceIndices in edgeFaces.items():
+        edgeDict[edgeKey] = [faces[i] for i in faceIndices]
+
+    def getLoopKey(vertIndex, faceIndex):
+        return loopKeys[triLoops[faceIndex][triVerts[faceIndex].index(vertIndex)]]
+
+    checkedPairs = set()
+    for faceIndex, (v0, v1, v2) in enumerate(triVerts):
+        face = faces[faceIndex]
+        for edgeKey in ((v0, v1), (v1, v2), (v2, v0)):
+            edgeKey = edgeKey if edgeKey[0] < edgeKey[1] else (edgeKey[1], edgeKey[0])
+            for otherFaceIndex in edgeFaces[edgeKey]:
+                if otherFaceIndex == faceIndex:
                     continue
-                if (otherFace, face) not in edgeValidDict and (face, otherFace) not in edgeValidDict:
-                    edgeValid = (
-                        f3dVertDict[getLoopFromVert(edgeKey[0], face)]
-                        == f3dVertDict[getLoopFromVert(edgeKey[0], otherFace)]
-                        and f3dVertDict[getLoopFromVert(edgeKey[1], face)]
-                        == f3dVertDict[getLoopFromVert(edgeKey[1], otherFace)]
-                    )
-                    edgeValidDict[(otherFace, face)] = edgeValid
-                    if edgeValid:
-                        validNeighborDict[face].append(otherFace)
-                        validNeighborDict[otherFace].append(face)
+                pair = (min(faceIndex, otherFaceIndex), max(faceIndex, otherFaceIndex))
+                if pair in checkedPairs:
+                    continue
+                checkedPairs.add(pair)
+                otherFace = faces[otherFaceIndex]
+                edgeValid = all(
+                    getLoopKey(vertIndex, faceIndex) == getLoopKey(vertIndex, otherFaceIndex) for vertIndex in edgeKey
+                )
+                edgeValidDict[(otherFace, face)] = edgeValid
+                if edgeValid:
+                    validNeighborDict[face].append(otherFace)
+                    validNeighborDict[otherFace].append(face)
     return infoDict
 
 
@@ -395,8 +455,8 @@ def saveMeshWithLargeTexturesByFaces(
             material,
             currentGroupIndex,
             triGroup,
-            copy.deepcopy(existingVertData),
-            copy.deepcopy(matRegionDict),
+            existingVertData,
+            matRegionDict,
         )
 
         currentGroupIndex = saveTriangleStrip(triConverter, tileLoad.faces, tileLoad.offsets, obj.data, False)
@@ -425,14 +485,17 @@ def saveStaticModel(
     convertTextureData,
     revertMatAtEnd: bool,
     drawLayerField,
+    triangles: Optional[list[bpy.types.MeshLoopTriangle]] = None,
+    meshName: Optional[str] = None,
 ):
+    """triangles and meshName convert only part of the object's triangles, into meshes with a name of their own"""
     if len(obj.data.polygons) == 0:
         return None
 
     # checkForF3DMaterial(obj)
 
     faces_by_mat = {}
-    for face in obj.data.loop_triangles:
+    for face in obj.data.loop_triangles if triangles is None else triangles:
         if face.material_index not in faces_by_mat:
             faces_by_mat[face.material_index] = []
         faces_by_mat[face.material_index].append(face)
@@ -456,11 +519,11 @@ def saveStaticModel(
             drawLayerName = None
 
         if drawLayer not in fMeshes:
-            fMesh = fModel.addMesh(obj.original_name, ownerName, drawLayerName, False, obj)
+            fMesh = fModel.addMesh(meshName or obj.original_name, ownerName, drawLayerName, False, obj)
             fMeshes[drawLayer] = fMesh
 
             if obj.use_f3d_culling and not fModel.f3d.F3D_OLD_GBI:
-                addCullCommand(obj, fMesh, transformMatrix, fModel.matWriteMethod)
+                addCullCommand(obj, fMesh, transformMatrix, fModel.matWriteMethod, triangles)
         else:
             fMesh = fMeshes[drawLayer]
 
@@ -506,10 +569,13 @@ def saveStaticModel(
     return fMeshes
 
 
-def addCullCommand(obj, fMesh, transformMatrix, matWriteMethod):
+def addCullCommand(obj, fMesh, transformMatrix, matWriteMethod, triangles: Optional[list] = None):
+    """Culls the mesh with the tightest box around the object's vertices, or only those of triangles"""
     fMesh.add_cull_vtx()
-    # if the object has a specifically set culling bounds, use that instead
-    for vertexPos in obj.get("culling_bounds", obj.bound_box):
+    positions = get_attribute_array(obj.data.vertices, "co", 3)
+    if triangles is not None:
+        positions = positions[np.unique([triangle.vertices[:] for triangle in triangles])]
+    for vertexPos in get_oriented_box(positions).tolist():
         fMesh.cullVertexList.vertices.append(
             F3DVert(
                 Vector(vertexPos),
@@ -558,12 +624,8 @@ def exportF3DCommon(obj, fModel, transformMatrix, includeChildren, name, DLForma
             triConverterInfo, fModel, tempObj, transformMatrix, name, convertTextureData, revert_materials, None
         )
         cleanupCombineObj(tempObj, meshList)
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
     except Exception as e:
         cleanupCombineObj(tempObj, meshList)
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
         raise Exception(str(e))
 
     return fMeshes
@@ -631,7 +693,7 @@ def edgeValid(edgeValidDict, face, otherFace):
 
 
 def getLowestUnvisitedNeighborCountFace(unvisitedFaces, infoDict):
-    lowestNeighborFace = unvisitedFaces[0]
+    lowestNeighborFace = next(iter(unvisitedFaces))
     lowestNeighborCount = len(infoDict.validNeighbors[lowestNeighborFace])
     for face in unvisitedFaces:
         neighborCount = len(infoDict.validNeighbors[face])
@@ -668,15 +730,16 @@ def getNextNeighborFace(faces, face, lastEdgeKey, visitedFaces, possibleFaces, i
     return nextFaceAndEdge
 
 
-def saveTriangleStrip(triConverter, faces, faceSTOffsets, mesh, terminateDL):
-    visitedFaces = []
-    unvisitedFaces = copy.copy(faces)
+def getTriangleStripOrder(faces, infoDict):
+    faceSet = set(faces)
+    visitedFaces = set()
+    unvisitedFaces = dict.fromkeys(faces)  # ordered set
     possibleFaces = []
     lastEdgeKey = None
-    infoDict = triConverter.triConverterInfo.infoDict
     neighborFace = getLowestUnvisitedNeighborCountFace(unvisitedFaces, infoDict)
 
-    while len(visitedFaces) < len(faces):
+    orderedFaces = []
+    while len(unvisitedFaces) > 0:
         # print(str(len(visitedFaces)) + " " + str(len(bFaces)))
         if neighborFace is None:
             if len(possibleFaces) > 0:
@@ -689,20 +752,59 @@ def saveTriangleStrip(triConverter, faces, faceSTOffsets, mesh, terminateDL):
                 neighborFace = getLowestUnvisitedNeighborCountFace(unvisitedFaces, infoDict)
                 lastEdgeKey = None
 
-        stOffset = None if faceSTOffsets is None else faceSTOffsets[faces.index(neighborFace)]
-        triConverter.addFace(neighborFace, stOffset)
+        orderedFaces.append(neighborFace)
         if neighborFace in visitedFaces:
             raise PluginError("Repeated face")
-        visitedFaces.append(neighborFace)
-        unvisitedFaces.remove(neighborFace)
+        visitedFaces.add(neighborFace)
+        del unvisitedFaces[neighborFace]
         if neighborFace in possibleFaces:
             possibleFaces.remove(neighborFace)
         for otherFace in infoDict.validNeighbors[neighborFace]:
             infoDict.validNeighbors[otherFace].remove(neighborFace)
 
         neighborFace, lastEdgeKey = getNextNeighborFace(
-            faces, neighborFace, lastEdgeKey, visitedFaces, possibleFaces, infoDict
+            faceSet, neighborFace, lastEdgeKey, visitedFaces, possibleFaces, infoDict
         )
+    return orderedFaces
+
+
+def optimizeVertexLoads(triConverter, faceVerts: list[list["BufferVertex"]]) -> Optional[list[int]]:
+    """
+    Reorders triangles to minimize the amount of vertices loaded, returns None if the original order is better.
+    """
+    f3d = triConverter.triConverterInfo.f3d
+    bufferSize = f3d.vert_load_size
+    preloaded = {vert for verts in faceVerts for vert in verts if triConverter.vertInBuffer(vert, vert.materialIndex)}
+    existingCount = triConverter.bufferStart
+    useSP2Triangle = not f3d.F3D_OLD_GBI
+
+    before = simulate_vertex_loads(faceVerts, bufferSize, preloaded, existingCount)
+    order = optimize_vertex_cache_order(faceVerts, bufferSize, preloaded, existingCount)
+    after = simulate_vertex_loads([faceVerts[i] for i in order], bufferSize, preloaded, existingCount)
+
+    print(
+        f"Vertex load optimization for {triConverter.material.name}: "
+        f"{before.vertices} -> {after.vertices} vertices loaded, "
+        f"{before.loads} -> {after.loads} loads, "
+        f"{before.dl_size(useSP2Triangle)} -> {after.dl_size(useSP2Triangle)} bytes"
+    )
+    if (after.vertices, after.loads) >= (before.vertices, before.loads):
+        return None
+    return order
+
+
+def saveTriangleStrip(triConverter, faces, faceSTOffsets, mesh, terminateDL):
+    orderedFaces = getTriangleStripOrder(faces, triConverter.triConverterInfo.infoDict)
+    faceIndices = {face: i for i, face in enumerate(faces)}
+    stOffsets = [None if faceSTOffsets is None else faceSTOffsets[faceIndices[face]] for face in orderedFaces]
+    faceVerts = [triConverter.getBufferVerts(face, stOffset) for face, stOffset in zip(orderedFaces, stOffsets)]
+
+    order = range(len(orderedFaces))
+    if bpy.context.scene.fast64.settings.optimize_vertex_loads:
+        order = optimizeVertexLoads(triConverter, faceVerts) or order
+
+    for i in order:
+        triConverter.addFace(orderedFaces[i], stOffsets[i], faceVerts[i])
 
     triConverter.finish(terminateDL)
     return triConverter.currentGroupIndex
@@ -736,17 +838,26 @@ def saveMeshByFaces(
     triGroup = fMesh.tri_group_new(fMaterial)
     fMesh.draw.commands.append(SPDisplayList(triGroup.triList))
 
-    triConverter = TriangleConverter(
-        triConverterInfo,
-        texDimensions,
-        material,
-        currentGroupIndex,
-        triGroup,
-        copy.deepcopy(existingVertData),
-        copy.deepcopy(matRegionDict),
+    cacheKey = getGeometryCacheKey(
+        material, faces, currentGroupIndex, triConverterInfo, existingVertData, texDimensions
     )
+    cachedTriGroup = geometry_cache.get(cacheKey) if cacheKey is not None else None
+    if cachedTriGroup is not None:
+        cachedTriGroup.apply(triGroup)
+    else:
+        triConverter = TriangleConverter(
+            triConverterInfo,
+            texDimensions,
+            material,
+            currentGroupIndex,
+            triGroup,
+            existingVertData,
+            matRegionDict,
+        )
 
-    currentGroupIndex = saveTriangleStrip(triConverter, faces, None, obj.data, True)
+        currentGroupIndex = saveTriangleStrip(triConverter, faces, None, obj.data, True)
+        if cacheKey is not None:
+            geometry_cache.put(cacheKey, CachedTriGroup(triGroup))
 
     if fMaterial.revert is not None:
         fMesh.draw.commands.append(SPDisplayList(fMaterial.revert))
@@ -754,11 +865,36 @@ def saveMeshByFaces(
     return currentGroupIndex
 
 
-@dataclass
-class LoopConvertInfo:
-    uv_data: bpy.types.bpy_prop_collection | list[bpy.types.MeshUVLoop]
-    obj: bpy.types.Object
-    material: bpy.types.Material
+def getGeometryCacheKey(material, faces, currentGroupIndex, triConverterInfo, existingVertData, texDimensions):
+    """
+    Key of the geometry saveMeshByFaces converts, None if it can't be reused.
+    Skinned geometry depends on the vertices loaded by the parent, and cel shading writes extra tri lists.
+    """
+    infoDict = triConverterInfo.infoDict
+    if (
+        get_geometry_cache() is None
+        or infoDict.fingerprint is None
+        or currentGroupIndex is not None
+        or existingVertData is not None
+        or triConverterInfo.vertexGroupInfo is not None
+        or material.f3d_mat.use_cel_shading
+    ):
+        return None
+    scene = bpy.context.scene
+    return (
+        infoDict.fingerprint,
+        tuple(face.index for face in faces),
+        tuple(tuple(row) for row in triConverterInfo.transformMatrix),
+        tuple(texDimensions),
+        isTexturePointSampled(material),
+        tuple(material.f3d_mat.tex_scale),
+        getRgbNormalSettings(material.f3d_mat),
+        # scene settings read during the conversion, the microcode decides the load size and triangle commands
+        triConverterInfo.f3d.F3D_VER,
+        scene.f3d_type,
+        scene.packed_normals_algorithm,
+        scene.fast64.settings.optimize_vertex_loads,
+    )
 
 
 def getNewIndices(existingIndices, bufferStart):
@@ -789,17 +925,29 @@ class F3DVert:
         self.normal: Optional[Vector] = normal
         self.alpha: float = alpha
 
+    def copy(self) -> "F3DVert":
+        f3dVert = F3DVert(self.position, self.uv, self.rgb, self.normal, self.alpha)
+        f3dVert.stOffset = self.stOffset
+        return f3dVert
+
+    def key(self) -> tuple:
+        """Hashable snapshot of this vertex, stOffset must already be set"""
+        return (
+            tuple(self.position),
+            tuple(self.uv),
+            self.stOffset,
+            None if self.rgb is None else tuple(self.rgb),
+            None if self.normal is None else tuple(self.normal),
+            self.alpha,
+        )
+
     def __eq__(self, other):
         if not isinstance(other, F3DVert):
             return False
-        return (
-            self.position == other.position
-            and self.uv == other.uv
-            and self.stOffset == other.stOffset
-            and self.rgb == other.rgb
-            and self.normal == other.normal
-            and self.alpha == other.alpha
-        )
+        return self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
 
     def toVtx(self, mesh, texDimensions, transformMatrix, isPointSampled: bool, tex_scale=(1, 1)) -> Vtx:
         # Position (8 bytes)
@@ -843,20 +991,22 @@ class F3DVert:
 
 
 # groupIndex is either a vertex group (writing), or name of c variable identifying a transform group, like a limb (parsing)
+# The key is computed once on creation, so the f3dVert must not be modified afterwards.
 class BufferVertex:
     def __init__(self, f3dVert: F3DVert, groupIndex: int | str, materialIndex: int):
         self.f3dVert: F3DVert = f3dVert
         self.groupIndex: int | str = groupIndex
         self.materialIndex: int = materialIndex
+        self.key = (f3dVert.key(), groupIndex, materialIndex)
+        self.hash = hash(self.key)
 
     def __eq__(self, other):
         if not isinstance(other, BufferVertex):
             return False
-        return (
-            self.f3dVert == other.f3dVert
-            and self.groupIndex == other.groupIndex
-            and self.materialIndex == other.materialIndex
-        )
+        return self.hash == other.hash and self.key == other.key
+
+    def __hash__(self):
+        return self.hash
 
 
 class TriangleConverterInfo:
@@ -920,6 +1070,7 @@ def cel_shading_checks(f3d_mat):
 
 # existingVertexData is used for cases where we want to assume the presence of vertex data
 # loaded in from a previous matrix transform (ex. sm64 skinning)
+# It is shared between converters and is only copied once a converter adds verts after it.
 class TriangleConverter:
     def __init__(
         self,
@@ -937,33 +1088,46 @@ class TriangleConverter:
 
         # Existing data assumed to be already loaded in.
         self.vertBuffer: list[BufferVertex] = []
+        self.sharesVertBuffer = False  # True while vertBuffer is the caller's existingVertexData
         if existingVertexData is not None:
             self.vertBuffer: list[BufferVertex] = existingVertexData
+            self.sharesVertBuffer = True
         self.existingVertexMaterialRegions = existingVertexMaterialRegions
         self.bufferStart = len(self.vertBuffer)
         self.vertexBufferTriangles = []  # [(index0, index1, index2)]
 
+        # Index maps kept alongside vertBuffer, so that membership tests and index lookups are O(1)
+        self.existingVertIndices: dict[BufferVertex, int] = {}  # first index of each vert in the existing region
+        for i, bufferVert in enumerate(self.vertBuffer):
+            self.existingVertIndices.setdefault(bufferVert, i)
+        self.existingRegionVerts: dict[int, set[BufferVertex]] = {}  # material index : verts in its region
+        if existingVertexMaterialRegions is not None:
+            for material_index, matRegion in existingVertexMaterialRegions.items():
+                self.existingRegionVerts[material_index] = set(self.vertBuffer[matRegion[0] : matRegion[1]])
+        self.loadedVerts: set[BufferVertex] = set()  # verts in vertBuffer[bufferStart:]
+
         self.triGroup = triGroup
         self.triList = triGroup.triList
         self.vtxList = triGroup.vertexList
 
         self.material = material
-        uv_data = triConverterInfo.obj.data.uv_layers["UVMap"].data
-        self.convertInfo = LoopConvertInfo(uv_data, triConverterInfo.obj, material)
         self.texDimensions = texDimensions
         self.isPointSampled = isTexturePointSampled(material)
         self.tex_scale = material.f3d_mat.tex_scale
 
     def vertInBuffer(self, bufferVert, material_index):
+        if bufferVert in self.loadedVerts:
+            return True
         if self.existingVertexMaterialRegions is None:
-            return bufferVert in self.vertBuffer
+            return bufferVert in self.existingVertIndices
         else:
-            if material_index in self.existingVertexMaterialRegions:
-                matRegion = self.existingVertexMaterialRegions[material_index]
-                if bufferVert in self.vertBuffer[matRegion[0] : matRegion[1]]:
-                    return True
+            return bufferVert in self.existingRegionVerts.get(material_index, ())
 
-            return bufferVert in self.vertBuffer[self.bufferStart :]
+    def getVertIndices(self) -> dict[BufferVertex, int]:
+        vertIndices = dict(self.existingVertIndices)
+        for i in range(self.bufferStart, len(self.vertBuffer)):
+            vertIndices.setdefault(self.vertBuffer[i], i)
+        return vertIndices
 
     def getSortedBuffer(self) -> dict[int, list[BufferVertex]]:
         limbVerts: dict[int, list[BufferVertex]] = {}
@@ -1004,6 +1168,7 @@ class TriangleConverter:
             bufferStart = bufferEnd
         else:
             self.vertBuffer = self.vertBuffer[: self.bufferStart]
+        self.sharesVertBuffer = False
 
         # Load other limb verts
         for groupIndex, bufferVerts in limbVerts.items():
@@ -1035,7 +1200,7 @@ class TriangleConverter:
 
         # Load triangles
         triCmds = createTriangleCommands(
-            self.vertexBufferTriangles, self.vertBuffer, not self.triConverterInfo.f3d.F3D_OLD_GBI
+            self.vertexBufferTriangles, self.getVertIndices(), not self.triConverterInfo.f3d.F3D_OLD_GBI
         )
         if not self.triConverterInfo.f3d.F3DEX_GBI_3 or not self.material.f3d_mat.use_cel_shading:
             self.triList.commands.extend(triCmds)
@@ -1140,27 +1305,33 @@ class TriangleConverter:
         # Disable alpha compare culling for future DLs
         self.triList.commands.append(SPAlphaCompareCull("G_ALPHA_COMPARE_CULL_DISABLE", 0))
 
-    def addFace(self, face, stOffset):
+    def getBufferVerts(self, face, stOffset) -> list[BufferVertex]:
+        f3dVertDict = self.triConverterInfo.infoDict.f3dVert
+        vertexGroupInfo = self.triConverterInfo.vertexGroupInfo
+        bufferVerts = []
+        for loopIndex, vertIndex in zip(face.loops, face.vertices):
+            vertexGroup = vertexGroupInfo.vertexGroups[vertIndex] if vertexGroupInfo is not None else None
+            f3dVert = f3dVertDict[loopIndex]
+            if stOffset is not None:
+                # the info dict's verts are shared, only give the copy this face's offset
+                f3dVert = f3dVert.copy()
+                f3dVert.stOffset = stOffset
+            bufferVerts.append(BufferVertex(f3dVert, vertexGroup, face.material_index))
+        return bufferVerts
+
+    def addFace(self, face, stOffset, bufferVerts: Optional[list[BufferVertex]] = None):
         triIndices = []
         addedVerts = []  # verts added to existing vertexBuffer
         allVerts = []  # all verts not in 'untouched' buffer region
 
-        for loopIndex in face.loops:
-            loop = self.triConverterInfo.mesh.loops[loopIndex]
-            vertexGroup = (
-                self.triConverterInfo.vertexGroupInfo.vertexGroups[loop.vertex_index]
-                if self.triConverterInfo.vertexGroupInfo is not None
-                else None
-            )
-            bufferVert = BufferVertex(
-                getF3DVert(loop, face, self.convertInfo, self.triConverterInfo.mesh), vertexGroup, face.material_index
-            )
-            bufferVert.f3dVert.stOffset = stOffset
+        if bufferVerts is None:
+            bufferVerts = self.getBufferVerts(face, stOffset)
+        for bufferVert in bufferVerts:
             triIndices.append(bufferVert)
             if not self.vertInBuffer(bufferVert, face.material_index):
                 addedVerts.append(bufferVert)
 
-            if bufferVert not in self.vertBuffer[: self.bufferStart]:
+            if bufferVert not in self.existingVertIndices:
                 allVerts.append(bufferVert)
 
         # We care only about load size, since loading is what takes up time.
@@ -1168,9 +1339,15 @@ class TriangleConverter:
         if len(self.vertBuffer) + len(addedVerts) > self.triConverterInfo.f3d.vert_load_size:
             self.processGeometry()
             self.vertBuffer = self.vertBuffer[: self.bufferStart] + allVerts
+            self.loadedVerts = set(allVerts)
             self.vertexBufferTriangles = [triIndices]
         else:
-            self.vertBuffer.extend(addedVerts)
+            if self.sharesVertBuffer:
+                self.vertBuffer = self.vertBuffer + addedVerts
+                self.sharesVertBuffer = False
+            else:
+                self.vertBuffer.extend(addedVerts)
+            self.loadedVerts.update(addedVerts)
             self.vertexBufferTriangles.append(triIndices)
 
     def finish(self, terminateDL):
@@ -1183,36 +1360,19 @@ class TriangleConverter:
             self.triList.commands.append(SPEndDisplayList())
 
 
-def getF3DVert(loop: bpy.types.MeshLoop, face, convertInfo: LoopConvertInfo, mesh: bpy.types.Mesh):
-    position: Vector = mesh.vertices[loop.vertex_index].co.copy().freeze()
+def getLoopUVs(uvs: np.ndarray) -> np.ndarray:
     # N64 is -Y, Blender is +Y
-    uv: Vector = convertInfo.uv_data[loop.index].uv.copy()
-    uv[:] = [field if not math.isnan(field) else 0 for field in uv]
-    uv[1] = 1 - uv[1]
-    uv = uv.freeze()
-
-    has_rgb, has_normal, _ = getRgbNormalSettings(convertInfo.material.f3d_mat)
-    mesh = convertInfo.obj.data
-    color = getLoopColor(loop, mesh)
-    rgb = color[:3] if has_rgb else None
-    normal = getLoopNormal(loop) if has_normal else None
-    alpha = color[3]
-
-    return F3DVert(position, uv, rgb, normal, alpha)
+    uvs = np.where(np.isnan(uvs), np.float32(0), uvs)
+    uvs[:, 1] = np.float32(1) - uvs[:, 1]
+    return uvs
 
 
-def getLoopNormal(loop: bpy.types.MeshLoop) -> Vector:
+def getLoopNormals(normals: np.ndarray) -> np.ndarray:
     # Have to quantize to something because F3DVerts will be compared, and we
     # don't want floating-point inaccuracy causing "same" vertices not to be
     # merged. But, it hasn't been transformed yet, so quantizing to s8 here will
     # lose some accuracy.
-    return Vector(
-        (
-            round(loop.normal[0] * 2**16) / 2**16,
-            round(loop.normal[1] * 2**16) / 2**16,
-            round(loop.normal[2] * 2**16) / 2**16,
-        )
-    ).freeze()
+    return np.rint(normals.astype(np.float64) * 2**16) / 2**16
 
 
 @functools.lru_cache(0)
@@ -1220,19 +1380,16 @@ def is3_2_or_above():
     return bpy.app.version >= (3, 2, 0)
 
 
-def getLoopColor(loop: bpy.types.MeshLoop, mesh: bpy.types.Mesh) -> Vector:
-    color_layer = getColorLayer(mesh, layer="Col")
-    alpha_layer = getColorLayer(mesh, layer="Alpha")
-
-    if color_layer is not None:
+def convertLoopColor(color, alphaColor) -> Vector:
+    if color is not None:
         # Apparently already gamma corrected to linear
-        normalizedRGB = color_layer[loop.index].color
+        normalizedRGB = color
         if is3_2_or_above():
             normalizedRGB = gammaCorrect(normalizedRGB)
     else:
         normalizedRGB = [1, 1, 1]
-    if alpha_layer is not None:
-        normalizedAColor = alpha_layer[loop.index].color
+    if alphaColor is not None:
+        normalizedAColor = alphaColor
         if is3_2_or_above():
             normalizedAColor = gammaCorrect(normalizedAColor)
         normalizedA = colorToLuminance(normalizedAColor[0:3])
@@ -1242,12 +1399,33 @@ def getLoopColor(loop: bpy.types.MeshLoop, mesh: bpy.types.Mesh) -> Vector:
     return mathutils.Vector((normalizedRGB[0], normalizedRGB[1], normalizedRGB[2], normalizedA))
 
 
-def createTriangleCommands(triangles, vertexBuffer, useSP2Triangle):
-    triangles = copy.deepcopy(triangles)
+def getUniqueLoopColors(arrays: MeshArrays) -> tuple[list[tuple[tuple, float]], np.ndarray]:
+    """
+    convertLoopColor of every loop as (rgb, alpha), evaluated once per unique color so that results are exact.
+    Returns the unique colors and the index of each loop's color.
+    """
+    layers = [layer for layer in (arrays.colors, arrays.alphas) if layer is not None]
+    if len(layers) == 0:
+        color = convertLoopColor(None, None)
+        return [(color[:3], color[3])], np.zeros(len(arrays.loop_vertices), dtype=np.int64)
+
+    rawColors = np.ascontiguousarray(np.concatenate(layers, axis=1))
+    rowType = np.dtype((np.void, rawColors.itemsize * rawColors.shape[1]))
+    unique, inverse = np.unique(rawColors.view(rowType).ravel(), return_inverse=True)
+    colors = []
+    for values in unique.view(np.float32).reshape(-1, rawColors.shape[1]).tolist():
+        color = convertLoopColor(
+            values[:4] if arrays.colors is not None else None, values[-4:] if arrays.alphas is not None else None
+        )
+        colors.append((color[:3], color[3]))
+    return colors, inverse.reshape(-1)
+
+
+def createTriangleCommands(triangles, vertIndices: dict[BufferVertex, int], useSP2Triangle):
     commands = []
 
     def getIndices(tri):
-        return [vertexBuffer.index(v) for v in tri]
+        return [vertIndices[v] for v in tri]
 
     t = 0
     while t < len(triangles):
@@ -1817,6 +1995,7 @@ def exportF3DtoC(dirPath, obj, DLFormat, transformMatrix, texDir, savePNG, texSe
     if inline:
         bleed_gfx = BleedGraphics()
         bleed_gfx.bleed_fModel(fModel, fMeshes)
+    merge_identical_lists(fModel)
 
     modelDirPath = os.path.join(dirPath, toAlnum(name))
 
@@ -1844,13 +2023,21 @@ def exportF3DtoC(dirPath, obj, DLFormat, transformMatrix, texDir, savePNG, texSe
         )
 
     if texSeparate:
-        texCFile = open(os.path.join(modelDirPath, "texture.inc.c"), "w", newline="\n")
-        texCFile.write(texC.source)
-        texCFile.close()
+        writeCDataSourceOnly(texC, os.path.join(modelDirPath, "texture.inc.c"))
 
     writeCData(staticData, os.path.join(modelDirPath, "header.h"), os.path.join(modelDirPath, "model.inc.c"))
 
 
+def analyzeF3DCost(obj, transformMatrix, name, matWriteMethod) -> dict[str, GfxStats]:
+    """Converts the object like exportF3DtoC without writing anything, and returns the cost of each draw list"""
+    fModel = FModel(name, DLFormat.Static, matWriteMethod)
+    fMeshes = exportF3DCommon(obj, fModel, transformMatrix, True, name, DLFormat.Static, False)
+    if bpy.context.scene.exportInlineF3D:
+        bleed_gfx = BleedGraphics()
+        bleed_gfx.bleed_fModel(fModel, fMeshes)
+    return analyze_fmodel(fModel)
+
+
 def removeDL(sourcePath, headerPath, DLName):
     DLDataC = readFile(sourcePath)
     originalDataC = DLDataC
@@ -1925,6 +2112,7 @@ class F3D_ExportDL(bpy.types.Operator):
             )
 
             self.report({"INFO"}, "Success!")
+            report_file_writes(self)
 
             applyRotation([obj], math.radians(-90), "X")
             return {"FINISHED"}  # must return a set
@@ -1938,6 +2126,58 @@ class F3D_ExportDL(bpy.types.Operator):
             return {"CANCELLED"}  # must return a set
 
 
+class F3D_AnalyzeDL(bpy.types.Operator):
+    bl_idname = "object.f3d_analyze_dl"
+    bl_label = "Analyze Display List Cost"
+    bl_description = (
+        "Estimate the vertex, texture load and state change costs of the selected object's display lists, "
+        "and write them to a .json and .txt report in the export path"
+    )
+    bl_options = {"REGISTER", "UNDO", "PRESET"}
+
+    def execute(self, context):
+        if context.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+        try:
+            allObjs = context.selected_objects
+            if len(allObjs) == 0:
+                raise PluginError("No objects selected.")
+            obj = context.selected_objects[0]
+            if obj.type != "MESH":
+                raise PluginError("Object is not a mesh.")
+
+            scaleValue = bpy.context.scene.blenderF3DScale
+            finalTransform = mathutils.Matrix.Diagonal(mathutils.Vector((scaleValue, scaleValue, scaleValue))).to_4x4()
+        except Exception as e:
+            raisePluginError(self, e)
+            return {"CANCELLED"}
+
+        try:
+            applyRotation([obj], math.radians(90), "X")
+
+            exportPath = bpy.path.abspath(context.scene.DLExportPath)
+            DLName = toAlnum(bpy.context.scene.DLName)
+            matWriteMethod = getWriteMethodFromEnum(context.scene.matWriteMethod)
+            results = analyzeF3DCost(obj, finalTransform, DLName, matWriteMethod)
+
+            print(get_gfx_report_text(results))
+            reportPath = os.path.join(exportPath, DLName + "_cost")
+            write_gfx_report(results, reportPath + ".json", reportPath + ".txt")
+            self.report({"INFO"}, f"Cost report written to {reportPath}.txt")
+            report_file_writes(self)
+
+            applyRotation([obj], math.radians(-90), "X")
+            return {"FINISHED"}
+
+        except Exception as e:
+            if context.mode != "OBJECT":
+                bpy.ops.object.mode_set(mode="OBJECT")
+            applyRotation([obj], math.radians(-90), "X")
+
+            raisePluginError(self, e)
+            return {"CANCELLED"}
+
+
 class F3D_ExportDLPanel(bpy.types.Panel):
     bl_idname = "F3D_PT_export_dl"
     bl_label = "F3D Exporter"
@@ -1954,6 +2194,7 @@ class F3D_ExportDLPanel(bpy.types.Panel):
     def draw(self, context):
         col = self.layout.column()
         col.operator(F3D_ExportDL.bl_idname)
+        col.operator(F3D_AnalyzeDL.bl_idname)
 
         prop_split(col, context.scene, "DLName", "Name")
         prop_split(col, context.scene, "DLExportPath", "Export Path")
@@ -1968,6 +2209,7 @@ class F3D_ExportDLPanel(bpy.types.Panel):
 
 f3d_writer_classes = (
     F3D_ExportDL,
+    F3D_AnalyzeDL,
     F3D_ExportDLPanel,
 )
 
@@ -16,7 +16,9 @@ class GameData:
         from .z64.utility import getObjectList
 
         if game_editor_mode is not None and game_editor_mode in {"OOT", "MM"}:
-            self.z64.update(None, game_editor_mode, True)
+            # the game's data only needs to be rebuilt when switching to the other game
+            if game_editor_mode != self.z64.game:
+                self.z64.update(None, game_editor_mode, True)
 
             # ensure `currentCutsceneIndex` is set to a correct value
             if bpy.context.scene.gameEditorMode in {"OOT", "MM"}:
@@ -1,6 +1,5 @@
 import bpy
 from bpy.types import Operator
-from ..mk64_model_classes import MK64F3DContext, parse_course_vtx
 from ...f3d.f3d_material import createF3DMat
 from ...f3d.f3d_gbi import get_F3D_GBI
 from ...f3d.f3d_parser import getImportData, importMeshC
@@ -17,6 +16,8 @@ class MK64_ImportCourseDL(Operator):
     # Called on demand (i.e. button press, menu item)
     # Can also be called from operator search menu (Spacebar)
     def execute(self, context):
+        from ..mk64_model_classes import MK64F3DContext, parse_course_vtx
+
         obj = None
         if context.mode != "OBJECT":
             bpy.ops.object.mode_set(mode="OBJECT")
@@ -8,12 +8,11 @@ from bpy.utils import register_class, unregister_class
 from bpy.props import IntProperty, StringProperty
 
 from .utility import (
-    cleanupTempMeshes,
+    ExportObjectData,
     get_mode_set_from_context_mode,
     raisePluginError,
+    report_file_writes,
     parentObject,
-    store_original_meshes,
-    store_original_mtx,
     deselectAllObjects,
 )
 from .f3d.f3d_material import createF3DMat
@@ -69,6 +68,7 @@ class OperatorBase(Operator):
                     print(Stats(profile).strip_dirs().sort_stats(SortKey.CUMULATIVE).print_stats())
             else:
                 self.execute_operator(context)
+            report_file_writes(self)
             return {"FINISHED"}
         except Exception as exc:
             raisePluginError(self, exc)
@@ -271,9 +271,6 @@ class WarningOperator(bpy.types.Operator):
 class ObjectDataExporter(WarningOperator):
     """Operator that uses warnings and can store original matrixes and meshes for use in exporting"""
 
-    def store_object_data(self):
-        store_original_mtx()
-        store_original_meshes(self.add_warning)
-
-    def cleanup_temp_object_data(self):
-        cleanupTempMeshes()
+    def object_data(self):
+        """Context manager that keeps the original matrices and instanced meshes for the length of the export"""
+        return ExportObjectData(self.add_warning)
@@ -120,6 +120,9 @@ def draw_repo_settings(layout: UILayout, context: Context):
     if scene.f3d_type in {"F3DEX3", "T3D"}:
         prop_split(col, scene, "packed_normals_algorithm", "Packed normals alg")
     col.prop(scene, "saveTextures")
+    col.prop(fast64_settings, "optimize_vertex_loads")
+    col.prop(fast64_settings, "optimize_draw_order")
+    col.prop(fast64_settings, "merge_identical_lists")
     col.prop(fast64_settings, "auto_pick_texture_format")
     if fast64_settings.auto_pick_texture_format:
         col.prop(fast64_settings, "prefer_rgba_over_ci")
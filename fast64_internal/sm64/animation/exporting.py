@@ -10,6 +10,7 @@ from bpy.path import abspath
 from mathutils import Euler, Quaternion
 
 from ...utility import (
+    writeFile,
     PluginError,
     bytesToHex,
     encodeSegmentedAddr,
@@ -514,7 +515,7 @@ def update_enum_file(path: Path, override_files: bool, table: SM64_AnimTable):
     if not existing_file:
         print(f"Creating enum list file at {path}.")
     text = text[: table.enum_list_start] + content + text[table.enum_list_end :]
-    path.write_text(text)
+    writeFile(path, text)
 
 
 def update_table_file(
@@ -643,7 +644,7 @@ def update_table_file(
     if not existing_file:
         print(f"Creating table file at {table_path}.")
     text = text[: table.start] + content + text[table.end :]
-    table_path.write_text(text)
+    writeFile(table_path, text)
 
 
 def update_data_file(path: Path, anim_file_names: list[str], override_files: bool = False):
@@ -799,7 +800,7 @@ def export_animation_table_c(
         files_data = table.data_and_headers_to_c(anim_props.is_dma)
         print("Saving all generated data files")
         for file_name, file_data in files_data.items():
-            (anim_directory / file_name).write_text(file_data)
+            writeFile(anim_directory / file_name, file_data)
             print(file_name)
         if not anim_props.is_dma:
             update_data_file(
@@ -810,7 +811,7 @@ def export_animation_table_c(
     else:
         result = table.data_and_headers_to_c_combined()
         print("Saving generated data file")
-        (anim_directory / "data.inc.c").write_text(result)
+        writeFile(anim_directory / "data.inc.c", result)
     print("All animation data files exported.")
     if anim_props.is_dma:  # Don´t create an actual table and or update includes for dma exports
         return
@@ -912,7 +913,7 @@ def export_animation_c(
         anim_props, combined_props, actor_name, decomp
     )
 
-    (anim_directory / animation.file_name).write_text(animation.to_c(anim_props.is_dma))
+    writeFile(anim_directory / animation.file_name, animation.to_c(anim_props.is_dma))
 
     if anim_props.is_dma:  # Don´t create an actual table and don´t update includes for dma exports
         return
@@ -11,7 +11,6 @@ from ...utility import copyPropertyGroup
 from ...utility_anim import get_action
 
 from .importing import import_animations, get_enum_from_import_preset
-from .exporting import export_animation, export_animation_table
 from .utility import (
     animation_operator_checks,
     check_for_headers_in_table,
@@ -292,6 +291,8 @@ class SM64_ExportAnimTable(OperatorBase):
         return get_anim_obj(context) is not None
 
     def execute_operator(self, context):
+        from .exporting import export_animation_table
+
         animation_operator_checks(context)
         export_animation_table(context, context.object)
         self.report({"INFO"}, "Exported animation table successfully!")
@@ -310,6 +311,8 @@ class SM64_ExportAnim(OperatorBase):
         return get_anim_obj(context) is not None
 
     def execute_operator(self, context):
+        from .exporting import export_animation
+
         animation_operator_checks(context)
         export_animation(context, context.object)
         self.report({"INFO"}, "Exported animation successfully!")
@@ -1,30 +1,35 @@
 from re import search
+import gzip
+import json
 
 refresh_name = "Refresh 16"
 function_map_path = "./sm64.us.map"
-output_map_path = "./sm64_function_map_output.py"
+output_map_path = "./sm64_function_map.json.gz"
 
 
 def parse_func_map():
-    mapfile = open(function_map_path, "r")
-    outfile = open(output_map_path, "w")
-
-    outfile.write('\t"' + refresh_name + '" : {\n')
-
-    nextLine = mapfile.readline()
-    while nextLine != "" and nextLine != "Linker script and memory map\n":
+    """Adds or replaces the refresh's functions in the compressed function map used by convert_addr_to_func"""
+    refresh_map = {}
+    with open(function_map_path, "r") as mapfile:
         nextLine = mapfile.readline()
-    while nextLine != "" and nextLine not in {
-        " build/us/src/menu/level_select_menu.o(.text)\n",
-        " build/us/src/menu/title_screen.o(.text)\n",
-    }:
-        if nextLine[:17] == " " * 16 + "0":
-            outfile.write('\t\t"' + nextLine[26:34] + '" : ')
-            searchName = nextLine[34:]
-            searchResult = search(r"\s*(\S*).*", searchName)
-            outfile.write('"' + searchResult.group(1) + '",\n')
-        nextLine = mapfile.readline()
-    outfile.write("\t}\n")
+        while nextLine != "" and nextLine != "Linker script and memory map\n":
+            nextLine = mapfile.readline()
+        while nextLine != "" and nextLine not in {
+            " build/us/src/menu/level_select_menu.o(.text)\n",
+            " build/us/src/menu/title_screen.o(.text)\n",
+        }:
+            if nextLine[:17] == " " * 16 + "0":
+                searchName = nextLine[34:]
+                searchResult = search(r"\s*(\S*).*", searchName)
+                refresh_map[nextLine[26:34]] = searchResult.group(1)
+            nextLine = mapfile.readline()
+
+    try:
+        with gzip.open(output_map_path, "rt", encoding="utf-8") as file:
+            func_map = json.load(file)
+    except FileNotFoundError:
+        func_map = {}
+    func_map[refresh_name] = dict(sorted(refresh_map.items()))
 
-    mapfile.close()
-    outfile.close()
+    with gzip.GzipFile(output_map_path, "wb", compresslevel=9, mtime=0) as file:
+        file.write(json.dumps(func_map, indent=0, separators=(",", ":")).encode("utf-8"))
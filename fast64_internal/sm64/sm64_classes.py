@@ -7,7 +7,7 @@ import struct
 import os
 import numpy as np
 
-from ..utility import intToHex, decodeSegmentedAddr, PluginError, toAlnum
+from ..utility import intToHex, decodeSegmentedAddr, PluginError, toAlnum, write_if_changed
 from .sm64_constants import insertableBinaryTypes, SegmentData
 from .sm64_utility import export_rom_checks, temp_file_path
 
@@ -20,7 +20,7 @@ class InsertableBinaryData:
     ptrs: list[int] = dataclasses.field(default_factory=list)
 
     def write(self, path: Path):
-        path.write_bytes(self.to_binary())
+        write_if_changed(path, self.to_binary())
 
     def to_binary(self):
         data = bytearray()
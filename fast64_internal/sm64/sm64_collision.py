@@ -10,10 +10,12 @@ from .sm64_rom_tweaks import ExtendBank0x04
 from ..panels import SM64_Panel
 
 from ..utility import (
+    writeFile,
     PluginError,
     CData,
     toAlnum,
     raisePluginError,
+    report_file_writes,
     encodeSegmentedAddr,
     get64bitAlignedAddr,
     prop_split,
@@ -27,7 +29,6 @@ from ..utility import (
     tempName,
     bytesToHex,
     applyRotation,
-    selectSingleObject,
 )
 
 
@@ -109,7 +110,6 @@ class Collision:
     def set_addr(self, startAddress):
         startAddress = get64bitAlignedAddr(startAddress)
         self.startAddress = startAddress
-        print("Collision " + self.name + ": " + str(startAddress) + ", " + str(self.size()))
         return startAddress, startAddress + self.size()
 
     def save_binary(self, romfile):
@@ -300,25 +300,19 @@ def exportCollisionC(
 
     colPath = os.path.join(colDirPath, "collision.inc.c")
 
-    fileObj = open(colPath, "w", newline="\n")
     collision = exportCollisionCommon(obj, transformMatrix, includeSpecials, includeChildren, name, None)
     collisionC = collision.to_c()
-    fileObj.write(collisionC.source)
-    fileObj.close()
+    writeFile(colPath, collisionC.source)
 
     cDefine = collisionC.header
     if writeRoomsFile:
         roomsData = collision.to_c_rooms()
         cDefine += roomsData.header
         roomsPath = os.path.join(colDirPath, "rooms.inc.c")
-        roomsFile = open(roomsPath, "w", newline="\n")
-        roomsFile.write(roomsData.source)
-        roomsFile.close()
+        writeFile(roomsPath, roomsData.source)
 
     headerPath = os.path.join(colDirPath, "collision_header.h")
-    cDefFile = open(headerPath, "w", newline="\n")
-    cDefFile.write(cDefine)
-    cDefFile.close()
+    writeFile(headerPath, cDefine)
 
     data_includes = [Path("collision.inc.c")]
     if writeRoomsFile:
@@ -359,8 +353,6 @@ def exportCollisionInsertableBinary(obj, transformMatrix, filepath, includeSpeci
 
 
 def exportCollisionCommon(obj, transformMatrix, includeSpecials, includeChildren, name, areaIndex):
-    selectSingleObject(obj)
-
     # dict of collisionType : faces
     collisionDict = {}
     # addCollisionTriangles(obj, collisionDict, includeChildren, transformMatrix, areaIndex)
@@ -370,26 +362,17 @@ def exportCollisionCommon(obj, transformMatrix, includeSpecials, includeChildren
         if not collisionDict:
             raise PluginError("No collision data to export", PluginError.exc_warn)
         cleanupDuplicatedObjects(allObjs)
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
     except Exception as e:
         cleanupDuplicatedObjects(allObjs)
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
         raise Exception(str(e))
 
     collision = Collision(toAlnum(name) + "_collision")
+    # rounded position : index, welds vertices shared between faces of any collision type
+    vertIndices = {}
     for collisionType, faces in collisionDict.items():
         collision.triangles[collisionType] = []
         for faceVerts, specialParam, room in faces:
-            indices = []
-            for roundedPosition in faceVerts:
-                index = collisionVertIndex(roundedPosition, collision.vertices)
-                if index is None:
-                    collision.vertices.append(CollisionVertex(roundedPosition))
-                    indices.append(len(collision.vertices) - 1)
-                else:
-                    indices.append(index)
+            indices = [collisionVertIndex(position, collision.vertices, vertIndices) for position in faceVerts]
             collision.triangles[collisionType].append(CollisionTriangle(indices, specialParam, room))
     if includeSpecials:
         area = SM64_Area(areaIndex, "", "", "", None, None, [], name, None)
@@ -407,16 +390,21 @@ def addCollisionTriangles(obj, collisionDict, includeChildren, transformMatrix,
         if len(obj.data.materials) == 0:
             raise PluginError(obj.name + " must have a material associated with it.")
         obj.data.calc_loop_triangles()
+        roundedPositions = [roundPosition(transformMatrix @ vert.co) for vert in obj.data.vertices]
+        materialInfo = {}  # material index : (collision type, special param)
         for face in obj.data.loop_triangles:
-            material = obj.material_slots[face.material_index].material
-            colType = material.collision_type if material.collision_all_options else material.collision_type_simple
-            if colType == "Custom":
-                colType = material.collision_custom
-            specialParam = material.collision_param if material.use_collision_param else None
-
-            (x1, y1, z1) = roundPosition(transformMatrix @ obj.data.vertices[face.vertices[0]].co)
-            (x2, y2, z2) = roundPosition(transformMatrix @ obj.data.vertices[face.vertices[1]].co)
-            (x3, y3, z3) = roundPosition(transformMatrix @ obj.data.vertices[face.vertices[2]].co)
+            if face.material_index not in materialInfo:
+                material = obj.material_slots[face.material_index].material
+                colType = material.collision_type if material.collision_all_options else material.collision_type_simple
+                if colType == "Custom":
+                    colType = material.collision_custom
+                specialParam = material.collision_param if material.use_collision_param else None
+                materialInfo[face.material_index] = (colType, specialParam)
+            colType, specialParam = materialInfo[face.material_index]
+
+            (x1, y1, z1) = roundedPositions[face.vertices[0]]
+            (x2, y2, z2) = roundedPositions[face.vertices[1]]
+            (x3, y3, z3) = roundedPositions[face.vertices[2]]
 
             nx = (y2 - y1) * (z3 - z2) - (z2 - z1) * (y3 - y2)
             ny = (z2 - z1) * (x3 - x2) - (x2 - x1) * (z3 - z2)
@@ -442,12 +430,13 @@ def roundPosition(position):
     return (int(round(position[0])), int(round(position[1])), int(round(position[2])))
 
 
-def collisionVertIndex(vert, vertArray):
-    for i in range(len(vertArray)):
-        colVert = vertArray[i]
-        if colVert.position == vert:
-            return i
-    return None
+def collisionVertIndex(vert, vertArray, vertIndices):
+    """Returns the index of vert in vertArray, adding it first if it is not there yet"""
+    index = vertIndices.get(vert)
+    if index is None:
+        index = vertIndices[vert] = len(vertArray)
+        vertArray.append(CollisionVertex(vert))
+    return index
 
 
 class SM64_ExportCollision(bpy.types.Operator):
@@ -501,6 +490,7 @@ class SM64_ExportCollision(bpy.types.Operator):
                     level_name,
                 )
                 self.report({"INFO"}, "Success!")
+                report_file_writes(self)
             elif context.scene.fast64.sm64.export_type == "Insertable Binary":
                 exportCollisionInsertableBinary(
                     obj,
@@ -510,6 +500,7 @@ class SM64_ExportCollision(bpy.types.Operator):
                     context.scene.colIncludeChildren,
                 )
                 self.report({"INFO"}, "Success! Collision at " + context.scene.colInsertableBinaryPath)
+                report_file_writes(self)
             else:
                 tempROM = tempName(context.scene.fast64.sm64.output_rom)
                 export_rom_checks(bpy.path.abspath(context.scene.fast64.sm64.export_rom))
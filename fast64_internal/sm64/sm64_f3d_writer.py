@@ -1,7 +1,6 @@
 from pathlib import Path
 import shutil, copy, bpy, re, os
 from typing import NamedTuple
-from io import BytesIO
 from math import ceil, log, radians
 from mathutils import Matrix, Vector
 from bpy.utils import register_class, unregister_class
@@ -31,6 +30,7 @@ from .sm64_rom_tweaks import ExtendBank0x04
 from .sm64_geolayout_classes import BaseDisplayListNode
 
 from ..f3d.f3d_bleed import BleedGraphics
+from ..f3d.f3d_dedup import merge_identical_lists
 
 from ..f3d.f3d_gbi import (
     DPSetCombineMode,
@@ -63,10 +63,13 @@ from ..f3d.f3d_gbi import (
 )
 
 from ..utility import (
+    writeFile,
+    writeCDataSourceOnly,
     CData,
     CScrollData,
     PluginError,
     raisePluginError,
+    report_file_writes,
     prop_split,
     encodeSegmentedAddr,
     applyRotation,
@@ -77,6 +80,7 @@ from ..utility import (
     writeMaterialFiles,
     get64bitAlignedAddr,
     writeInsertableFile,
+    BinaryImage,
     getPathAndLevel,
     applyBasicTweaks,
     tempName,
@@ -241,9 +245,7 @@ def exportTexRectToC(dirPath, texProp, texDir, savePNG, name, exportToProject, p
         )
         singleFileData += data
         singleFilePath = os.path.join(dirPath, fTexRect.name + ".c")
-        singleFile = open(singleFilePath, "w", newline="\n")
-        singleFile.write(singleFileData)
-        singleFile.close()
+        writeFile(singleFilePath, singleFileData)
 
     if bpy.context.mode != "OBJECT":
         bpy.ops.object.mode_set(mode="OBJECT")
@@ -383,6 +385,7 @@ def sm64ExportF3DtoC(
     if inline:
         bleed_gfx = BleedGraphics()
         bleed_gfx.bleed_fModel(fModel, fMeshes)
+    merge_identical_lists(fModel)
 
     modelDirPath = os.path.join(dirPath, toAlnum(name))
 
@@ -420,19 +423,13 @@ def sm64ExportF3DtoC(
         )
 
     if texSeparate:
-        texCFile = open(os.path.join(modelDirPath, "texture.inc.c"), "w", newline="\n")
-        texCFile.write(texC.source)
-        texCFile.close()
+        writeCDataSourceOnly(texC, os.path.join(modelDirPath, "texture.inc.c"))
 
     modelPath = os.path.join(modelDirPath, "model.inc.c")
-    outFile = open(modelPath, "w", newline="\n")
-    outFile.write(staticData.source)
-    outFile.close()
+    writeCDataSourceOnly(staticData, modelPath)
 
     headerPath = os.path.join(modelDirPath, "header.h")
-    cDefFile = open(headerPath, "w", newline="\n")
-    cDefFile.write(staticData.header)
-    cDefFile.close()
+    writeFile(headerPath, staticData.header)
 
     update_actor_includes(
         headerType, groupName, Path(dirPath), name, levelName, [Path("model.inc.c")], [Path("header.h")]
@@ -489,6 +486,7 @@ def exportF3DtoBinary(romfile, exportRange, transformMatrix, obj, segmentData, i
     if inline:
         bleed_gfx = BleedGraphics()
         bleed_gfx.bleed_fModel(fModel, fMeshes)
+    merge_identical_lists(fModel)
     fModel.freePalettes()
     assert len(fMeshes) == 1, "Less or more than one fmesh"
     fMesh = list(fMeshes.values())[0]
@@ -498,7 +496,9 @@ def exportF3DtoBinary(romfile, exportRange, transformMatrix, obj, segmentData, i
         raise PluginError(
             "Size too big: Data ends at " + hex(addrRange[1]) + ", which is larger than the specified range."
         )
-    fModel.save_binary(romfile, segmentData)
+    image = BinaryImage.from_file(romfile, addrRange[0], addrRange[1])
+    fModel.save_binary(image, segmentData)
+    image.save(romfile)
     if bpy.context.mode != "OBJECT":
         bpy.ops.object.mode_set(mode="OBJECT")
 
@@ -515,6 +515,7 @@ def exportF3DtoBinaryBank0(romfile, exportRange, transformMatrix, obj, RAMAddr,
     if inline:
         bleed_gfx = BleedGraphics()
         bleed_gfx.bleed_fModel(fModel, fMeshes)
+    merge_identical_lists(fModel)
     fModel.freePalettes()
     assert len(fMeshes) == 1, "Less or more than one fmesh"
     fMesh = list(fMeshes.values())[0]
@@ -543,6 +544,7 @@ def exportF3DtoInsertableBinary(filepath, transformMatrix, obj, includeChildren)
     if inline:
         bleed_gfx = BleedGraphics()
         bleed_gfx.bleed_fModel(fModel, fMeshes)
+    merge_identical_lists(fModel)
     fModel.freePalettes()
     assert len(fMeshes) == 1, "Less or more than one fmesh"
     fMesh = list(fMeshes.values())[0]
@@ -564,13 +566,9 @@ def getBinaryBank0F3DData(fModel, RAMAddr, exportRange):
             "Size too big: Data ends at " + hex(addrRange[1]) + ", which is larger than the specified range."
         )
 
-    bytesIO = BytesIO()
-    # actualRAMAddr = get64bitAlignedAddr(RAMAddr)
-    bytesIO.seek(RAMAddr)
-    fModel.save_binary(bytesIO, segmentData)
-    data = bytesIO.getvalue()[RAMAddr:]
-    bytesIO.close()
-    return data, RAMAddr
+    image = BinaryImage(RAMAddr, addrRange[1])
+    fModel.save_binary(image, segmentData)
+    return bytes(image.data), RAMAddr
 
 
 class SM64_ExportDL(bpy.types.Operator):
@@ -631,6 +629,7 @@ class SM64_ExportDL(bpy.types.Operator):
 
                 starSelectWarning(self, fileStatus)
                 self.report({"INFO"}, "Success!")
+                report_file_writes(self)
 
             elif context.scene.fast64.sm64.export_type == "Insertable Binary":
                 exportF3DtoInsertableBinary(
@@ -640,6 +639,7 @@ class SM64_ExportDL(bpy.types.Operator):
                     bpy.context.scene.DLincludeChildren,
                 )
                 self.report({"INFO"}, "Success! DL at " + context.scene.DLInsertableBinaryPath + ".")
+                report_file_writes(self)
             else:
                 export_rom_checks(bpy.path.abspath(context.scene.fast64.sm64.export_rom))
                 tempROM = tempName(context.scene.fast64.sm64.output_rom)
@@ -812,6 +812,7 @@ class ExportTexRectDraw(bpy.types.Operator):
                 )
 
                 self.report({"INFO"}, "Success!")
+                report_file_writes(self)
         except Exception as e:
             raisePluginError(self, e)
             return {"CANCELLED"}
@@ -173,7 +173,6 @@ class GeolayoutGraph:
         for geolayout in self.sortedList:
             geolayout.startAddress = address
             address += geolayout.size()
-            print(geolayout.name + " - " + str(geolayout.startAddress))
         return address
 
     def to_binary(self, segmentData):
@@ -4,7 +4,6 @@ import typing
 
 import bpy, mathutils, math, copy, os, shutil, re
 from bpy.utils import register_class, unregister_class
-from io import BytesIO
 
 from ..operators import ObjectDataExporter
 from ..panels import SM64_Panel
@@ -18,11 +17,14 @@ from .sm64_rom_tweaks import ExtendBank0x04
 from .sm64_utility import export_rom_checks, starSelectWarning, update_actor_includes, write_material_headers
 
 from ..utility import (
+    writeFile,
+    writeCDataSourceOnly,
     PluginError,
     VertexWeightError,
     z_up_to_y_up_matrix,
     setOrigin,
     raisePluginError,
+    report_file_writes,
     findStartBones,
     duplicateHierarchy,
     cleanupDuplicatedObjects,
@@ -32,6 +34,7 @@ from ..utility import (
     get64bitAlignedAddr,
     encodeSegmentedAddr,
     writeInsertableFile,
+    BinaryImage,
     bytesToHex,
     checkSM64EmptyUsesGeoLayout,
     convertEulerFloatToShort,
@@ -41,7 +44,7 @@ from ..utility import (
     translate_blender_to_n64,
     rotate_quat_blender_to_n64,
     get_obj_temp_mesh,
-    getGroupNameFromIndex,
+    get_export_object_data,
     highlightWeightErrors,
     getGroupIndexFromname,
     getFMeshName,
@@ -60,6 +63,7 @@ from ..utility import (
 from ..f3d.f3d_bleed import (
     find_material_from_jump_cmd,
 )
+from ..f3d.f3d_dedup import merge_identical_lists
 
 from ..f3d.f3d_material import (
     isTexturePointSampled,
@@ -67,7 +71,6 @@ from ..f3d.f3d_material import (
 
 from ..f3d.f3d_writer import (
     TriangleConverterInfo,
-    LoopConvertInfo,
     BufferVertex,
     revertMatAndEndDraw,
     getInfoDict,
@@ -77,7 +80,6 @@ from ..f3d.f3d_writer import (
     saveOrGetF3DMaterial,
     saveMeshWithLargeTexturesByFaces,
     saveMeshByFaces,
-    getF3DVert,
 )
 
 from ..f3d.f3d_gbi import (
@@ -291,9 +293,7 @@ def replaceDLReferenceInGeo(geoPath, pattern, replacement):
 
     newData = re.sub(pattern, replacement, geoData, flags=re.DOTALL)
     if newData != geoData:
-        geoFile = open(geoPath, "w", newline="\n")
-        geoFile.write(newData)
-        geoFile.close()
+        writeFile(geoPath, newData)
 
 
 def prepareGeolayoutExport(armatureObj, obj):
@@ -593,8 +593,6 @@ def convertObjectToGeolayout(
         raise Exception(str(e))
     finally:
         cleanupDuplicatedObjects(allObjs)
-        rootObj.select_set(True)
-        bpy.context.view_layer.objects.active = rootObj
 
     append_revert_to_geolayout(geolayoutGraph, fModel)
     add_overrides_to_fmodel(fModel)
@@ -715,6 +713,7 @@ def saveGeolayoutC(
     elif headerType == "Custom":
         scrollName = "geo_" + dirName
 
+    merge_identical_lists(fModel)
     gfxFormatter = SM64GfxFormatter(ScrollMethod.Vertex)
     if not customExport and headerType == "Level":
         texExportPath = dirPath
@@ -770,29 +769,21 @@ def saveGeolayoutC(
         )
 
     modelPath = os.path.join(geoDirPath, "model.inc.c")
-    modelFile = open(modelPath, "w", newline="\n")
-    modelFile.write(staticData.source)
-    modelFile.close()
+    writeCDataSourceOnly(staticData, modelPath)
 
     if texSeparate:
         texPath = os.path.join(geoDirPath, "texture.inc.c")
-        texFile = open(texPath, "w", newline="\n")
-        texFile.write(texC.source)
-        texFile.close()
+        writeCDataSourceOnly(texC, texPath)
 
     fModel.freePalettes()
 
     # save geolayout
     geoPath = os.path.join(geoDirPath, "geo.inc.c")
-    geoFile = open(geoPath, "w", newline="\n")
-    geoFile.write(geoData.source)
-    geoFile.close()
+    writeCDataSourceOnly(geoData, geoPath)
 
     # save header
     headerPath = os.path.join(geoDirPath, "geo_header.h")
-    cDefFile = open(headerPath, "w", newline="\n")
-    cDefFile.write(staticData.header)
-    cDefFile.close()
+    writeFile(headerPath, staticData.header)
 
     fileStatus = None
     update_actor_includes(
@@ -971,6 +962,7 @@ def saveGeolayoutBinaryBank0(
 
 
 def getBinaryBank0GeolayoutData(fModel, geolayoutGraph, RAMAddr, exportRange):
+    merge_identical_lists(fModel)
     fModel.freePalettes()
     segmentData = copy.copy(bank0Segment)
     startRAM = get64bitAlignedAddr(RAMAddr)
@@ -983,14 +975,10 @@ def getBinaryBank0GeolayoutData(fModel, geolayoutGraph, RAMAddr, exportRange):
         raise PluginError(
             "Size too big: Data ends at " + hex(addrEndInROM) + ", which is larger than the specified range."
         )
-    bytesIO = BytesIO()
-    # actualRAMAddr = get64bitAlignedAddr(RAMAddr)
-    geolayoutGraph.save_binary(bytesIO, segmentData)
-    fModel.save_binary(bytesIO, segmentData)
-
-    data = bytesIO.getvalue()[startRAM:]
-    bytesIO.close()
-    return data, startRAM
+    image = BinaryImage(startRAM, addrRange[1])
+    geolayoutGraph.save_binary(image, segmentData)
+    fModel.save_binary(image, segmentData)
+    return bytes(image.data), startRAM
 
 
 # Binary Export
@@ -1037,6 +1025,7 @@ def exportGeolayoutObjectBinary(
 def saveGeolayoutBinary(
     romfile, geolayoutGraph, fModel, exportRange, levelData, levelCommandPos, modelID, textDumpFilePath
 ):
+    merge_identical_lists(fModel)
     fModel.freePalettes()
 
     # Get length of data, then actually write it after relative addresses
@@ -1050,8 +1039,10 @@ def saveGeolayoutBinary(
         raise PluginError(
             "Size too big: Data ends at " + hex(addrRange[1]) + ", which is larger than the specified range."
         )
-    geolayoutGraph.save_binary(romfile, levelData)
-    fModel.save_binary(romfile, levelData)
+    image = BinaryImage.from_file(romfile, startAddress, addrRange[1])
+    geolayoutGraph.save_binary(image, levelData)
+    fModel.save_binary(image, levelData)
+    image.save(romfile)
 
     geoStart = geolayoutGraph.startGeolayout.startAddress
     segPointerData = encodeSegmentedAddr(geoStart, levelData)
@@ -1071,9 +1062,7 @@ def geoWriteLevelCommand(romfile, segPointerData, levelCommandPos, modelID):
 
 def geoWriteTextDump(textDumpFilePath, geolayoutGraph, levelData):
     if textDumpFilePath is not None:
-        openfile = open(textDumpFilePath, "w", newline="\n")
-        openfile.write(geolayoutGraph.toTextDump(levelData))
-        openfile.close()
+        writeFile(textDumpFilePath, geolayoutGraph.toTextDump(levelData))
 
 
 def generate_overrides(
@@ -1270,7 +1259,7 @@ def processInlineGeoNode(
         node = obj.fast64.sm64.custom.get_final_cmd(
             obj,
             bpy.context.scene.fast64.sm64.blender_to_sm64_scale,
-            z_up_to_y_up_matrix @ mathutils.Matrix(obj.get("original_mtx_world")) @ z_up_to_y_up_matrix.inverted(),
+            z_up_to_y_up_matrix @ get_export_object_data().get_original_mtx_world(obj) @ z_up_to_y_up_matrix.inverted(),
             local_matrix,
             obj.draw_layer_static,
             obj.useDLReference,
@@ -1323,12 +1312,13 @@ def processMesh(
     if not partOfGeolayout(obj) or obj.ignore_render:
         return
 
+    objectData = get_export_object_data()
     if isRoot:
         translate = mathutils.Vector((0, 0, 0))
         rotate = mathutils.Quaternion()
         scale = mathutils.Vector((1, 1, 1))
-    elif obj.get("original_mtx"):  # object is instanced or a transformation
-        orig_mtx = mathutils.Matrix(obj.get("original_mtx"))
+    elif objectData.get_original_mtx(obj) is not None:  # object is instanced or a transformation
+        orig_mtx = objectData.get_original_mtx(obj)
         translate, rotate, scale = orig_mtx.decompose()
         translate = translate_blender_to_n64(translate)
         rotate = rotate_quat_blender_to_n64(rotate)
@@ -1480,7 +1470,7 @@ def processMesh(
 
         if obj.type == "EMPTY":
             fMeshes = {}
-        elif obj.get("instanced_mesh_name"):
+        elif objectData.get_instanced_mesh_name(obj) is not None:
             temp_obj = get_obj_temp_mesh(obj)
             if temp_obj is None:
                 raise ValueError(
@@ -2073,14 +2063,14 @@ def processSwitchBoneMatOverrides(materialOverrides, switchBone):
             materialOverrides.append((None, (), int(switchOption.drawLayer), "All"))
 
 
-def getGroupIndex(vert, armatureObj, obj):
+def getGroupIndex(vert, obj, groupNames, boneGroups):
     actualGroups = []
     belowLimitGroups = []
     nonBoneGroups = []
     for group in vert.groups:
-        groupName = getGroupNameFromIndex(obj, group.group)
+        groupName = groupNames.get(group.group)
         if groupName is not None:
-            if groupName in armatureObj.data.bones:
+            if group.group in boneGroups:
                 if group.weight > 0.4:
                     actualGroups.append(group)
                 else:
@@ -2109,9 +2099,9 @@ def getGroupIndex(vert, armatureObj, obj):
                 highlightWeightErrors(obj, [vert], "VERT")
                 raise VertexWeightError(
                     "A vertex was found that was significantly weighted to multiple groups. Make sure each vertex only belongs to one group whose weight is greater than 0.5. ("
-                    + getGroupNameFromIndex(obj, group.group)
+                    + groupNames[group.group]
                     + ", "
-                    + getGroupNameFromIndex(obj, significantWeightGroup.group)
+                    + groupNames[significantWeightGroup.group]
                     + ")"
                 )
         if group.weight > vertGroup.weight:
@@ -2121,6 +2111,28 @@ def getGroupIndex(vert, armatureObj, obj):
     return vertGroup.group
 
 
+class VertexBoneGroups:
+    """The vertex group of the bone each vertex of a mesh belongs to, found in one pass over the mesh"""
+
+    def __init__(self, obj, armatureObj):
+        groupNames = {group.index: group.name for group in obj.vertex_groups}
+        boneGroups = {index for index, name in groupNames.items() if name in armatureObj.data.bones}
+
+        self.groupIndices = []  # vertex index : vertex group index
+        self.groupVerts = {}  # vertex group index : vertex indices
+        for vert in obj.data.vertices:
+            groupIndex = getGroupIndex(vert, obj, groupNames, boneGroups)
+            self.groupIndices.append(groupIndex)
+            self.groupVerts.setdefault(groupIndex, []).append(vert.index)
+
+
+def getVertexBoneGroups(infoDict, obj, armatureObj) -> VertexBoneGroups:
+    # every bone of an armature is exported from the same mesh info, so the vertices are only partitioned once
+    if armatureObj.name not in infoDict.vertexBoneGroups:
+        infoDict.vertexBoneGroups[armatureObj.name] = VertexBoneGroups(obj, armatureObj)
+    return infoDict.vertexBoneGroups[armatureObj.name]
+
+
 class SimpleSkinnedFace:
     def __init__(self, bFace, loopsInGroup, loopsNotInGroup):
         self.bFace = bFace
@@ -2307,9 +2319,8 @@ def saveModelGivenVertexGroup(
 
     mesh = obj.data
     currentGroupIndex = getGroupIndexFromname(obj, vertexGroup)
-    vertIndices = [
-        vert.index for vert in obj.data.vertices if getGroupIndex(vert, armatureObj, obj) == currentGroupIndex
-    ]
+    vertexBoneGroups = getVertexBoneGroups(infoDict, obj, armatureObj)
+    vertIndices = vertexBoneGroups.groupVerts.get(currentGroupIndex, [])
     parentGroupIndex = getGroupIndexFromname(obj, parentGroup) if parentGroup is not None else -1
 
     if len(vertIndices) == 0:
@@ -2325,9 +2336,9 @@ def saveModelGivenVertexGroup(
 
     groupFaces = {}  # draw layer : {material_index : [faces]}
     skinnedFaces = {}  # draw layer : {material_index : [skinned faces]}
-    handledFaces = []
+    handledFaces = set()
     usedDrawLayers = set()
-    ancestorGroups = {}  # vertexGroup : ancestor list
+    ancestorGroups = None  # groups of the bones that aren't ancestors of this one
 
     for vertIndex in vertIndices:
         if vertIndex not in infoDict.vert:
@@ -2343,7 +2354,7 @@ def saveModelGivenVertexGroup(
             if face in handledFaces:
                 continue
             else:
-                handledFaces.append(face)
+                handledFaces.add(face)
 
             loopsInGroup = []
             loopsNotInGroup = []
@@ -2351,15 +2362,15 @@ def saveModelGivenVertexGroup(
 
             # loop is interpreted as face + loop index
             for i in range(3):
-                vertGroupIndex = getGroupIndex(mesh.vertices[face.vertices[i]], armatureObj, obj)
-                if vertGroupIndex not in ancestorGroups:
-                    ancestorGroups[vertGroupIndex] = getAncestorGroups(parentGroup, vertexGroup, armatureObj, obj)
+                vertGroupIndex = vertexBoneGroups.groupIndices[face.vertices[i]]
+                if ancestorGroups is None:
+                    ancestorGroups = set(getAncestorGroups(parentGroup, vertexGroup, armatureObj, obj))
 
                 if vertGroupIndex == currentGroupIndex:
                     loopsInGroup.append((face, mesh.loops[face.loops[i]]))
                 elif vertGroupIndex == parentGroupIndex:
                     loopsNotInGroup.append((face, mesh.loops[face.loops[i]]))
-                elif vertGroupIndex not in ancestorGroups[vertGroupIndex]:
+                elif vertGroupIndex not in ancestorGroups:
                     # Only want to handle skinned faces connected to parent
                     isChildSkinnedFace = True
                     break
@@ -2654,17 +2665,6 @@ def save_override_draw(
         override.nodes.append(node)
 
 
-def findVertIndexInBuffer(loop, buffer, loopDict):
-    i = 0
-    for material_index, vertData in buffer:
-        for f3dVert in vertData:
-            if f3dVert == loopDict[loop]:
-                return i
-            i += 1
-    # print("Can't find " + str(loop))
-    return -1
-
-
 def convertVertDictToArray(vertDict):
     data = []
     matRegions = {}
@@ -2677,39 +2677,43 @@ def convertVertDictToArray(vertDict):
 
 
 # This collapses similar loops together IF they are in the same material.
-def splitSkinnedFacesIntoTwoGroups(skinnedFaces, fModel, obj, uv_data, drawLayer, convertTextureData):
+def splitSkinnedFacesIntoTwoGroups(skinnedFaces, fModel, obj, infoDict, drawLayer, convertTextureData):
     inGroupVertArray = []
     notInGroupVertArray = []
 
     # For selecting on error
     notInGroupBlenderVerts = []
+    notInGroupBlenderVertSet = set()
     loopDict = {}
     for material_index, skinnedFaceArray in sorted(skinnedFaces.items()):
-        # These MUST be arrays (not dicts) as order is important
+        # These MUST be arrays (not dicts) as order is important, the sets are for lookups
         inGroupVerts = []
+        inGroupVertSet = set()
         inGroupVertArray.append([material_index, inGroupVerts])
 
         notInGroupVerts = []
+        notInGroupVertSet = set()
         notInGroupVertArray.append([material_index, notInGroupVerts])
 
         material = obj.material_slots[material_index].material
         fMaterial, texDimensions = saveOrGetF3DMaterial(material, fModel, obj, drawLayer, convertTextureData)
 
-        convertInfo = LoopConvertInfo(uv_data, obj, material)
         for skinnedFace in skinnedFaceArray:
             for face, loop in skinnedFace.loopsInGroup:
-                f3dVert = getF3DVert(loop, face, convertInfo, obj.data)
+                f3dVert = infoDict.f3dVert[loop.index]
                 bufferVert = BufferVertex(f3dVert, None, material_index)
-                if bufferVert not in inGroupVerts:
+                if bufferVert not in inGroupVertSet:
+                    inGroupVertSet.add(bufferVert)
                     inGroupVerts.append(bufferVert)
                 loopDict[loop] = f3dVert
             for face, loop in skinnedFace.loopsNotInGroup:
-                vert = obj.data.vertices[loop.vertex_index]
-                if vert not in notInGroupBlenderVerts:
-                    notInGroupBlenderVerts.append(vert)
-                f3dVert = getF3DVert(loop, face, convertInfo, obj.data)
+                if loop.vertex_index not in notInGroupBlenderVertSet:
+                    notInGroupBlenderVertSet.add(loop.vertex_index)
+                    notInGroupBlenderVerts.append(obj.data.vertices[loop.vertex_index])
+                f3dVert = infoDict.f3dVert[loop.index]
                 bufferVert = BufferVertex(f3dVert, None, material_index)
-                if bufferVert not in notInGroupVerts:
+                if bufferVert not in notInGroupVertSet:
+                    notInGroupVertSet.add(bufferVert)
                     notInGroupVerts.append(bufferVert)
                 loopDict[loop] = f3dVert
 
@@ -2738,9 +2742,8 @@ def saveSkinnedMeshByMaterial(
 ):
     # We choose one or more loops per vert to represent a material from which
     # texDimensions can be found, since it is required for UVs.
-    uv_data = obj.data.uv_layers["UVMap"].data
     inGroupVertArray, notInGroupVertArray, loopDict, notInGroupBlenderVerts = splitSkinnedFacesIntoTwoGroups(
-        skinnedFaces, fModel, obj, uv_data, drawLayer, convertTextureData
+        skinnedFaces, fModel, obj, triConverterInfo.infoDict, drawLayer, convertTextureData
     )
 
     notInGroupCount = getGroupVertCount(notInGroupVertArray)
@@ -2811,6 +2814,7 @@ def saveSkinnedMeshByMaterial(
     fMesh = FMesh(meshName, fModel.DLFormat)
 
     # Load current group vertices, then draw commands by material
+    # The converters only read the parent's vertices, so every material shares them
     existingVertData, matRegionDict = convertVertDictToArray(notInGroupVertArray)
 
     for material_index, skinnedFaceArray in sorted(skinnedFaces.items()):
@@ -2828,8 +2832,8 @@ def saveSkinnedMeshByMaterial(
                 convertTextureData,
                 None,
                 triConverterInfo,
-                copy.deepcopy(existingVertData),
-                copy.deepcopy(matRegionDict),
+                existingVertData,
+                matRegionDict,
                 lastMaterialName,
             )
         else:
@@ -2843,8 +2847,8 @@ def saveSkinnedMeshByMaterial(
                 convertTextureData,
                 None,
                 triConverterInfo,
-                copy.deepcopy(existingVertData),
-                copy.deepcopy(matRegionDict),
+                existingVertData,
+                matRegionDict,
                 lastMaterialName,
             )
 
@@ -2901,121 +2905,121 @@ class SM64_ExportGeolayoutObject(ObjectDataExporter):
             return {"CANCELLED"}
 
         try:
-            self.store_object_data()
-
-            # Rotate all armatures 90 degrees
-            applyRotation([obj], math.radians(90), "X")
-            save_textures = bpy.context.scene.saveTextures
-
-            if context.scene.fast64.sm64.export_type == "C":
-                export_path, level_name = getPathAndLevel(
-                    props.is_actor_custom_export,
-                    props.actor_custom_path,
-                    props.export_level_name,
-                    props.level_name,
-                )
-                if not props.is_actor_custom_export:
-                    applyBasicTweaks(export_path)
-                exportGeolayoutObjectC(
-                    obj,
-                    final_transform,
-                    export_path,
-                    props.custom_include_directory,
-                    save_textures,
-                    save_textures and bpy.context.scene.geoSeparateTextureDef,
-                    props.actor_group_name,
-                    props.export_header_type,
-                    props.obj_name_gfx,
-                    props.geo_name,
-                    level_name,
-                    props.is_actor_custom_export,
-                    DLFormat.Static,
-                )
-                self.report({"INFO"}, "Success!")
-            elif context.scene.fast64.sm64.export_type == "Insertable Binary":
-                exportGeolayoutObjectInsertableBinary(
-                    obj,
-                    final_transform,
-                    bpy.path.abspath(bpy.context.scene.geoInsertableBinaryPath),
-                )
-                self.report({"INFO"}, "Success! Data at " + context.scene.geoInsertableBinaryPath)
-            else:
-                tempROM = tempName(context.scene.fast64.sm64.output_rom)
-                export_rom_checks(bpy.path.abspath(context.scene.fast64.sm64.export_rom))
-                romfileExport = open(bpy.path.abspath(context.scene.fast64.sm64.export_rom), "rb")
-                shutil.copy(bpy.path.abspath(context.scene.fast64.sm64.export_rom), bpy.path.abspath(tempROM))
-                romfileExport.close()
-                romfileOutput = open(bpy.path.abspath(tempROM), "rb+")
-
-                levelParsed = parse_level_binary(romfileOutput, props.level_name)
-                segmentData = levelParsed.segmentData
-
-                if context.scene.fast64.sm64.extend_bank_4:
-                    ExtendBank0x04(romfileOutput, segmentData, defaultExtendSegment4)
-
-                exportRange = [int(context.scene.geoExportStart, 16), int(context.scene.geoExportEnd, 16)]
-                textDumpFilePath = (
-                    bpy.path.abspath(context.scene.textDumpGeoPath) if context.scene.textDumpGeo else None
-                )
-                if context.scene.overwriteModelLoad:
-                    modelLoadInfo = (int(context.scene.modelLoadLevelScriptCmd, 16), int(context.scene.modelID, 16))
-                else:
-                    modelLoadInfo = (None, None)
+            with self.object_data():
+                # Rotate all armatures 90 degrees
+                applyRotation([obj], math.radians(90), "X")
+                save_textures = bpy.context.scene.saveTextures
 
-                if context.scene.geoUseBank0:
-                    addrRange, startRAM, geoStart = exportGeolayoutObjectBinaryBank0(
-                        romfileOutput,
+                if context.scene.fast64.sm64.export_type == "C":
+                    export_path, level_name = getPathAndLevel(
+                        props.is_actor_custom_export,
+                        props.actor_custom_path,
+                        props.export_level_name,
+                        props.level_name,
+                    )
+                    if not props.is_actor_custom_export:
+                        applyBasicTweaks(export_path)
+                    exportGeolayoutObjectC(
                         obj,
-                        exportRange,
                         final_transform,
-                        *modelLoadInfo,
-                        textDumpFilePath,
-                        getAddressFromRAMAddress(int(context.scene.geoRAMAddr, 16)),
+                        export_path,
+                        props.custom_include_directory,
+                        save_textures,
+                        save_textures and bpy.context.scene.geoSeparateTextureDef,
+                        props.actor_group_name,
+                        props.export_header_type,
+                        props.obj_name_gfx,
+                        props.geo_name,
+                        level_name,
+                        props.is_actor_custom_export,
+                        DLFormat.Static,
                     )
-                else:
-                    addrRange, segPointer = exportGeolayoutObjectBinary(
-                        romfileOutput,
+                    self.report({"INFO"}, "Success!")
+                    report_file_writes(self)
+                elif context.scene.fast64.sm64.export_type == "Insertable Binary":
+                    exportGeolayoutObjectInsertableBinary(
                         obj,
-                        exportRange,
                         final_transform,
-                        segmentData,
-                        *modelLoadInfo,
-                        textDumpFilePath,
-                    )
-
-                romfileOutput.close()
-                selectSingleObject(obj)
-
-                if os.path.exists(bpy.path.abspath(context.scene.fast64.sm64.output_rom)):
-                    os.remove(bpy.path.abspath(context.scene.fast64.sm64.output_rom))
-                os.rename(bpy.path.abspath(tempROM), bpy.path.abspath(context.scene.fast64.sm64.output_rom))
-
-                if context.scene.geoUseBank0:
-                    self.report(
-                        {"INFO"},
-                        "Success! Geolayout at ("
-                        + hex(addrRange[0])
-                        + ", "
-                        + hex(addrRange[1])
-                        + "), to write to RAM Address "
-                        + hex(startRAM)
-                        + ", with geolayout starting at "
-                        + hex(geoStart),
+                        bpy.path.abspath(bpy.context.scene.geoInsertableBinaryPath),
                     )
+                    self.report({"INFO"}, "Success! Data at " + context.scene.geoInsertableBinaryPath)
+                    report_file_writes(self)
                 else:
-                    self.report(
-                        {"INFO"},
-                        "Success! Geolayout at ("
-                        + hex(addrRange[0])
-                        + ", "
-                        + hex(addrRange[1])
-                        + ") (Seg. "
-                        + segPointer
-                        + ").",
+                    tempROM = tempName(context.scene.fast64.sm64.output_rom)
+                    export_rom_checks(bpy.path.abspath(context.scene.fast64.sm64.export_rom))
+                    romfileExport = open(bpy.path.abspath(context.scene.fast64.sm64.export_rom), "rb")
+                    shutil.copy(bpy.path.abspath(context.scene.fast64.sm64.export_rom), bpy.path.abspath(tempROM))
+                    romfileExport.close()
+                    romfileOutput = open(bpy.path.abspath(tempROM), "rb+")
+
+                    levelParsed = parse_level_binary(romfileOutput, props.level_name)
+                    segmentData = levelParsed.segmentData
+
+                    if context.scene.fast64.sm64.extend_bank_4:
+                        ExtendBank0x04(romfileOutput, segmentData, defaultExtendSegment4)
+
+                    exportRange = [int(context.scene.geoExportStart, 16), int(context.scene.geoExportEnd, 16)]
+                    textDumpFilePath = (
+                        bpy.path.abspath(context.scene.textDumpGeoPath) if context.scene.textDumpGeo else None
                     )
+                    if context.scene.overwriteModelLoad:
+                        modelLoadInfo = (int(context.scene.modelLoadLevelScriptCmd, 16), int(context.scene.modelID, 16))
+                    else:
+                        modelLoadInfo = (None, None)
+
+                    if context.scene.geoUseBank0:
+                        addrRange, startRAM, geoStart = exportGeolayoutObjectBinaryBank0(
+                            romfileOutput,
+                            obj,
+                            exportRange,
+                            final_transform,
+                            *modelLoadInfo,
+                            textDumpFilePath,
+                            getAddressFromRAMAddress(int(context.scene.geoRAMAddr, 16)),
+                        )
+                    else:
+                        addrRange, segPointer = exportGeolayoutObjectBinary(
+                            romfileOutput,
+                            obj,
+                            exportRange,
+                            final_transform,
+                            segmentData,
+                            *modelLoadInfo,
+                            textDumpFilePath,
+                        )
 
-            self.cleanup_temp_object_data()
-            applyRotation([obj], math.radians(-90), "X")
+                    romfileOutput.close()
+                    selectSingleObject(obj)
+
+                    if os.path.exists(bpy.path.abspath(context.scene.fast64.sm64.output_rom)):
+                        os.remove(bpy.path.abspath(context.scene.fast64.sm64.output_rom))
+                    os.rename(bpy.path.abspath(tempROM), bpy.path.abspath(context.scene.fast64.sm64.output_rom))
+
+                    if context.scene.geoUseBank0:
+                        self.report(
+                            {"INFO"},
+                            "Success! Geolayout at ("
+                            + hex(addrRange[0])
+                            + ", "
+                            + hex(addrRange[1])
+                            + "), to write to RAM Address "
+                            + hex(startRAM)
+                            + ", with geolayout starting at "
+                            + hex(geoStart),
+                        )
+                    else:
+                        self.report(
+                            {"INFO"},
+                            "Success! Geolayout at ("
+                            + hex(addrRange[0])
+                            + ", "
+                            + hex(addrRange[1])
+                            + ") (Seg. "
+                            + segPointer
+                            + ").",
+                        )
+
+                applyRotation([obj], math.radians(-90), "X")
             self.show_warnings()
             return {"FINISHED"}  # must return a set
 
@@ -3023,7 +3027,6 @@ class SM64_ExportGeolayoutObject(ObjectDataExporter):
             if context.mode != "OBJECT":
                 bpy.ops.object.mode_set(mode="OBJECT")
 
-            self.cleanup_temp_object_data()
             applyRotation([obj], math.radians(-90), "X")
 
             if context.scene.fast64.sm64.export_type == "Binary":
@@ -3128,6 +3131,7 @@ class SM64_ExportGeolayoutArmature(bpy.types.Operator):
                 )
                 starSelectWarning(self, fileStatus)
                 self.report({"INFO"}, "Success!")
+                report_file_writes(self)
             elif context.scene.fast64.sm64.export_type == "Insertable Binary":
                 exportGeolayoutArmatureInsertableBinary(
                     armatureObj,
@@ -3137,6 +3141,7 @@ class SM64_ExportGeolayoutArmature(bpy.types.Operator):
                     None,
                 )
                 self.report({"INFO"}, "Success! Data at " + context.scene.geoInsertableBinaryPath)
+                report_file_writes(self)
             else:
                 tempROM = tempName(context.scene.fast64.sm64.output_rom)
                 export_rom_checks(bpy.path.abspath(context.scene.fast64.sm64.export_rom))
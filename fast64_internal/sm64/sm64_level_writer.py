@@ -22,10 +22,14 @@ from .sm64_utility import (
 )
 
 from ..utility import (
+    writeFile,
     yUpToZUp,
     PluginError,
     getDataFromFile,
     saveDataToFile,
+    writeCDataSourceOnly,
+    CData,
+    CFileWriter,
     unhideAllAndGetHiddenState,
     restoreHiddenState,
     overwriteData,
@@ -33,13 +37,16 @@ from ..utility import (
     applyBasicTweaks,
     applyRotation,
     raisePluginError,
+    report_file_writes,
     writeMaterialFiles,
 )
 
+from ..f3d.f3d_dedup import merge_identical_lists
 from ..f3d.f3d_gbi import (
     ScrollMethod,
     GfxMatWriteMethod,
     TextureExportSettings,
+    ExportCData,
     DLFormat,
 )
 
@@ -74,9 +81,7 @@ def createGeoFile(levelName, filepath):
         + '#include "header.h"\n\n'
     )
 
-    geoFile = open(filepath, "w", newline="\n")
-    geoFile.write(result)
-    geoFile.close()
+    writeFile(filepath, result)
 
 
 def createLevelDataFile(levelName, filepath):
@@ -93,9 +98,7 @@ def createLevelDataFile(levelName, filepath):
         + '#include "make_const_nonconst.h"\n\n'
     )
 
-    levelDataFile = open(filepath, "w", newline="\n")
-    levelDataFile.write(result)
-    levelDataFile.close()
+    writeFile(filepath, result)
 
 
 def createHeaderFile(levelName, filepath):
@@ -114,9 +117,7 @@ def createHeaderFile(levelName, filepath):
         + "#endif\n"
     )
 
-    headerFile = open(filepath, "w", newline="\n")
-    headerFile.write(result)
-    headerFile.close()
+    writeFile(filepath, result)
 
 
 class ZoomOutMasks:
@@ -139,9 +140,7 @@ class ZoomOutMasks:
         if data == self.originalData:
             return
 
-        maskFile = open(filepath, "w", newline="\n")
-        maskFile.write(data)
-        maskFile.close()
+        writeFile(filepath, data)
 
     def updateMaskCount(self, levelCount):
         if len(self.masks) - 1 < int(levelCount / 2):
@@ -186,9 +185,7 @@ class CourseDefines:
         data = self.to_c()
         if data == self.originalData:
             return
-        defineFile = open(filepath, "w", newline="\n")
-        defineFile.write(data)
-        defineFile.close()
+        writeFile(filepath, data)
 
     def getOrMakeMacroByCourseName(self, courseEnum, isBonus):
         for course in self.courses:
@@ -226,9 +223,7 @@ class LevelDefines:
         data = self.to_c()
         if data == self.originalData:
             return
-        defineFile = open(filepath, "w", newline="\n")
-        defineFile.write(data)
-        defineFile.close()
+        writeFile(filepath, data)
 
         # Headers won't be updated unless this file is touched
         if self.newLevelAdded:
@@ -735,9 +730,7 @@ def overwritePuppycamData(filePath, levelToReplace, newPuppycamTriggers):
         else:
             raise PluginError("Could not find 'struct newcam_hardpos newcam_fixedcam[]'.")
 
-        dataFile = open(filePath, "w", newline="\n")
-        dataFile.write(data)
-        dataFile.close()
+        writeFile(filePath, data)
     else:
         raise PluginError(filePath + " does not exist.")
 
@@ -991,8 +984,17 @@ def exportLevelC(obj, transformMatrix, level_name, exportDir, savePNG, customExp
             footer=END_IF_FOOTER if before_endif else None,
         )
 
+    merge_identical_lists(fModel)
     gfxFormatter = SM64GfxFormatter(ScrollMethod.Vertex)
-    exportData = fModel.to_c(TextureExportSettings(savePNG, savePNG, f"levels/{level_name}", level_dir), gfxFormatter)
+    # the static data, the bulk of a level, is written to model.inc.c while it is converted
+    with CFileWriter(os.path.join(level_dir, "model.inc.c")) as modelFile:
+        exportData = fModel.to_c(
+            TextureExportSettings(savePNG, savePNG, f"levels/{level_name}", level_dir),
+            gfxFormatter,
+            ExportCData(CData(modelFile), CData(), CData()),
+        )
+        if DLFormat == DLFormat.Static:
+            exportData.staticData.append(exportData.dynamicData)
     staticData = exportData.staticData
     dynamicData = exportData.dynamicData
     texC = exportData.textureData
@@ -1001,14 +1003,12 @@ def exportLevelC(obj, transformMatrix, level_name, exportDir, savePNG, customExp
 
     if fModel.texturesSavedLastExport > 0:
         level_data.script_data = include_proto("texture_include.inc.c") + level_data.script_data
-        saveDataToFile(os.path.join(level_dir, "texture_include.inc.c"), texC.source)
+        writeCDataSourceOnly(texC, os.path.join(level_dir, "texture_include.inc.c"))
 
     modifyTexScrollFiles(exportDir, level_dir, scrollData)
 
     # Write materials
-    if DLFormat == DLFormat.Static:
-        staticData.append(dynamicData)
-    else:
+    if DLFormat != DLFormat.Static:
         level_data.geo_data = writeMaterialFiles(
             exportDir,
             level_dir,
@@ -1026,7 +1026,6 @@ def exportLevelC(obj, transformMatrix, level_name, exportDir, savePNG, customExp
     level_data.header_data += staticData.header
 
     # Write data
-    saveDataToFile(os.path.join(level_dir, "model.inc.c"), staticData.source)
     saveDataToFile(os.path.join(level_dir, "geo.inc.c"), level_data.geo_data)
     saveDataToFile(os.path.join(level_dir, "leveldata.inc.c"), level_data.script_data)
     saveDataToFile(os.path.join(level_dir, "header.inc.h"), level_data.header_data)
@@ -1248,37 +1247,36 @@ class SM64_ExportLevel(ObjectDataExporter):
             raisePluginError(self, e)
             return {"CANCELLED"}  # must return a set
         try:
-            self.store_object_data()
-
-            applyRotation([obj], math.radians(90), "X")
-
-            props = context.scene.fast64.sm64.combined_export
-            export_path, level_name = props.base_level_path, props.export_level_name
-            if props.is_custom_level:
-                triggerName = "sCam" + level_name.title().replace(" ", "").replace("_", "")
-            else:
-                triggerName = cameraTriggerNames[level_name]
-
-            if not props.non_decomp_level:
-                applyBasicTweaks(export_path)
-            fileStatus = exportLevelC(
-                obj,
-                final_transform,
-                level_name,
-                export_path,
-                context.scene.saveTextures,
-                props.non_decomp_level,
-                triggerName,
-                DLFormat.Static,
-            )
+            with self.object_data():
+                applyRotation([obj], math.radians(90), "X")
+
+                props = context.scene.fast64.sm64.combined_export
+                export_path, level_name = props.base_level_path, props.export_level_name
+                if props.is_custom_level:
+                    triggerName = "sCam" + level_name.title().replace(" ", "").replace("_", "")
+                else:
+                    triggerName = cameraTriggerNames[level_name]
+
+                if not props.non_decomp_level:
+                    applyBasicTweaks(export_path)
+                fileStatus = exportLevelC(
+                    obj,
+                    final_transform,
+                    level_name,
+                    export_path,
+                    context.scene.saveTextures,
+                    props.non_decomp_level,
+                    triggerName,
+                    DLFormat.Static,
+                )
 
-            cameraWarning(self, fileStatus)
-            starSelectWarning(self, fileStatus)
+                cameraWarning(self, fileStatus)
+                starSelectWarning(self, fileStatus)
 
-            applyRotation([obj], math.radians(-90), "X")
-            self.cleanup_temp_object_data()
+                applyRotation([obj], math.radians(-90), "X")
 
             self.report({"INFO"}, "Success!")
+            report_file_writes(self)
             self.show_warnings()
             return {"FINISHED"}  # must return a set
 
@@ -1287,7 +1285,6 @@ class SM64_ExportLevel(ObjectDataExporter):
                 bpy.ops.object.mode_set(mode="OBJECT")
 
             applyRotation([obj], math.radians(-90), "X")
-            self.cleanup_temp_object_data()
 
             obj.select_set(True)
             context.view_layer.objects.active = obj
@@ -10,6 +10,7 @@ from ..panels import SM64_Panel
 from ..operators import ObjectDataExporter
 
 from ..utility import (
+    writeFile,
     PluginError,
     CData,
     Vector,
@@ -26,6 +27,7 @@ from ..utility import (
     prop_split,
     multilineLabel,
     raisePluginError,
+    report_file_writes,
     enumExportHeaderType,
     selectSingleObject,
 )
@@ -72,8 +74,6 @@ from .sm64_geolayout_classes import (
 )
 
 from .animation import (
-    export_animation,
-    export_animation_table,
     get_anim_obj,
     is_obj_animatable,
     SM64_ArmatureAnimProperties,
@@ -1616,8 +1616,7 @@ class SM64_ExportCombinedObject(ObjectDataExporter):
     bl_label = "SM64 Combined Object"
 
     def write_file_lines(self, path, file_lines):
-        with open(path, "w") as file:
-            [file.write(line) for line in file_lines]
+        writeFile(path, file_lines)
 
     # exports the model ID load into the appropriate script.c location
     def export_script_load(self, context, props):
@@ -1955,6 +1954,8 @@ class SM64_ExportCombinedObject(ObjectDataExporter):
     # writes name to header in aggregate file location (actor/level)
     # var name is: static const struct Animation *const <props.anim_obj>_anims[] (or custom name)
     def execute_anim(self, props, context, obj):
+        from .animation.exporting import export_animation, export_animation_table
+
         try:
             if props.export_anim and obj is props.anim_object:
                 if props.export_single_action:
@@ -1988,6 +1989,7 @@ class SM64_ExportCombinedObject(ObjectDataExporter):
         props.context_obj = None
         # you've done it!~
         self.report({"INFO"}, "Success!")
+        report_file_writes(self)
 
         return {"FINISHED"}
 
@@ -1,6 +1,6 @@
 from pathlib import Path
 import os, re, bpy
-from ..utility import PluginError, getDataFromFile, saveDataToFile, CScrollData, CData
+from ..utility import PluginError, getDataFromFile, saveDataToFile, writeFile, CScrollData, CData
 from .c_templates.tile_scroll import tile_scroll_c, tile_scroll_h
 from .sm64_utility import END_IF_FOOTER, ModifyFoundDescriptor, getMemoryCFilePath, write_or_delete_if_found
 
@@ -74,9 +74,7 @@ def writeSegmentROMTable(baseDir):
             re.DOTALL,
         )
 
-        memFile = open(memPath, "w", newline="\n")
-        memFile.write(memData)
-        memFile.close()
+        writeFile(memPath, memData)
 
     # Add extern definition of segment table
     write_or_delete_if_found(
@@ -191,8 +189,7 @@ def writeTexScrollBase(baseDir):
             raise PluginError('Cannot find \'#include "texscroll.h" in src/game/texscroll.c')
 
     if update_tex_scroll:
-        with open(texscrollCPath, "w", newline="\n") as texscrollCFile:
-            texscrollCFile.write(scrollData)
+        writeFile(texscrollCPath, scrollData)
 
     # Create texscroll folder for groups
     texscrollDirPath = os.path.join(baseDir, "src/game/texscroll")
@@ -263,9 +260,7 @@ def createTexScrollHeadersGroup(exportDir, groupName, dataInclude):
         else:
             raise PluginError("Texture scroll function not found.")
 
-        texscrollFileH = open(texscrollPathH, "w", newline="\n")
-        texscrollFileH.write(texscrollDataH)
-        texscrollFileH.close()
+        writeFile(texscrollPathH, texscrollDataH)
 
     # Include group inc.c in texscroll.c
     includeCText = '#include "' + includeC + '"'
@@ -325,9 +320,7 @@ def createTexScrollHeadersGroup(exportDir, groupName, dataInclude):
         raise PluginError("Texture scroll function not found.")
 
     if originalTexScrollC != texscrollDataC:
-        texscrollFileC = open(texscrollPathC, "w", newline="\n")
-        texscrollFileC.write(texscrollDataC)
-        texscrollFileC.close()
+        writeFile(texscrollPathC, texscrollDataC)
 
     return fileStatus
 
@@ -369,9 +362,7 @@ def writeTexScrollHeadersGroup(
 
     if includeH not in groupDataH:
         groupDataH = includeH + "\n" + groupDataH
-        groupFileH = open(groupPathH, "w", newline="\n")
-        groupFileH.write(groupDataH)
-        groupFileH.close()
+        writeFile(groupPathH, groupDataH)
 
     # Write to group inc.c
     groupPathC = os.path.join(exportDir, "src/game/texscroll/" + groupName + "_texscroll.inc.c")
@@ -400,9 +391,7 @@ def writeTexScrollHeadersGroup(
         raise PluginError("Texture scroll function not found.")
 
     if originalGroupDataC != groupDataC:
-        groupFileC = open(groupPathC, "w", newline="\n")
-        groupFileC.write(groupDataC)
-        groupFileC.close()
+        writeFile(groupPathC, groupDataC)
 
     return fileStatus
 
@@ -420,9 +409,7 @@ def removeTexScrollHeadersGroup(exportDir: str, includeC: str, includeH: str, gr
 
         if includeH in groupDataH:
             groupDataH = groupDataH.replace(includeH, "")
-            groupFileH = open(groupPathH, "w", newline="\n")
-            groupFileH.write(groupDataH)
-            groupFileH.close()
+            writeFile(groupPathH, groupDataH)
 
     # Remove include and function call from group inc.c
     groupPathC = os.path.join(exportDir, "src/game/texscroll/" + groupName + "_texscroll.inc.c")
@@ -447,9 +434,7 @@ def removeTexScrollHeadersGroup(exportDir: str, includeC: str, includeH: str, gr
             groupDataC = groupDataC[: matchResult.start(1)] + functionCalls + groupDataC[matchResult.end(1) :]
 
         if originalGroupDataC != groupDataC:
-            groupFileC = open(groupPathC, "w", newline="\n")
-            groupFileC.write(groupDataC)
-            groupFileC.close()
+            writeFile(groupPathC, groupDataC)
 
 
 def modifyTexScrollFiles(exportDir: str, assetDir: str, scrollData: CScrollData):
@@ -472,10 +457,6 @@ def writeTexScrollFiles(exportDir: str, assetDir: str, scrollData: CData):
     texscrollCPath = os.path.join(assetDir, "texscroll.inc.c")
     texscrollHPath = os.path.join(assetDir, "texscroll.inc.h")
 
-    texscrollCFile = open(texscrollCPath, "w", newline="\n")
-    texscrollCFile.write(scrollData.source)
-    texscrollCFile.close()
+    writeFile(texscrollCPath, scrollData.source)
 
-    texscrollHFile = open(texscrollHPath, "w", newline="\n")
-    texscrollHFile.write(scrollData.header)
-    texscrollHFile.close()
+    writeFile(texscrollHPath, scrollData.header)
@@ -1,4 +1,7 @@
 import dataclasses
+import functools
+import gzip
+import json
 from typing import NamedTuple, Optional
 from pathlib import Path
 from io import StringIO
@@ -11,6 +14,7 @@ import bpy
 from bpy.types import UILayout
 
 from ..utility import (
+    writeFile,
     filepath_checks,
     run_and_draw_errors,
     multilineLabel,
@@ -19,7 +23,9 @@ from ..utility import (
     PluginError,
     COMMENT_PATTERN,
 )
-from .sm64_function_map import func_map
+
+# refresh version : {address : function name}, use parse_function_map.py for different refreshes
+FUNCTION_MAP_PATH = Path(__file__).parent / "sm64_function_map.json.gz"
 
 
 def starSelectWarning(operator, fileStatus):
@@ -126,12 +132,20 @@ def string_int_prop(layout: UILayout, data, prop: str, name="", split=True, **pr
     return string_int_warning(layout, getattr(data, prop))
 
 
+@functools.cache
+def get_function_map() -> dict[str, dict[str, str]]:
+    """Loaded on first use, so that startup does not pay for it"""
+    with gzip.open(FUNCTION_MAP_PATH, "rt", encoding="utf-8") as file:
+        return json.load(file)
+
+
 def convert_addr_to_func(addr: str):
     if addr == "":
         raise PluginError("Empty function name/address.")
     refresh_version: str = bpy.context.scene.fast64.sm64.refresh_version
     if refresh_version.startswith("HackerSM64"):  # hacker uses refresh 13
         refresh_version = "Refresh 13"
+    func_map = get_function_map()
     assert refresh_version in func_map, "Refresh version not found in function map"
     refresh_func_map = func_map[refresh_version]
     if addr.lower() in refresh_func_map:
@@ -352,7 +366,7 @@ def write_or_delete_if_found(
     text = text[:footer_pos] + additions + text[footer_pos:]
 
     if changed or create_new:
-        path.write_text(text)
+        writeFile(path, text)
         return True
     return False
 
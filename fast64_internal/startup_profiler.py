@@ -0,0 +1,117 @@
+"""
+Startup profiling, enabled by setting the FAST64_PROFILE_STARTUP environment variable before starting Blender.
+Records how long each addon module takes to import and each register step takes, then prints a report
+and writes it to fast64_startup_profile.txt in the system's temporary folder.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from typing import Optional
+
+ENV_VAR = "FAST64_PROFILE_STARTUP"
+REPORT_NAME = "fast64_startup_profile.txt"
+REPORT_MODULE_COUNT = 25
+
+enabled = bool(os.environ.get(ENV_VAR))
+
+
+class ImportTimer(MetaPathFinder):
+    """Wraps the loaders of the addon's modules to time their execution, nested imports are timed separately"""
+
+    def __init__(self, package: str):
+        self.package = package
+        self.module_times: dict[str, tuple[float, float]] = {}  # module name : (total time, own time)
+        self.child_times: list[float] = []  # time spent importing other modules, for each module being imported
+
+    def find_spec(self, fullname: str, path, target=None):
+        if not fullname.startswith(self.package):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader.exec_module = self.timed_exec_module(fullname, spec.loader.exec_module)
+                return spec
+        return None
+
+    def timed_exec_module(self, fullname: str, exec_module):
+        def timed(module):
+            self.child_times.append(0.0)
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                elapsed = time.perf_counter() - start
+                own_time = elapsed - self.child_times.pop()
+                if len(self.child_times) > 0:
+                    self.child_times[-1] += elapsed
+                self.module_times[fullname] = (elapsed, own_time)
+
+        return timed
+
+
+import_timer: Optional[ImportTimer] = None
+start_time = 0.0
+step_times: list[tuple[str, float]] = []
+
+
+def start(package: str, profile_start_time: float):
+    """
+    Call before importing the rest of the addon.
+    profile_start_time is read before importing this module, the time until now is reported as this module's import.
+    """
+    global import_timer, start_time
+    if not enabled:
+        return
+    start_time = profile_start_time
+    import_timer = ImportTimer(package)
+    own_import_time = time.perf_counter() - start_time
+    import_timer.module_times[__name__] = (own_import_time, own_import_time)
+    sys.meta_path.insert(0, import_timer)
+
+
+@contextmanager
+def timed(step: str):
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        step_times.append((step, time.perf_counter() - start))
+
+
+def finish():
+    """Call at the end of register, prints and saves the report"""
+    global import_timer
+    if not enabled or import_timer is None:
+        return
+    sys.meta_path.remove(import_timer)
+    total_time = time.perf_counter() - start_time
+    module_times = import_timer.module_times
+    import_timer = None
+
+    lines = [f"Fast64 startup: {total_time:.3f}s", "", "Slowest modules (own time, total time, module):"]
+    for name, (elapsed, own_time) in sorted(module_times.items(), key=lambda item: -item[1][1])[:REPORT_MODULE_COUNT]:
+        lines.append(f"    {own_time:.4f}s {elapsed:.4f}s {name}")
+    lines.append(f"    ({len(module_times)} modules)")
+    lines += ["", "Register steps:"]
+    lines += [f"    {elapsed:.4f}s {step}" for step, elapsed in step_times]
+    step_times.clear()
+
+    report = "\n".join(lines)
+    print(report)
+    report_path = os.path.join(tempfile.gettempdir(), REPORT_NAME)
+    try:
+        with open(report_path, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+        print(f"Startup profile saved to {report_path}")
+    except OSError as exc:
+        print(f"Could not save startup profile: {exc}")
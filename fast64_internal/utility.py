@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from pathlib import Path
 import bpy, random, string, os, math, traceback, re, os, mathutils, ast, operator, inspect
 from math import pi, ceil, degrees, radians, copysign
@@ -191,10 +192,76 @@ def readFile(filepath):
     return data
 
 
+class FileWrites:
+    """Counts the files written by write_if_changed and those skipped because they were unchanged"""
+
+    def __init__(self):
+        self.written = 0
+        self.skipped = 0
+
+    def add(self, written: bool):
+        if written:
+            self.written += 1
+        else:
+            self.skipped += 1
+
+    def summary(self):
+        return f"{self.written} files written, {self.skipped} unchanged files skipped"
+
+
+file_writes = FileWrites()
+
+
+def report_file_writes(operator):
+    """Reports the files written and skipped since the last report, call when an export operator is done"""
+    global file_writes
+    if file_writes.written or file_writes.skipped:
+        operator.report({"INFO"}, file_writes.summary())
+    file_writes = FileWrites()
+
+
+def file_content_equals(filepath, parts: Iterable[bytes]):
+    """Compares the file against the parts as they are read, without loading the whole file at once"""
+    try:
+        with open(filepath, "rb") as file:
+            for part in parts:
+                if file.read(len(part)) != part:
+                    return False
+            return file.read(1) == b""
+    except OSError:
+        return False
+
+
+def write_if_changed(filepath, data: str | bytes | Iterable[str | bytes]):
+    """
+    Writes data, or a list of parts of it, unless the file already has that content.
+    Leaving unchanged files alone keeps their modification times, so build systems don't rebuild what depends on them.
+    Text is written as utf-8 with its newlines unchanged. The file is replaced through a temporary file,
+    so an interrupted write never leaves a partial file.
+    Returns True if the file was written.
+    """
+    parts = [data] if isinstance(data, (str, bytes, bytearray)) else data
+
+    def encoded_parts():
+        return (part.encode("utf-8") if isinstance(part, str) else part for part in parts)
+
+    changed = not file_content_equals(filepath, encoded_parts())
+    if changed:
+        temp_path = f"{filepath}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.writelines(encoded_parts())
+            os.replace(temp_path, filepath)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    file_writes.add(changed)
+    return changed
+
+
 def writeFile(filepath, data):
-    datafile = open(filepath, "w", newline="\n", encoding="utf-8")
-    datafile.write(data)
-    datafile.close()
+    write_if_changed(filepath, data)
 
 
 def checkObjectReference(obj, title):
@@ -395,35 +462,136 @@ def propertyGroupEquals(oldProp, newProp):
 
 
 def writeCData(data, headerPath, sourcePath):
-    sourceFile = open(sourcePath, "w", newline="\n", encoding="utf-8")
-    sourceFile.write(data.source)
-    sourceFile.close()
-
-    headerFile = open(headerPath, "w", newline="\n", encoding="utf-8")
-    headerFile.write(data.header)
-    headerFile.close()
+    write_if_changed(sourcePath, data.source_writer.parts)
+    write_if_changed(headerPath, data.header_writer.parts)
 
 
 def writeCDataSourceOnly(data, sourcePath):
-    sourceFile = open(sourcePath, "w", newline="\n", encoding="utf-8")
-    sourceFile.write(data.source)
-    sourceFile.close()
+    write_if_changed(sourcePath, data.source_writer.parts)
 
 
 def writeCDataHeaderOnly(data, headerPath):
-    headerFile = open(headerPath, "w", newline="\n", encoding="utf-8")
-    headerFile.write(data.header)
-    headerFile.close()
+    write_if_changed(headerPath, data.header_writer.parts)
 
 
-class CData:
+class CWriter:
+    """
+    Receives generated C with write() and writelines(), this one keeps it in memory as a list of parts.
+    Each writelines() call is joined into one part, so writing a list line by line doesn't keep a string per line.
+    """
+
     def __init__(self):
-        self.source = ""
-        self.header = ""
+        self.parts: list[str] = []
+
+    def write(self, text: str):
+        self.parts.append(text)
+
+    def writelines(self, lines: Iterable[str]):
+        self.parts.append("".join(lines))
+
+    def extend(self, other: "CWriter"):
+        """Adds what was written to other, without copying it"""
+        self.parts.extend(other.parts)
+
+    def getvalue(self) -> str:
+        if len(self.parts) > 1:
+            self.parts = ["".join(self.parts)]
+        return self.parts[0] if len(self.parts) > 0 else ""
+
+    def setvalue(self, text: str):
+        self.parts = [text]
+
+
+class CFileWriter(CWriter):
+    """
+    Writes generated C to a buffered file as it is written, so the whole output is never held in memory.
+    Use it as a context manager. It writes to a temporary file that only replaces the file on exit if its
+    content changed, like write_if_changed, and is removed if an exception was raised.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.temp_path = f"{filepath}.tmp"
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.temp_path, "w", newline="", encoding="utf-8")
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.file.close()
+        if exc_type is not None:
+            os.remove(self.temp_path)
+            return
+        with open(self.temp_path, "rb") as temp_file:
+            changed = not file_content_equals(self.filepath, iter(lambda: temp_file.read(1 << 16), b""))
+        if changed:
+            os.replace(self.temp_path, self.filepath)
+        else:
+            os.remove(self.temp_path)
+        file_writes.add(changed)
+
+    def write(self, text: str):
+        self.file.write(text)
+
+    def writelines(self, lines: Iterable[str]):
+        self.file.writelines(lines)
+
+    def extend(self, other: CWriter):
+        self.file.writelines(other.parts)
+
+    def getvalue(self) -> str:
+        raise PluginError(f"C written to {self.filepath} can only be added to, not read back.")
+
+    def setvalue(self, text: str):
+        raise PluginError(f"C written to {self.filepath} can only be added to, not replaced.")
+
+
+class CData:
+    """
+    Generated C source and header text, each sent to a CWriter.
+    By default both are kept in memory, pass a CFileWriter to stream one of them to its file while it is generated.
+    Reading or assigning `source` or `header` only works for text kept in memory, prefer write() and append().
+    """
+
+    def __init__(self, source: Optional[CWriter] = None, header: Optional[CWriter] = None):
+        self.source_writer = source if source is not None else CWriter()
+        self.header_writer = header if header is not None else CWriter()
+
+    @property
+    def source(self) -> str:
+        return self.source_writer.getvalue()
+
+    @source.setter
+    def source(self, source: str):
+        self.source_writer.setvalue(source)
+
+    @property
+    def header(self) -> str:
+        return self.header_writer.getvalue()
+
+    @header.setter
+    def header(self, header: str):
+        self.header_writer.setvalue(header)
+
+    def write(self, source: str):
+        self.source_writer.write(source)
+
+    def writelines(self, sources: Iterable[str]):
+        self.source_writer.writelines(sources)
+
+    def write_header(self, header: str):
+        self.header_writer.write(header)
 
     def append(self, other):
-        self.source += other.source
-        self.header += other.header
+        self.source_writer.extend(other.source_writer)
+        self.header_writer.extend(other.header_writer)
+
+    def write_source_to(self, file):
+        file.writelines(self.source_writer.parts)
+
+    def write_header_to(self, file):
+        file.writelines(self.header_writer.parts)
 
 
 class CScrollData(CData):
@@ -525,9 +693,7 @@ def getDataFromFile(filepath):
 
 
 def saveDataToFile(filepath, data):
-    dataFile = open(filepath, "w", newline="\n")
-    dataFile.write(data)
-    dataFile.close()
+    writeFile(filepath, data)
 
 
 def applyBasicTweaks(baseDir):
@@ -555,9 +721,7 @@ def enableExtendedRAM(baseDir):
             segmentData[: matchResult.start(0)] + "#define USE_EXT_RAM\n" + segmentData[matchResult.start(0) :]
         )
 
-        segmentFile = open(segmentPath, "w", newline="\n")
-        segmentFile.write(segmentData)
-        segmentFile.close()
+        writeFile(segmentPath, segmentData)
 
 
 def writeMaterialFiles(
@@ -568,14 +732,10 @@ def writeMaterialFiles(
     levelMatCPath = os.path.join(assetDir, "material.inc.c")
     levelMatHPath = os.path.join(assetDir, "material.inc.h")
 
-    levelMatCFile = open(levelMatCPath, "w", newline="\n")
-    levelMatCFile.write(dynamic_data)
-    levelMatCFile.close()
+    writeFile(levelMatCPath, dynamic_data)
 
     headerDynamic = headerInclude + "\n\n" + headerDynamic
-    levelMatHFile = open(levelMatHPath, "w", newline="\n")
-    levelMatHFile.write(headerDynamic)
-    levelMatHFile.close()
+    writeFile(levelMatHPath, headerDynamic)
 
     return matHInclude + "\n\n" + geoString
 
@@ -677,6 +837,7 @@ def customExportWarning(layout):
 
 def raisePluginError(operator, exception):
     print(traceback.format_exc())
+    report_file_writes(operator)
     if bpy.context.scene.fullTraceback:
         operator.report({"ERROR"}, traceback.format_exc())
     else:
@@ -803,9 +964,7 @@ def overwriteData(headerRegex, name, value, filePath, writeNewBeforeString, isFu
                 data = data[:cmdPos] + value + "\n" + data[cmdPos:]
             else:
                 data += "\n" + value
-        dataFile = open(filePath, "w", newline="\n")
-        dataFile.write(data)
-        dataFile.close()
+        writeFile(filePath, data)
     else:
         raise PluginError(filePath + " does not exist.")
 
@@ -817,19 +976,64 @@ def yield_children(obj: bpy.types.Object):
             yield from yield_children(o)
 
 
-def store_original_mtx():
+class ExportObjectData:
+    """
+    Original matrices and instanced mesh copies of the objects being exported, kept for the length of an export
+    instead of as properties on the objects. Entries are keyed by the original object name, so the copies made
+    of an exported hierarchy find the data of the objects they were copied from.
+    Use as a context manager, which stores the data of the active object's hierarchy and removes the copies on exit.
+    """
+
+    def __init__(self, add_warning: Callable[[str], None]):
+        self.add_warning = add_warning
+        self.original_mtx: dict[str, Matrix] = {}
+        self.original_mtx_world: dict[str, Matrix] = {}
+        self.instanced_mesh_names: dict[str, str] = {}  # object name : instanced mesh name
+        self.temp_meshes: dict[str, Object] = {}  # instanced mesh name : copy with transforms applied
+
+    def __enter__(self):
+        global export_object_data
+        export_object_data = self
+        try:
+            store_original_mtx(self)
+            store_original_meshes(self)
+        except Exception:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        global export_object_data
+        export_object_data = None
+        cleanupTempMeshes(self)
+
+    def get_original_mtx(self, obj: Object) -> Optional[Matrix]:
+        return self.original_mtx.get(obj.original_name)
+
+    def get_original_mtx_world(self, obj: Object) -> Optional[Matrix]:
+        return self.original_mtx_world.get(obj.original_name)
+
+    def get_instanced_mesh_name(self, obj: Object) -> Optional[str]:
+        return self.instanced_mesh_names.get(obj.original_name)
+
+
+export_object_data: Optional[ExportObjectData] = None
+
+
+def get_export_object_data() -> ExportObjectData:
+    """The data of the running export, or an empty one outside of exports"""
+    return export_object_data if export_object_data is not None else ExportObjectData(print)
+
+
+def store_original_mtx(object_data: ExportObjectData):
     active_obj = bpy.context.view_layer.objects.active
     for obj in yield_children(active_obj):
         # negative scales produce a rotation, we need to remove that since
         # scales will be applied to the transform for each object
         loc, rot, _scale = obj.matrix_local.decompose()
-        obj["original_mtx"] = list(Matrix.LocRotScale(loc, rot, None))
+        object_data.original_mtx[obj.name] = Matrix.LocRotScale(loc, rot, None)
         loc, rot, scale = obj.matrix_world.decompose()
-        obj["original_mtx_world"] = list(Matrix.LocRotScale(loc, rot, scale))
-
-
-def rotate_bounds(bounds, mtx: mathutils.Matrix):
-    return [(mtx @ mathutils.Vector(b)).to_tuple() for b in bounds]
+        object_data.original_mtx_world[obj.name] = Matrix.LocRotScale(loc, rot, scale)
 
 
 def obj_scale_is_unified(obj):
@@ -854,10 +1058,12 @@ def attemptModifierApply(modifier):
         print("Skipping modifier " + str(modifier.name))
 
 
-def copy_object_and_apply(obj: bpy.types.Object, apply_scale=False, apply_modifiers=False):
+def copy_object_and_apply(
+    object_data: ExportObjectData, obj: bpy.types.Object, apply_scale=False, apply_modifiers=False
+):
     if apply_scale or apply_modifiers:
         # it's a unique mesh, use object name
-        obj["instanced_mesh_name"] = obj.name
+        object_data.instanced_mesh_names[obj.name] = obj.name
 
         obj.original_name = obj.name
 
@@ -886,17 +1092,10 @@ def copy_object_and_apply(obj: bpy.types.Object, apply_scale=False, apply_modifi
         mtx = mtx @ scale_mtx_from_vector(obj.scale)
 
     obj_copy.data.transform(mtx)
-    # Flag used for finding these temp objects
-    obj_copy["temp_export"] = True
-
-    # Override for F3D culling bounds (used in addCullCommand)
-    bounds_mtx = transform_mtx_blender_to_n64()
-    if apply_scale:
-        bounds_mtx = bounds_mtx @ scale_mtx_from_vector(obj.scale)  # apply scale if needed
-    obj_copy["culling_bounds"] = rotate_bounds(obj_copy.bound_box, bounds_mtx)
+    object_data.temp_meshes[object_data.instanced_mesh_names[obj.name]] = obj_copy
 
 
-def store_original_meshes(add_warning: Callable[[str], None]):
+def store_original_meshes(object_data: ExportObjectData):
     """
     - Creates new objects at 0, 0, 0 with shared mesh
     - Original mesh name is saved to each object
@@ -913,76 +1112,114 @@ def store_original_meshes(add_warning: Callable[[str], None]):
 
             if should_instance:
                 # add `_shared_mesh` to instanced name because `obj.data.name` can be the same as object names
-                obj["instanced_mesh_name"] = f"{obj.data.name}_shared_mesh"
+                object_data.instanced_mesh_names[obj.name] = f"{obj.data.name}_shared_mesh"
                 obj.original_name = obj.name
 
                 if obj.data.name not in instanced_meshes:
                     instanced_meshes.add(obj.data.name)
-                    copy_object_and_apply(obj)
+                    copy_object_and_apply(object_data, obj)
             else:
                 if shares_mesh and has_modifiers:
-                    add_warning(
+                    object_data.add_warning(
                         f'Object "{obj.name}" cannot be instanced due to having modifiers so an extra displaylist will be created. Remove modifiers to allow instancing.'
                     )
                 if shares_mesh and has_uneven_scale:
-                    add_warning(
+                    object_data.add_warning(
                         f'Object "{obj.name}" cannot be instanced due to uneven object scaling and an extra displaylist will be created. Set all scale values to the same value to allow instancing.'
                     )
 
-                copy_object_and_apply(obj, apply_scale=True, apply_modifiers=has_modifiers)
+                copy_object_and_apply(object_data, obj, apply_scale=True, apply_modifiers=has_modifiers)
     bpy.context.view_layer.objects.active = active_obj
 
 
 def get_obj_temp_mesh(obj):
-    for o in bpy.data.objects:
-        if o.get("temp_export") and o.get("instanced_mesh_name") == obj.get("instanced_mesh_name"):
-            return o
+    object_data = get_export_object_data()
+    return object_data.temp_meshes.get(object_data.get_instanced_mesh_name(obj))
 
 
-def apply_objects_modifiers_and_transformations(allObjs: Iterable[bpy.types.Object]):
-    # first apply modifiers so that any objects that affect each other are taken into consideration
-    for selectedObj in allObjs:
-        selectSingleObject(selectedObj)
+def duplicate_objects(objs: Iterable[Object]) -> list[Object]:
+    """
+    Copies objs with the modifiers of meshes applied, without using operators or linking the copies to the scene.
+    Copies are parented to the copy of their parent if it was copied, otherwise they keep the same parent.
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    copies: dict[Object, Object] = {}
+    for obj in objs:
+        obj_copy = obj.copy()
+        if obj.type == "MESH":
+            obj_copy.data = bpy.data.meshes.new_from_object(
+                obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph
+            )
+            obj_copy.modifiers.clear()
+        elif obj.data is not None:
+            obj_copy.data = obj.data.copy()
+        copies[obj] = obj_copy
+    for obj_copy in copies.values():
+        if obj_copy.parent in copies:
+            obj_copy.parent = copies[obj_copy.parent]
+    return list(copies.values())
 
-        for modifier in selectedObj.modifiers:
-            attemptModifierApply(modifier)
 
-    # apply transformations now that world space changes are applied
-    for selectedObj in allObjs:
-        selectSingleObject(selectedObj)
+def get_parent_depth(obj: Object):
+    depth = 0
+    while obj.parent is not None:
+        obj = obj.parent
+        depth += 1
+    return depth
 
-        bpy.ops.object.transform_apply(location=False, rotation=True, scale=True, properties=False)
+
+def apply_objects_rotation_and_scale(objs: Iterable[Object]):
+    """
+    Same as transform_apply(location=False, rotation=True, scale=True) on each object, parents first.
+    Relies on matrix_world being up to date rather than on the depsgraph, so it works on objects that
+    are not in the scene, as long as matrix_world is only changed by assigning it.
+    """
+    objs = sorted(objs, key=get_parent_depth)
+    original_mtx = {obj: obj.matrix_world.copy() for obj in objs}
+    for obj in objs:
+        # the parent, parent inverse and bone part of the world matrix, moved along with the parent
+        parent_mtx = original_mtx[obj] @ obj.matrix_basis.inverted()
+        if obj.parent in original_mtx:
+            parent_mtx = obj.parent.matrix_world @ original_mtx[obj.parent].inverted() @ parent_mtx
+        basis = parent_mtx.inverted() @ original_mtx[obj]
+        location = basis.to_translation()
+        applied_mtx = mathutils.Matrix.Translation(-location) @ basis
+
+        if obj.type == "EMPTY":
+            obj.empty_display_size *= max(abs(scale) for scale in basis.to_scale())
+        elif obj.data is not None and hasattr(obj.data, "transform"):
+            obj.data.transform(applied_mtx)
+        obj.matrix_world = parent_mtx @ mathutils.Matrix.Translation(location)
+
+
+def parent_keep_transform(obj: Object, parent: Optional[Object]):
+    """Same as clearing then setting the parent of obj while keeping transforms, without operators"""
+    world_mtx = obj.matrix_world.copy()
+    obj.parent = parent
+    obj.parent_type = "OBJECT"
+    obj.matrix_parent_inverse = parent.matrix_world.inverted() if parent is not None else mathutils.Matrix.Identity(4)
+    obj.matrix_world = world_mtx
 
 
 def duplicateHierarchy(obj, ignoreAttr, includeEmpties, areaIndex):
     # Duplicate objects to apply scale / modifiers / linked data
-    deselectAllObjects()
-    selectMeshChildrenOnly(obj, None, includeEmpties, areaIndex)
-    obj.select_set(True)
-    bpy.context.view_layer.objects.active = obj
-    bpy.ops.object.duplicate()
+    objs = list(yieldMeshChildrenOnly(obj, None, includeEmpties, areaIndex))
+    if obj not in objs:
+        objs.append(obj)
+    allObjs = duplicate_objects(objs)
     try:
-        tempObj = bpy.context.view_layer.objects.active
-        allObjs = bpy.context.selected_objects
+        tempObj = allObjs[objs.index(obj)]
 
-        bpy.ops.object.make_single_user(obdata=True)
-
-        apply_objects_modifiers_and_transformations(allObjs)
+        apply_objects_rotation_and_scale(allObjs)
 
         for selectedObj in allObjs:
             if ignoreAttr is not None and getattr(selectedObj, ignoreAttr):
                 for child in selectedObj.children:
-                    selectSingleObject(child)
-                    bpy.ops.object.parent_clear(type="CLEAR_KEEP_TRANSFORM")
-                    selectedObj.parent.select_set(True)
-                    bpy.context.view_layer.objects.active = selectedObj.parent
-                    bpy.ops.object.parent_set(keep_transform=True)
-                selectedObj.parent = None
+                    parent_keep_transform(child, selectedObj.parent)
+                parent_keep_transform(selectedObj, None)
         return tempObj, allObjs
     except Exception as e:
         cleanupDuplicatedObjects(allObjs)
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
         raise Exception(str(e))
 
 
@@ -1017,7 +1254,7 @@ def checkSM64EmptyUsesGeoLayout(obj):
     return obj.sm64_obj_type in enumSM64EmptyWithGeolayout or checkIsSM64InlineGeoLayout(obj)
 
 
-def selectMeshChildrenOnly(obj, ignoreAttr, includeEmpties, areaIndex):
+def yieldMeshChildrenOnly(obj, ignoreAttr, includeEmpties, areaIndex):
     checkArea = areaIndex is not None and obj.type == "EMPTY"
     if checkArea and obj.sm64_obj_type == "Area Root" and obj.areaIndex != areaIndex:
         return
@@ -1025,13 +1262,13 @@ def selectMeshChildrenOnly(obj, ignoreAttr, includeEmpties, areaIndex):
     isMesh = obj.type == "MESH"
     isEmpty = obj.type == "EMPTY" and includeEmpties and checkSM64EmptyUsesGeoLayout(obj)
     if (isMesh or isEmpty) and not ignoreObj:
-        obj.select_set(True)
         obj.original_name = obj.name
+        yield obj
     for child in obj.children:
         if checkArea and obj.sm64_obj_type == "Level Root":
             if not (child.type == "EMPTY" and child.sm64_obj_type == "Area Root"):
                 continue
-        selectMeshChildrenOnly(child, ignoreAttr, includeEmpties, areaIndex)
+        yield from yieldMeshChildrenOnly(child, ignoreAttr, includeEmpties, areaIndex)
 
 
 def cleanupDuplicatedObjects(selected_objects):
@@ -1045,82 +1282,78 @@ def cleanupDuplicatedObjects(selected_objects):
         bpy.data.meshes.remove(mesh)
 
 
-def cleanupTempMeshes():
+def cleanupTempMeshes(object_data: ExportObjectData):
     """Delete meshes that have been duplicated for instancing"""
-    remove_data = []
-    for obj in bpy.data.objects:
-        if obj.get("temp_export"):
-            remove_data.append(obj.data)
-            bpy.data.objects.remove(obj)
-        else:
-            if obj.get("instanced_mesh_name"):
-                del obj["instanced_mesh_name"]
-            if obj.get("original_mtx"):
-                del obj["original_mtx"]
-            if obj.get("original_mtx_world"):
-                del obj["original_mtx_world"]
-
-    for data in remove_data:
+    for obj in object_data.temp_meshes.values():
+        data = obj.data
+        bpy.data.objects.remove(obj)
         data_type = type(data)
         if data_type == bpy.types.Mesh:
             bpy.data.meshes.remove(data)
         elif data_type == bpy.types.Curve:
             bpy.data.curves.remove(data)
+    object_data.temp_meshes.clear()
 
 
 def combineObjects(obj, includeChildren, ignoreAttr, areaIndex):
     obj.original_name = obj.name
 
     # Duplicate objects to apply scale / modifiers / linked data
-    deselectAllObjects()
     if includeChildren:
-        selectMeshChildrenOnly(obj, ignoreAttr, False, areaIndex)
+        objs = list(yieldMeshChildrenOnly(obj, ignoreAttr, False, areaIndex))
     else:
-        obj.select_set(True)
-    if len(bpy.context.selected_objects) == 0:
+        objs = [obj]
+    if len(objs) == 0:
         return None, []
-    bpy.ops.object.duplicate()
-    joinedObj = None
-    try:
-        # duplicate obj and apply modifiers / make single user
-        allObjs = bpy.context.selected_objects
-        bpy.ops.object.make_single_user(obdata=True)
-
-        apply_objects_modifiers_and_transformations(allObjs)
+    # Join in the order the objects have in the scene, like the join operator would with the originals
+    sceneOrder = {sceneObj: i for i, sceneObj in enumerate(bpy.context.view_layer.objects)}
+    objs.sort(key=lambda sceneObj: sceneOrder.get(sceneObj, len(sceneOrder)))
 
-        deselectAllObjects()
+    allObjs = duplicate_objects(objs)
+    try:
+        apply_objects_rotation_and_scale(allObjs)
 
+        joinedObj = allObjs[0]
         # Joining causes orphan data, so we remove it manually.
-        meshList = []
-        for selectedObj in allObjs:
-            selectedObj.select_set(True)
-            meshList.append(selectedObj.data)
-
-        joinedObj = bpy.context.selected_objects[0]
-        bpy.context.view_layer.objects.active = joinedObj
-        joinedObj.select_set(True)
-        meshList.remove(joinedObj.data)
-        bpy.ops.object.join()
+        meshList = [selectedObj.data for selectedObj in allObjs[1:]]
+        if len(allObjs) > 1:
+            joinObjects(joinedObj, allObjs)
         setOrigin(joinedObj, obj.location)
 
-        selectSingleObject(joinedObj)
-
         # Need to clear parent transform in order to correctly apply transform.
-        bpy.ops.object.parent_clear(type="CLEAR_KEEP_TRANSFORM")
-        bpy.ops.object.transform_apply(location=False, rotation=True, scale=True, properties=False)
-        bpy.context.view_layer.objects.active = joinedObj
-        joinedObj.select_set(True)
-        bpy.ops.object.transform_apply(location=False, rotation=True, scale=True, properties=False)
+        parent_keep_transform(joinedObj, None)
+        apply_objects_rotation_and_scale([joinedObj])
 
     except Exception as e:
         cleanupDuplicatedObjects(allObjs)
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
         raise Exception(str(e))
 
     return joinedObj, meshList
 
 
+def joinObjects(joinedObj, allObjs):
+    """
+    Joins allObjs into joinedObj, which are not in the scene. There is no data API for this, so they are
+    linked to the scene for the join operator only, and the user's selection is restored after.
+    """
+    selectedObjs = bpy.context.selected_objects
+    activeObj = bpy.context.view_layer.objects.active
+    sceneObjs = bpy.context.scene.collection.objects
+    for selectedObj in allObjs:
+        sceneObjs.link(selectedObj)
+    try:
+        deselectAllObjects()
+        for selectedObj in allObjs:
+            selectedObj.select_set(True)
+        bpy.context.view_layer.objects.active = joinedObj
+        bpy.ops.object.join()
+    finally:
+        sceneObjs.unlink(joinedObj)
+        for selectedObj in selectedObjs:
+            selectedObj.select_set(True)
+        bpy.context.view_layer.objects.active = activeObj
+
+
 def cleanupCombineObj(tempObj, meshList):
     for mesh in meshList:
         bpy.data.meshes.remove(mesh)
@@ -1129,38 +1362,55 @@ def cleanupCombineObj(tempObj, meshList):
     # bpy.context.view_layer.objects.active = obj
 
 
-def writeInsertableFile(filepath, dataType, address_ptrs, startPtr, data):
-    address = 0
-    openfile = open(filepath, "wb")
-
-    # 0-4 - Data Type
-    openfile.write(dataType.to_bytes(4, "big"))
-    address += 4
+class BinaryImage:
+    """
+    In memory copy of the address range of a binary export. The objects being exported seek and write into it
+    like they would into the ROM, then the whole range gets written with one call.
+    """
 
-    # 4-8 - Data Size
-    openfile.seek(address)
-    openfile.write(len(data).to_bytes(4, "big"))
-    address += 4
+    def __init__(self, startAddress: int, endAddress: int, data: Optional[bytes] = None):
+        self.startAddress = startAddress
+        self.data = bytearray(data) if data is not None else bytearray(endAddress - startAddress)
+        if len(self.data) != endAddress - startAddress:
+            raise PluginError("Binary image data does not match its address range.")
+        self.address = startAddress
+
+    @staticmethod
+    def from_file(file, startAddress: int, endAddress: int):
+        """Starts with the file's current data, so that bytes not written by the export (like alignment) are kept"""
+        file.seek(startAddress)
+        data = file.read(endAddress - startAddress)
+        data += bytes(endAddress - startAddress - len(data))
+        return BinaryImage(startAddress, endAddress, data)
+
+    def seek(self, address: int):
+        self.address = address
+
+    def write(self, data: bytes):
+        start = self.address - self.startAddress
+        if start < 0 or start + len(data) > len(self.data):
+            raise PluginError(
+                f"Binary data at {hex(self.address)} is outside of the exported range "
+                f"({hex(self.startAddress)} - {hex(self.startAddress + len(self.data))})."
+            )
+        self.data[start : start + len(data)] = data
+        self.address += len(data)
 
-    # 8-12 Start Address
-    openfile.seek(address)
-    openfile.write(startPtr.to_bytes(4, "big"))
-    address += 4
+    def save(self, file):
+        file.seek(self.startAddress)
+        file.write(self.data)
 
-    # 12-16 - Number of pointer addresses
-    openfile.seek(address)
-    openfile.write(len(address_ptrs).to_bytes(4, "big"))
-    address += 4
 
-    # 16-? - Pointer address list
-    for i in range(len(address_ptrs)):
-        openfile.seek(address)
-        openfile.write(address_ptrs[i].to_bytes(4, "big"))
-        address += 4
+def writeInsertableFile(filepath, dataType, address_ptrs, startPtr, data):
+    header = bytearray()
+    header += dataType.to_bytes(4, "big")  # 0-4 - Data Type
+    header += len(data).to_bytes(4, "big")  # 4-8 - Data Size
+    header += startPtr.to_bytes(4, "big")  # 8-12 Start Address
+    header += len(address_ptrs).to_bytes(4, "big")  # 12-16 - Number of pointer addresses
+    for ptr in address_ptrs:  # 16-? - Pointer address list
+        header += ptr.to_bytes(4, "big")
 
-    openfile.seek(address)
-    openfile.write(data)
-    openfile.close()
+    write_if_changed(filepath, header + data)
 
 
 def quantize_color(color: mathutils.Color, bit_counts: tuple[int]):
@@ -2084,6 +2334,33 @@ def oot_get_assets_path(base_path: str, check_exists: bool = True, use_decomp_pa
     return file_path
 
 
+# path : (modification time, data without comments), least recently used first
+include_file_cache: OrderedDict[Path, tuple[int, str]] = OrderedDict()
+INCLUDE_FILE_CACHE_MAX_SIZE = 64 * 2**20  # characters of data kept, the least recently used files are dropped past it
+include_file_cache_size = 0
+
+
+def read_include_file(file_path: Path):
+    """Returns an included file's data without comments, only reading it again once it changed on disk"""
+    global include_file_cache_size
+    modification_time = file_path.stat().st_mtime_ns
+    cached = include_file_cache.get(file_path)
+    if cached is not None and cached[0] == modification_time:
+        include_file_cache.move_to_end(file_path)
+        return cached[1]
+
+    data = removeComments(file_path.read_text())
+    if cached is not None:
+        include_file_cache_size -= len(cached[1])
+    include_file_cache[file_path] = (modification_time, data)
+    include_file_cache.move_to_end(file_path)
+    include_file_cache_size += len(data)
+    while include_file_cache_size > INCLUDE_FILE_CACHE_MAX_SIZE and len(include_file_cache) > 1:
+        _, (_, removed) = include_file_cache.popitem(last=False)
+        include_file_cache_size -= len(removed)
+    return data
+
+
 def get_include_data(include: str, strip: bool = False):
     """
     Returns the file data pointed by an include's path (useful to parse *.inc.c files)
@@ -2101,7 +2378,7 @@ def get_include_data(include: str, strip: bool = False):
     else:
         raise PluginError(f"ERROR: game not supported ({bpy.context.scene.gameEditorMode})")
 
-    data = removeComments(file_path.read_text())
+    data = read_include_file(file_path)
 
     if strip:
         return data.replace("\n", "").replace(" ", "")
@@ -2161,7 +2438,7 @@ class ExportUtils:
 
         return self
 
-    def __exit__(self, exc_type, exc_value, traceback):
+    def __exit__(self, exc_type, exc_value, exc_traceback):
         # restore local views
         for area in self.areas:
             with bpy.context.temp_override(area=area):
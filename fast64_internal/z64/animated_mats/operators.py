@@ -1,7 +1,7 @@
 from bpy.utils import register_class, unregister_class
 from bpy.types import Operator
 
-from ...utility import ExportUtils, raisePluginError
+from ...utility import ExportUtils, raisePluginError, report_file_writes
 
 
 class Z64_ExportAnimatedMaterials(Operator):
@@ -16,6 +16,7 @@ class Z64_ExportAnimatedMaterials(Operator):
             try:
                 SceneAnimatedMaterial.export()
                 self.report({"INFO"}, "Success!")
+                report_file_writes(self)
                 return {"FINISHED"}
             except Exception as e:
                 raisePluginError(self, e)
@@ -3,9 +3,8 @@ from bpy.types import Scene, Operator, Armature
 from bpy.props import StringProperty, BoolProperty
 from bpy.utils import register_class, unregister_class
 from bpy.ops import object
-from ...utility import PluginError, ExportUtils, toAlnum, writeCData, raisePluginError
+from ...utility import PluginError, ExportUtils, toAlnum, writeCData, raisePluginError, report_file_writes
 from .properties import OOTAnimExportSettingsProperty, OOTAnimImportSettingsProperty
-from ..exporter.animation import ootExportLinkAnimation, ootExportNonLinkAnimation
 from .importer import ootImportLinkAnimationC, ootImportNonLinkAnimationC
 
 from ..utility import (
@@ -18,6 +17,8 @@ from ..utility import (
 
 
 def exportAnimationC(armatureObj: bpy.types.Object, settings: OOTAnimExportSettingsProperty):
+    from ..exporter.animation import ootExportLinkAnimation, ootExportNonLinkAnimation
+
     if settings.isCustom:
         checkEmptyName(settings.customPath)
     else:
@@ -140,6 +141,7 @@ class OOT_ExportAnim(Operator):
                 settings = context.scene.fast64.oot.animExportSettings
                 exportAnimationC(armatureObj, settings)
                 self.report({"INFO"}, "Success!")
+                report_file_writes(self)
 
             except Exception as e:
                 raisePluginError(self, e)
@@ -3,9 +3,8 @@ from bpy.utils import register_class, unregister_class
 from bpy.ops import object
 from mathutils import Matrix
 
-from ...utility import PluginError, ExportUtils, raisePluginError
+from ...utility import PluginError, ExportUtils, raisePluginError, report_file_writes
 from ..utility import getOOTScale
-from ..exporter.collision import CollisionHeader
 from .properties import OOTCollisionExportSettings
 
 
@@ -16,6 +15,8 @@ class OOT_ExportCollision(Operator):
     bl_options = {"REGISTER", "UNDO", "PRESET"}
 
     def execute(self, context):
+        from ..exporter.collision import CollisionHeader
+
         with ExportUtils() as export_utils:
             obj = None
             if context.mode != "OBJECT":
@@ -32,6 +33,7 @@ class OOT_ExportCollision(Operator):
                 CollisionHeader.export(obj, transform, settings)
 
                 self.report({"INFO"}, "Success!")
+                report_file_writes(self)
                 return {"FINISHED"}
             except Exception as e:
                 if context.mode != "OBJECT":
@@ -5,12 +5,11 @@ from bpy.ops import object
 from bpy.props import StringProperty, EnumProperty, IntProperty
 from bpy.types import Scene, Operator, Object
 from bpy.utils import register_class, unregister_class
-from ...utility import PluginError, ExportUtils, raisePluginError
+from ...utility import PluginError, ExportUtils, raisePluginError, report_file_writes
 from ...game_data import game_data
 from ..collection_utility import getCollection
 from .constants import ootEnumCSTextboxType
 from .importer import importCutsceneData
-from ..exporter.cutscene import Cutscene
 
 
 class OOTCSTextAdd(Operator):
@@ -73,6 +72,8 @@ class OOT_ExportCutscene(Operator):
     bl_options = {"REGISTER", "UNDO", "PRESET"}
 
     def execute(self, context):
+        from ..exporter.cutscene import Cutscene
+
         with ExportUtils() as export_utils:
             try:
                 if context.mode != "OBJECT":
@@ -92,6 +93,7 @@ class OOT_ExportCutscene(Operator):
                 Cutscene.export(cs_obj)
 
                 self.report({"INFO"}, "Successfully exported cutscene")
+                report_file_writes(self)
                 return {"FINISHED"}
             except Exception as e:
                 raisePluginError(self, e)
@@ -104,6 +106,8 @@ class OOT_ExportAllCutscenes(Operator):
     bl_options = {"REGISTER", "UNDO", "PRESET"}
 
     def execute(self, context):
+        from ..exporter.cutscene import Cutscene
+
         with ExportUtils() as export_utils:
             try:
                 if context.mode != "OBJECT":
@@ -128,6 +132,7 @@ class OOT_ExportAllCutscenes(Operator):
                     raise PluginError("Could not find any cutscenes to export")
 
                 self.report({"INFO"}, "Successfully exported " + str(count) + " cutscenes")
+                report_file_writes(self)
                 return {"FINISHED"}
             except Exception as e:
                 raisePluginError(self, e)
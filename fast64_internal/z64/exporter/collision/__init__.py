@@ -9,6 +9,7 @@ from bpy.ops import object
 from typing import Optional
 
 from ....utility import (
+    writeFile,
     PluginError,
     CData,
     toAlnum,
@@ -57,13 +58,18 @@ class CollisionUtility:
                 maxBounds[i] = position[i]
 
     @staticmethod
-    def getVertexIndex(vertexPos: tuple[int, int, int], vertexList: list[CollisionVertex]):
-        """Returns the index of a CollisionVertex based on position data, returns None if no match found"""
+    def getVertexIndex(
+        vertexPos: tuple[int, int, int],
+        vertexList: list[CollisionVertex],
+        indexFromPos: dict[tuple[int, int, int], int],
+    ):
+        """Returns the index of a CollisionVertex based on position data, adds a new vertex if no match found"""
 
-        for i in range(len(vertexList)):
-            if vertexList[i].pos == vertexPos:
-                return i
-        return None
+        vertexIndex = indexFromPos.get(vertexPos)
+        if vertexIndex is None:
+            vertexIndex = indexFromPos[vertexPos] = len(vertexList)
+            vertexList.append(CollisionVertex(vertexPos))
+        return vertexIndex
 
     @staticmethod
     def getMeshObjects(
@@ -94,6 +100,7 @@ class CollisionUtility:
         surfaceList: list[SurfaceType] = []
         polyList: list[CollisionPoly] = []
         vertexList: list[CollisionVertex] = []
+        vertexIndexFromPos: dict[tuple[int, int, int], int] = {}
         colBounds: list[tuple[int, int, int]] = []
 
         transformFromMeshObj: dict[Object, Matrix] = {}
@@ -109,20 +116,24 @@ class CollisionUtility:
                     raise PluginError(f"'{meshObj.name}' must have a material associated with it.")
 
                 meshObj.data.calc_loop_triangles()
+                normalTransform = transform.inverted().transposed()
+                positions = [transform @ vertex.co for vertex in meshObj.data.vertices]
+                roundedPositions = [Utility.roundPosition(position) for position in positions]
+                surfaceTypeFromMatIndex: dict[int, SurfaceType] = {}
                 for i, face in enumerate(meshObj.data.loop_triangles):
                     material = meshObj.material_slots[face.material_index].material
                     colProp = material.ootCollisionProperty
 
                     # get bounds and vertices data
-                    planePoint = transform @ meshObj.data.vertices[face.vertices[0]].co
-                    (x1, y1, z1) = Utility.roundPosition(planePoint)
-                    (x2, y2, z2) = Utility.roundPosition(transform @ meshObj.data.vertices[face.vertices[1]].co)
-                    (x3, y3, z3) = Utility.roundPosition(transform @ meshObj.data.vertices[face.vertices[2]].co)
+                    planePoint = positions[face.vertices[0]]
+                    (x1, y1, z1) = roundedPositions[face.vertices[0]]
+                    (x2, y2, z2) = roundedPositions[face.vertices[1]]
+                    (x3, y3, z3) = roundedPositions[face.vertices[2]]
                     CollisionUtility.updateBounds((x1, y1, z1), colBounds)
                     CollisionUtility.updateBounds((x2, y2, z2), colBounds)
                     CollisionUtility.updateBounds((x3, y3, z3), colBounds)
 
-                    normal = (transform.inverted().transposed() @ face.normal).normalized()
+                    normal = (normalTransform @ face.normal).normalized()
                     distance = round(
                         -1 * (normal[0] * planePoint[0] + normal[1] * planePoint[1] + normal[2] * planePoint[2])
                     )
@@ -136,14 +147,10 @@ class CollisionUtility:
                         print("INFO: Ignore denormalized triangle.")
                         continue
 
-                    indices: list[int] = []
-                    for pos in [(x1, y1, z1), (x2, y2, z2), (x3, y3, z3)]:
-                        vertexIndex = CollisionUtility.getVertexIndex(pos, vertexList)
-                        if vertexIndex is None:
-                            vertexList.append(CollisionVertex(pos))
-                            indices.append(len(vertexList) - 1)
-                        else:
-                            indices.append(vertexIndex)
+                    indices: list[int] = [
+                        CollisionUtility.getVertexIndex(pos, vertexList, vertexIndexFromPos)
+                        for pos in [(x1, y1, z1), (x2, y2, z2), (x3, y3, z3)]
+                    ]
                     assert len(indices) == 3
 
                     # We need to ensure two things about the order in which the vertex indices are:
@@ -171,7 +178,10 @@ class CollisionUtility:
                         indices[1], indices[2] = indices[2], indices[1]
 
                     # get surface type and collision poly data
-                    surfaceType = SurfaceType.new(colProp, useMacros, material)
+                    surfaceType = surfaceTypeFromMatIndex.get(face.material_index)
+                    if surfaceType is None:
+                        surfaceType = SurfaceType.new(colProp, useMacros, material)
+                        surfaceTypeFromMatIndex[face.material_index] = surfaceType
 
                     if surfaceType not in colPolyFromSurfaceType:
                         colPolyFromSurfaceType[surfaceType] = []
@@ -280,10 +290,10 @@ class CollisionHeader:
             ).resolve()
 
             header_path = base_path / f"{filename}.h"
-            header_path.write_text(filedata.header, encoding="utf-8", newline="\n")
+            writeFile(header_path, filedata.header)
 
             source_path = base_path / f"{filename}.c"
-            source_path.write_text(filedata.source, encoding="utf-8", newline="\n")
+            writeFile(source_path, filedata.source)
         else:
             raise PluginError("ERROR: exporting collision with ignore collision enabled!")
 
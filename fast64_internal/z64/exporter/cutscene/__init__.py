@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Optional
 from bpy.types import Object
 
-from ....utility import PluginError, CData, indent
+from ....utility import PluginError, CData, writeFile, indent
 from ...utility import getCustomProperty
 from ...scene.properties import OOTSceneHeaderProperty
 from .data import CutsceneData
@@ -66,8 +66,8 @@ class Cutscene:
         if not skip_includes:
             # export the data in writing mode (single cutscene or first cutscene of the multiple export)
 
-            header_path.write_text(filedata.header, encoding="utf-8", newline="\n")
-            source_path.write_text(filedata.source, encoding="utf-8", newline="\n")
+            writeFile(header_path, filedata.header)
+            writeFile(source_path, filedata.source)
         else:
             # export the data in append mode (the other cutscenes of the multiple export)
 
@@ -324,4 +324,4 @@ class SpecUtility:
             specFile.append(SpecEntry(roomCmds))
 
         # finally, write the spec file
-        get_spec_path(exportPath).write_text(specFile.to_c(), encoding="utf-8", newline="\n")
+        writeFile(get_spec_path(exportPath), specFile.to_c())
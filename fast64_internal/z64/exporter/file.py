@@ -1,7 +1,8 @@
 import os
 
 from dataclasses import dataclass
-from ...utility import writeFile
+from typing import Callable
+from ...utility import CData, CFileWriter, writeFile
 
 
 @dataclass
@@ -10,24 +11,30 @@ class RoomFile:
 
     name: str
     roomMain: str
-    roomModel: str
+    roomModel: Callable[[CData], CData]
+    """Writes the C data of the room model to the given ``CData``, called when the files are written"""
     roomModelInfo: str
     singleFileExport: bool
     path: str
     header: str
+    roomModelInfoHeader: str
+    roomModelInclude: str = ""
 
     def write(self):
-        """Writes the room files"""
+        """Writes the room files, the room model is streamed to its file while it is converted"""
 
         if self.singleFileExport:
-            roomMainPath = f"{self.name}.c"
-            self.roomMain += self.roomModelInfo + self.roomModel
+            with CFileWriter(os.path.join(self.path, f"{self.name}.c")) as roomFile:
+                roomFile.write(self.roomMain + self.roomModelInfo)
+                roomModelData = self.roomModel(CData(roomFile))
         else:
-            roomMainPath = f"{self.name}_main.c"
             writeFile(os.path.join(self.path, f"{self.name}_model_info.c"), self.roomModelInfo)
-            writeFile(os.path.join(self.path, f"{self.name}_model.c"), self.roomModel)
+            with CFileWriter(os.path.join(self.path, f"{self.name}_model.c")) as roomModelFile:
+                roomModelFile.write(self.roomModelInclude)
+                roomModelData = self.roomModel(CData(roomModelFile))
+            writeFile(os.path.join(self.path, f"{self.name}_main.c"), self.roomMain)
 
-        writeFile(os.path.join(self.path, roomMainPath), self.roomMain)
+        self.header += roomModelData.header + self.roomModelInfoHeader
 
 
 @dataclass
@@ -67,7 +74,7 @@ class SceneFile:
 
             if not self.singleFileExport:
                 roomData.roomModelInfo = self.getSourceWithSceneInclude(sceneInclude, roomData.roomModelInfo)
-                roomData.roomModel = self.getSourceWithSceneInclude(sceneInclude, roomData.roomModel)
+                roomData.roomModelInclude = sceneInclude
 
         self.sceneMain = self.getSourceWithSceneInclude(sceneInclude, self.sceneMain)
 
@@ -86,8 +93,8 @@ class SceneFile:
         self.setIncludeData()
 
         for room in self.roomList.values():
-            self.header += room.header
             room.write()
+            self.header += room.header
 
         if self.singleFileExport:
             sceneMainPath = f"{self.name}.c"
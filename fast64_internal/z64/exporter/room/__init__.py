@@ -1,9 +1,10 @@
 from dataclasses import dataclass
+from functools import partial
 from typing import Optional
 from mathutils import Matrix
 from bpy.types import Object
 from ....utility import PluginError, CData, indent
-from ....f3d.f3d_gbi import ScrollMethod, TextureExportSettings
+from ....f3d.f3d_gbi import ExportCData, ScrollMethod, TextureExportSettings
 from ...room.properties import OOTRoomHeaderProperty
 from ...object import addMissingObjectsToAllRoomHeaders
 from ...model_classes import OOTModel, OOTGfxFormatter
@@ -199,22 +200,28 @@ class Room:
 
         return roomC
 
-    def getRoomShapeModelC(self, textureSettings: TextureExportSettings):
-        """Returns the C data of the room model"""
-        roomModel = CData()
+    def getRoomShapeModelC(self, textureSettings: TextureExportSettings, roomModel: Optional[CData] = None):
+        """Writes the C data of the room model to roomModel, or to a new CData, and returns it"""
+        if roomModel is None:
+            roomModel = CData()
 
         for i, entry in enumerate(self.roomShape.dl_entries):
             if entry.opaque is not None:
-                roomModel.append(entry.opaque.to_c(self.roomShape.model.f3d))
+                entry.opaque.to_c(self.roomShape.model.f3d, data=roomModel)
 
             if entry.transparent is not None:
-                roomModel.append(entry.transparent.to_c(self.roomShape.model.f3d))
+                entry.transparent.to_c(self.roomShape.model.f3d, data=roomModel)
 
             # type ``ROOM_SHAPE_TYPE_IMAGE`` only allows 1 room
             if i == 0 and isinstance(self.roomShape, RoomShapeImageBase):
                 break
 
-        roomModel.append(self.roomShape.model.to_c(textureSettings, OOTGfxFormatter(ScrollMethod.Vertex)).all())
+        # the static data is the bulk of the model, write it straight to roomModel and add the rest after it
+        exportData = self.roomShape.model.to_c(
+            textureSettings, OOTGfxFormatter(ScrollMethod.Vertex), ExportCData(roomModel, CData(), CData())
+        )
+        roomModel.append(exportData.dynamicData)
+        roomModel.append(exportData.textureData)
 
         if isinstance(self.roomShape, RoomShapeImageMulti):
             # roomModel.append(self.roomShape.multiImg.getC()) # Error? double call in getRoomShapeC()?
@@ -223,18 +230,18 @@ class Room:
         return roomModel
 
     def getNewRoomFile(self, path: str, isSingleFile: bool, textureExportSettings: TextureExportSettings):
-        """Returns a new ``RoomFile`` element"""
+        """Returns a new ``RoomFile`` element, the room model is only converted to C when the file is written"""
 
         roomMainData = self.getRoomMainC()
-        roomModelData = self.getRoomShapeModelC(textureExportSettings)
         roomModelInfoData = self.roomShape.to_c()
 
         return RoomFile(
             self.name,
             roomMainData.source,
-            roomModelData.source,
+            partial(self.getRoomShapeModelC, textureExportSettings),
             roomModelInfoData.source,
             isSingleFile,
             path,
-            roomMainData.header + roomModelData.header + roomModelInfoData.header,
+            roomMainData.header,
+            roomModelInfoData.header,
         )
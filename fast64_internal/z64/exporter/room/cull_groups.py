@@ -0,0 +1,82 @@
+"""
+Splits the triangles of a room into spatially coherent groups, each drawn by its own cullable room shape entry.
+The room is split top down like a BVH, always splitting the group with the largest bounds along its longest axis,
+then the groups are refined with a few k-means iterations over the triangle centers.
+Every group costs a display list call and reloads its materials, so a split is only kept if it makes culling
+noticeably tighter.
+"""
+
+import numpy as np
+
+SPLIT_GAIN = 0.85  # a split is kept if the triangle weighted radius of both halves is at most this much of the whole
+MIN_GROUP_TRIANGLES = 32
+KMEANS_ITERATIONS = 8
+
+
+def get_radius(triangles: np.ndarray) -> float:
+    """Radius of the sphere around the bounding box center enclosing the (n, 3, 3) triangles"""
+    points = triangles.reshape(-1, 3)
+    center = (points.min(axis=0) + points.max(axis=0)) / 2
+    return float(np.sqrt(((points - center) ** 2).sum(axis=1).max()))
+
+
+def get_cost(triangles: np.ndarray, groups: list[np.ndarray]) -> float:
+    """How many triangles are drawn when a group is seen, weighted by how likely its bounds are to be seen"""
+    return sum(len(group) * get_radius(triangles[group]) for group in groups)
+
+
+def split_group(triangles: np.ndarray, centers: np.ndarray, group: np.ndarray):
+    if len(group) < MIN_GROUP_TRIANGLES * 2:
+        return None
+    group_centers = centers[group]
+    axis = np.argmax(group_centers.max(axis=0) - group_centers.min(axis=0))
+    order = group[np.argsort(group_centers[:, axis], kind="stable")]
+    halves = [order[: len(order) // 2], order[len(order) // 2 :]]
+    if get_cost(triangles, halves) > SPLIT_GAIN * get_cost(triangles, [group]):
+        return None
+    return halves
+
+
+def refine_groups(centers: np.ndarray, groups: list[np.ndarray]) -> list[np.ndarray]:
+    """Lloyd's k-means, seeded with the groups, groups smaller than the minimum are merged into the nearest ones"""
+    means = np.array([centers[group].mean(axis=0) for group in groups])
+    for _ in range(KMEANS_ITERATIONS):
+        distances = ((centers[:, np.newaxis, :] - means[np.newaxis, :, :]) ** 2).sum(axis=2)
+        labels = distances.argmin(axis=1)
+        counts = np.bincount(labels, minlength=len(means))
+        keep = counts >= MIN_GROUP_TRIANGLES
+        if not keep.all():
+            means = means[keep]
+            continue
+        new_means = np.array([centers[labels == i].mean(axis=0) for i in range(len(means))])
+        if np.allclose(new_means, means):
+            break
+        means = new_means
+    labels = ((centers[:, np.newaxis, :] - means[np.newaxis, :, :]) ** 2).sum(axis=2).argmin(axis=1)
+    return [group for group in (np.flatnonzero(labels == i) for i in range(len(means))) if len(group) > 0]
+
+
+def partition_triangles(triangles: np.ndarray, max_groups: int) -> list[np.ndarray]:
+    """
+    triangles is a (n, 3, 3) array of the triangle corners in export space.
+    Returns at most max_groups arrays of triangle indices, a single group if splitting does not help culling.
+    """
+    centers = triangles.mean(axis=1)
+    open_groups = [np.arange(len(triangles))]
+    final_groups = []
+    while open_groups and len(open_groups) + len(final_groups) < max_groups:
+        open_groups.sort(key=lambda group: get_radius(triangles[group]))
+        group = open_groups.pop()
+        halves = split_group(triangles, centers, group)
+        if halves is None:
+            final_groups.append(group)
+        else:
+            open_groups.extend(halves)
+    groups = open_groups + final_groups
+    if len(groups) == 1:
+        return groups
+
+    refined = refine_groups(centers, groups)
+    if get_cost(triangles, refined) < get_cost(triangles, groups):
+        return refined
+    return groups
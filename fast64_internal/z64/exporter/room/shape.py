@@ -1,17 +1,22 @@
 import bpy
+import math
 import shutil
 import os
+import numpy as np
 
 from dataclasses import dataclass, field
 from typing import Optional
 from ....utility import PluginError, CData, toAlnum, indent
 from ....f3d.f3d_gbi import SPDisplayList, SPEndDisplayList, GfxListTag, GfxList, DLFormat
 from ....f3d.f3d_writer import TriangleConverterInfo, saveStaticModel, getInfoDict
+from ....f3d.f3d_mesh_data import get_attribute_array
+from ....f3d.f3d_bounds import BoundingVolume, transform_points
 from ...room.properties import OOTRoomHeaderProperty, OOTBGProperty
 from ...model_classes import OOTModel
 from ..utility import Utility
+from .cull_groups import partition_triangles
 from bpy.types import Object
-from mathutils import Matrix, Vector
+from mathutils import Matrix
 from ....f3d.occlusion_planes.exporter import addOcclusionQuads, OcclusionPlaneCandidatesList
 
 from ...utility import (
@@ -451,6 +456,12 @@ class RoomShapeCullableEntry(
 
 @dataclass
 class RoomShapeCullable(RoomShape):
+    auto_cull_entry: Optional[RoomShapeCullableEntry] = field(init=False, default=None)
+    """Entry whose meshes are split into automatic cull groups, None if disabled"""
+
+    auto_cull_meshes: list[tuple[Object, Matrix]] = field(init=False, default_factory=list)
+    """Meshes of auto_cull_entry with their transform, converted once the whole room is processed"""
+
     def get_type(self):
         return "ROOM_SHAPE_TYPE_CULLABLE"
 
@@ -546,6 +557,8 @@ class RoomShapeUtility:
         pos, _, scale, _ = Utility.getConvertedTransform(transform, sceneObj, roomObj, True)
         cull_group = CullGroup(pos, scale, roomObj.ootRoomHeader.defaultCullDistance)
         dl_entry = room_shape.add_dl_entry(cull_group)
+        if isinstance(room_shape, RoomShapeCullable) and props.autoCullGroupCount > 1:
+            room_shape.auto_cull_entry = dl_entry
         boundingBox = BoundingBox()
         ootProcessMesh(
             room_shape,
@@ -557,6 +570,8 @@ class RoomShapeUtility:
             None,
             boundingBox,
         )
+        if isinstance(room_shape, RoomShapeCullable) and room_shape.auto_cull_meshes:
+            ootAddAutoCullGroups(room_shape, props.autoCullGroupCount, not saveTexturesAsPNG)
         if isinstance(dl_entry, RoomShapeCullableEntry):
             dl_entry.bounds_sphere_center, dl_entry.bounds_sphere_radius = boundingBox.getEnclosingSphere()
 
@@ -570,41 +585,21 @@ class RoomShapeUtility:
 
 class BoundingBox:
     def __init__(self):
-        self.minPoint = None
-        self.maxPoint = None
-        self.points = []
+        self.bounds = BoundingVolume()
 
-    def addPoint(self, point: tuple[float, float, float]):
-        if self.minPoint is None:
-            self.minPoint = list(point[:])
-        else:
-            for i in range(3):
-                if point[i] < self.minPoint[i]:
-                    self.minPoint[i] = point[i]
-        if self.maxPoint is None:
-            self.maxPoint = list(point[:])
-        else:
-            for i in range(3):
-                if point[i] > self.maxPoint[i]:
-                    self.maxPoint[i] = point[i]
-        self.points.append(point)
+    def addPoints(self, points: np.ndarray):
+        self.bounds.add_points(points)
 
     def addMeshObj(self, obj: bpy.types.Object, transform: Matrix):
-        mesh = obj.data
-        for vertex in mesh.vertices:
-            self.addPoint(transform @ vertex.co)
+        self.addPoints(transform_points(get_attribute_array(obj.data.vertices, "co", 3), transform))
 
-    def getEnclosingSphere(self) -> tuple[float, float]:
-        centroid = (Vector(self.minPoint) + Vector(self.maxPoint)) / 2
-        radius = 0
-        for point in self.points:
-            distance = (Vector(point) - centroid).length
-            if distance > radius:
-                radius = distance
-
-        transformedCentroid = [round(value) for value in centroid]
-        transformedRadius = round(radius)
-        return transformedCentroid, transformedRadius
+    def getEnclosingSphere(self) -> tuple[list[int], int]:
+        if self.bounds.is_empty():
+            return [0, 0, 0], 0
+        center, radius = self.bounds.get_sphere()
+        roundedCenter = [round(value) for value in center]
+        # grow the radius by the distance the center moved, so the sphere still encloses everything
+        return roundedCenter, math.ceil(radius + np.linalg.norm(center - roundedCenter))
 
 
 # This function should be called on a copy of an object
@@ -643,20 +638,26 @@ def ootProcessMesh(
         )
 
     elif obj.type == "MESH" and not obj.ignore_render:
-        triConverterInfo = TriangleConverterInfo(obj, None, roomShape.model.f3d, relativeTransform, getInfoDict(obj))
-        fMeshes = saveStaticModel(
-            triConverterInfo,
-            roomShape.model,
-            obj,
-            relativeTransform,
-            roomShape.model.name,
-            convertTextureData,
-            False,
-            "oot",
-        )
-        if fMeshes is not None:
-            for drawLayer, fMesh in fMeshes.items():
-                dlEntry.add_dl_call(fMesh.draw, drawLayer)
+        if isinstance(roomShape, RoomShapeCullable) and dlEntry is roomShape.auto_cull_entry:
+            # converted by ootAddAutoCullGroups once the whole room is known
+            roomShape.auto_cull_meshes.append((obj, relativeTransform))
+        else:
+            triConverterInfo = TriangleConverterInfo(
+                obj, None, roomShape.model.f3d, relativeTransform, getInfoDict(obj)
+            )
+            fMeshes = saveStaticModel(
+                triConverterInfo,
+                roomShape.model,
+                obj,
+                relativeTransform,
+                roomShape.model.name,
+                convertTextureData,
+                False,
+                "oot",
+            )
+            if fMeshes is not None:
+                for drawLayer, fMesh in fMeshes.items():
+                    dlEntry.add_dl_call(fMesh.draw, drawLayer)
 
         boundingBox.addMeshObj(obj, relativeTransform)
 
@@ -686,6 +687,49 @@ def ootProcessMesh(
             )
 
 
+def ootAddAutoCullGroups(roomShape: RoomShapeCullable, maxGroups: int, convertTextureData: bool):
+    """Converts the meshes of the room's auto cull entry split into new entries by partition_triangles"""
+    meshTriangles = []
+    for obj, relativeTransform in roomShape.auto_cull_meshes:
+        infoDict = getInfoDict(obj)  # computes the loop triangles
+        positions = transform_points(get_attribute_array(obj.data.vertices, "co", 3), relativeTransform)
+        triVertices = get_attribute_array(obj.data.loop_triangles, "vertices", 3, np.int32)
+        meshTriangles.append((infoDict, positions, triVertices))
+
+    triangles = np.concatenate([positions[triVertices] for _, positions, triVertices in meshTriangles])
+    if len(triangles) == 0:
+        return
+    meshStarts = np.cumsum([0] + [len(triVertices) for _, _, triVertices in meshTriangles])
+    for group in partition_triangles(triangles, maxGroups):
+        groupBox = BoundingBox()
+        groupBox.addPoints(triangles[group])
+        center, radius = groupBox.getEnclosingSphere()
+        dlEntry = roomShape.add_dl_entry(CullGroup(center, [radius], 1))
+
+        for (obj, relativeTransform), (infoDict, _, _), start, end in zip(
+            roomShape.auto_cull_meshes, meshTriangles, meshStarts[:-1], meshStarts[1:]
+        ):
+            indices = group[(group >= start) & (group < end)] - start
+            if len(indices) == 0:
+                continue
+            triConverterInfo = TriangleConverterInfo(obj, None, roomShape.model.f3d, relativeTransform, infoDict)
+            fMeshes = saveStaticModel(
+                triConverterInfo,
+                roomShape.model,
+                obj,
+                relativeTransform,
+                roomShape.model.name,
+                convertTextureData,
+                False,
+                "oot",
+                [obj.data.loop_triangles[i] for i in np.sort(indices).tolist()],
+                f"{obj.original_name}_cull_{len(roomShape.dl_entries) - 1}",
+            )
+            if fMeshes is not None:
+                for drawLayer, fMesh in fMeshes.items():
+                    dlEntry.add_dl_call(fMesh.draw, drawLayer)
+
+
 def ootProcessLOD(
     roomShape: RoomShape,
     dlEntry: RoomShapeDListsEntry,
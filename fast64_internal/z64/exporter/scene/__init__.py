@@ -7,6 +7,7 @@ from typing import Optional
 
 from ....game_data import game_data
 from ....utility import PluginError, CData, indent
+from ....f3d.f3d_dedup import merge_identical_lists
 from ....f3d.f3d_gbi import TextureExportSettings, ScrollMethod
 from ...scene.properties import OOTSceneHeaderProperty
 from ...model_classes import OOTModel, OOTGfxFormatter
@@ -204,6 +205,7 @@ class Scene:
 
         hasAlternateHeaders = True if len(altHeader.cutscenes) > 0 else hasAlternateHeaders
         altHeader = altHeader if hasAlternateHeaders else None
+        merge_identical_lists(model)
         return Scene(name, model, mainHeader, altHeader, rooms, colHeader, hasAlternateHeaders)
 
     def validateRoomIndices(self):
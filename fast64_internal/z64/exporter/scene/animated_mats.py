@@ -7,7 +7,7 @@ from typing import Optional, Any
 from pathlib import Path
 
 from ....game_data import game_data
-from ....utility import CData, PluginError, exportColor, scaleToU8, toAlnum, get_new_empty_object, indent
+from ....utility import CData, PluginError, writeFile, exportColor, scaleToU8, toAlnum, get_new_empty_object, indent
 from ...utility import getObjectList, is_hackeroot
 from ...scene.properties import OOTSceneHeaderProperty
 from ..collision.surface import SurfaceType
@@ -812,13 +812,13 @@ class SceneAnimatedMaterial:
 
         if settings.is_custom_path:
             c_path = export_path / f"{filename}.inc.c"
-            c_path.write_text(data.header + "\n" + data.source)
+            writeFile(c_path, data.header + "\n" + data.source)
         else:
             h_path = export_path / f"{filename}.h"
-            h_path.write_text(data.header)
+            writeFile(h_path, data.header)
 
             c_path = export_path / f"{filename}.c"
-            c_path.write_text(data.source)
+            writeFile(c_path, data.source)
 
     @staticmethod
     def from_data():
@@ -9,8 +9,9 @@ from bpy.utils import register_class, unregister_class
 from mathutils import Matrix
 from typing import Optional
 
-from ...utility import CData, PluginError, ExportUtils, raisePluginError, writeCData, toAlnum
+from ...utility import CData, PluginError, ExportUtils, raisePluginError, report_file_writes, writeCData, toAlnum
 from ...f3d.f3d_parser import importMeshC, getImportData
+from ...f3d.f3d_dedup import merge_identical_lists
 from ...f3d.f3d_gbi import DLFormat, TextureExportSettings, ScrollMethod, get_F3D_GBI
 from ...f3d.f3d_writer import TriangleConverterInfo, removeDL, saveStaticModel, getInfoDict
 from ..utility import ootGetObjectPath, ootGetObjectHeaderPath, getOOTScale
@@ -89,6 +90,7 @@ def ootConvertMeshToC(
 
     path = ootGetPath(exportPath, isCustomExport, "assets/objects/", folderName, False, True)
     includeDir = settings.customAssetIncludeDir if settings.isCustom else f"assets/objects/{folderName}"
+    merge_identical_lists(fModel)
     exportData = fModel.to_c(
         TextureExportSettings(False, saveTextures, includeDir, path), OOTF3DGfxFormatter(ScrollMethod.Vertex)
     )
@@ -217,6 +219,7 @@ class OOT_ExportDL(Operator):
                 )
 
                 self.report({"INFO"}, "Success!")
+                report_file_writes(self)
                 return {"FINISHED"}
 
             except Exception as e:
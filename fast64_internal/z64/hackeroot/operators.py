@@ -4,7 +4,7 @@ from bpy.path import abspath
 from bpy.types import Operator
 from bpy.utils import register_class, unregister_class
 
-from ..exporter.decomp_edit.config import Config
+from ...utility import report_file_writes
 
 
 class HackerOoT_ClearBootupScene(Operator):
@@ -13,8 +13,11 @@ class HackerOoT_ClearBootupScene(Operator):
     bl_options = {"REGISTER", "UNDO", "PRESET"}
 
     def execute(self, context):
+        from ..exporter.decomp_edit.config import Config
+
         Config.clearBootupScene(os.path.join(abspath(context.scene.ootDecompPath), "include/config/config_debug.h"))
         self.report({"INFO"}, "Success!")
+        report_file_writes(self)
         return {"FINISHED"}
 
 
@@ -19,7 +19,7 @@ from .actor.properties import (
     OOTEntranceProperty,
 )
 
-# Make sure to add exceptions in utility.py - selectMeshChildrenOnly
+# Make sure to add exceptions in utility.py - yieldMeshChildrenOnly
 ootEnumEmptyType = [
     ("None", "None", "None"),
     ("Scene", "Scene", "Scene"),
@@ -125,6 +125,14 @@ class OOTRoomHeaderProperty(PropertyGroup):
 
     roomShape: EnumProperty(items=ootEnumRoomShapeType, default="ROOM_SHAPE_TYPE_NORMAL")
     defaultCullDistance: IntProperty(name="Default Cull Distance", min=1, default=100)
+    autoCullGroupCount: IntProperty(
+        name="Auto Cull Groups",
+        description="Maximum amount of cull groups the meshes outside of Custom Cull Group empties are split into, "
+        "parts are only split off when it makes their bounds noticeably smaller. 0 or 1 keeps them in one group",
+        min=0,
+        max=64,
+        default=0,
+    )
     bgImageList: CollectionProperty(type=OOTBGProperty)
     bgImageTab: BoolProperty(name="BG Images")
 
@@ -179,6 +187,7 @@ class OOTRoomHeaderProperty(PropertyGroup):
                     general.label(text="and requires meshes to be parented to Custom Cull Group empties.")
                     general.label(text="RSP culling is done automatically regardless of room shape.")
                     prop_split(general, self, "defaultCullDistance", "Default Cull (Blender Units)")
+                    prop_split(general, self, "autoCullGroupCount", "Auto Cull Groups")
             # Behaviour
             behaviourBox = layout.column()
             behaviourBox.box().label(text="Behaviour")
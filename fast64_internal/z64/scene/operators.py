@@ -7,12 +7,9 @@ from bpy.utils import register_class, unregister_class
 from bpy.ops import object
 from mathutils import Matrix, Vector
 
-from ...utility import PluginError, ExportUtils, raisePluginError, ootGetSceneOrRoomHeader
+from ...utility import PluginError, ExportUtils, raisePluginError, report_file_writes, ootGetSceneOrRoomHeader
 from ..utility import ExportInfo, RemoveInfo, sceneNameFromID, is_hackeroot
 from ..constants import ootEnumMusicSeq, ootEnumSceneID
-from ..importer import parseScene
-
-from ..exporter import SceneExport, Files
 
 
 def run_ops_without_view_layer_update(func):
@@ -32,6 +29,8 @@ def run_ops_without_view_layer_update(func):
 
 
 def parseSceneFunc():
+    from ..importer import parseScene
+
     settings = bpy.context.scene.ootSceneImportSettings
     parseScene(settings, settings.option)
 
@@ -119,6 +118,8 @@ class OOT_ExportScene(Operator):
     bl_options = {"REGISTER", "UNDO", "PRESET"}
 
     def execute(self, context):
+        from ..exporter import SceneExport
+
         with ExportUtils() as export_utils:
             activeObj = None
             try:
@@ -179,6 +180,7 @@ class OOT_ExportScene(Operator):
                 )
 
                 self.report({"INFO"}, "Success!")
+                report_file_writes(self)
 
                 # don't select the scene
                 for elem in context.selectable_objects:
@@ -211,6 +213,8 @@ class OOT_RemoveScene(Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
+        from ..exporter import Files
+
         settings = context.scene.ootSceneRemoveSettings  # Type: OOTRemoveSceneSettingsProperty
         option = settings.option
 
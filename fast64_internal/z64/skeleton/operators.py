@@ -4,9 +4,8 @@ from bpy.utils import register_class, unregister_class
 from bpy.path import abspath
 from mathutils import Matrix
 from ...f3d.f3d_gbi import DLFormat
-from ...utility import PluginError, ExportUtils, raisePluginError
+from ...utility import PluginError, ExportUtils, raisePluginError, report_file_writes
 from ..utility import getStartBone, getNextBone, getOOTScale
-from ..exporter.skeleton import ootConvertArmatureToC
 from .importer import ootImportSkeletonC
 from .properties import OOTSkeletonImportSettings, OOTSkeletonExportSettings
 
@@ -94,6 +93,8 @@ class OOT_ExportSkeleton(Operator):
     # Called on demand (i.e. button press, menu item)
     # Can also be called from operator search menu (Spacebar)
     def execute(self, context):
+        from ..exporter.skeleton import ootConvertArmatureToC
+
         with ExportUtils() as export_utils:
             armatureObj = None
             if context.mode != "OBJECT":
@@ -128,6 +129,7 @@ class OOT_ExportSkeleton(Operator):
                 )
 
                 self.report({"INFO"}, "Success!")
+                report_file_writes(self)
                 return {"FINISHED"}
 
             except Exception as e:
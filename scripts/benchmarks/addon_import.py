@@ -0,0 +1,51 @@
+"""
+Times importing and registering the addon, to catch regressions in Blender startup time.
+Each run must be in a new Blender process, since modules are only imported once.
+Must be run with fast64 installed but NOT enabled, hence --factory-startup.
+
+Usage:
+blender --background --factory-startup --python-exit-code 1 --python addon_import.py -- [addon module name]
+
+Example:
+blender --background --factory-startup --python-exit-code 1 --python addon_import.py -- fast64
+blender --background --factory-startup --python-exit-code 1 --python addon_import.py -- bl_ext.user_default.fast64
+"""
+
+import os
+import sys
+import importlib
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from common import getArgs, timeIt
+
+args = getArgs()
+addonName = args[0] if len(args) > 0 else "fast64"
+slowestCount = 15
+
+assert addonName not in sys.modules, f"{addonName} is already imported, run with --factory-startup"
+modulesBefore = set(sys.modules)
+
+addon, importTime = timeIt(lambda: importlib.import_module(addonName))
+_, registerTime = timeIt(addon.register)
+_, unregisterTime = timeIt(addon.unregister)
+
+newModules = sorted(set(sys.modules) - modulesBefore)
+addonModules = [name for name in newModules if name.startswith(addonName)]
+print(f"import {importTime:.3f}s, register {registerTime:.3f}s, unregister {unregisterTime:.3f}s")
+print(f"{len(addonModules)} addon modules and {len(newModules) - len(addonModules)} other modules imported")
+
+# time each addon module again in isolation, heavy modules are usually large tables or eager data loading
+moduleTimes = []
+for name in addonModules:
+    module = sys.modules[name]
+    source = getattr(module, "__file__", None)
+    if source is None or not source.endswith(".py"):
+        continue
+    with open(source, "rb") as file:
+        code = file.read()
+    _, elapsed = timeIt(lambda: compile(code, source, "exec"))
+    moduleTimes.append((elapsed, name))
+
+print("Slowest modules to compile without cached bytecode:")
+for elapsed, name in sorted(moduleTimes, reverse=True)[:slowestCount]:
+    print(f"    {elapsed:.3f}s {name}")
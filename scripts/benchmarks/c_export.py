@@ -0,0 +1,103 @@
+"""
+Compares the peak memory and time of writing the C data of a large generated model three ways:
+concatenating every list's C into one string with += as fast64 used to, keeping it in a CData until it is written,
+and streaming it to the files with CFileWriter while it is converted. Also checks that all three write the same files.
+Must be run with fast64 enabled.
+
+Usage:
+blender --background --python-exit-code 1 --python c_export.py -- [list count] [vertices per list]
+
+Example:
+blender --background --python-exit-code 1 --python c_export.py -- 4000 64
+"""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from common import getArgs, getFast64Module, timeIt
+
+args = getArgs()
+listCount = int(args[0]) if len(args) > 0 else 2000
+vertexCount = int(args[1]) if len(args) > 1 else 64
+textureInterval = 16  # one 32x32 texture per this many lists
+
+gbi = getFast64Module("f3d.f3d_gbi")
+utility = getFast64Module("utility")
+
+vertexLists, displayLists, textures = [], [], []
+for i in range(listCount):
+    vertexList = gbi.VtxList(f"benchmark_vtx_{i}")
+    vertexList.vertices.extend(
+        [gbi.Vtx([j, -j, j * 2], [j * 32, j * 16], [255, 128, j % 256, 255]) for j in range(vertexCount)]
+    )
+    displayList = gbi.GfxList(f"benchmark_tri_{i}", gbi.GfxListTag.Geometry, gbi.DLFormat.Static)
+    displayList.commands.append(gbi.SPVertex(vertexList, 0, vertexCount, 0))
+    displayList.commands.extend(gbi.SP1Triangle(j, j + 1, j + 2, 0) for j in range(vertexCount - 2))
+    displayList.commands.append(gbi.SPEndDisplayList())
+    vertexLists.append(vertexList)
+    displayLists.append(displayList)
+    if i % textureInterval == 0:
+        texture = gbi.FImage(f"benchmark_tex_{i}", "G_IM_FMT_RGBA", "G_IM_SIZ_16b", 32, 32, f"benchmark_tex_{i}.inc.c")
+        texture.data = bytearray((j * 7 + i) % 256 for j in range(32 * 32 * 2))
+        texture.converted = True
+        textures.append(texture)
+
+f3d = gbi.F3D("F3DEX2/LX2")
+outputDir = tempfile.mkdtemp()
+sourcePath, headerPath = os.path.join(outputDir, "model.inc.c"), os.path.join(outputDir, "header.h")
+
+
+def writeModel(data):
+    for texture in textures:
+        texture.to_c(64, data)
+    for vertexList, displayList in zip(vertexLists, displayLists):
+        vertexList.to_c(data)
+        displayList.to_c(f3d, data=data)
+    return data
+
+
+def concatenated():
+    source = header = ""
+    for texture in textures:
+        textureData = texture.to_c(64)
+        source += textureData.source
+        header += textureData.header
+    for vertexList, displayList in zip(vertexLists, displayLists):
+        for listData in (vertexList.to_c(), displayList.to_c(f3d)):
+            source += listData.source
+            header += listData.header
+    with open(sourcePath, "w", newline="\n", encoding="utf-8") as sourceFile:
+        sourceFile.write(source)
+    with open(headerPath, "w", newline="\n", encoding="utf-8") as headerFile:
+        headerFile.write(header)
+
+
+def inMemory():
+    utility.writeCData(writeModel(utility.CData()), headerPath, sourcePath)
+
+
+def streamed():
+    with utility.CFileWriter(sourcePath) as sourceFile, utility.CFileWriter(headerPath) as headerFile:
+        writeModel(utility.CData(sourceFile, headerFile))
+
+
+outputs = {}
+for name, func in (("concatenated", concatenated), ("in memory", inMemory), ("streamed", streamed)):
+    for path in (sourcePath, headerPath):
+        if os.path.exists(path):
+            os.remove(path)  # otherwise the files would only be compared against the previous output
+    tracemalloc.start()
+    _, elapsed = timeIt(func)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name}: {elapsed:.3f}s, peak {peak / 2**20:.1f} MiB, {os.path.getsize(sourcePath) / 2**20:.1f} MiB written")
+    outputs[name] = (utility.readFile(sourcePath), utility.readFile(headerPath))
+
+assert len(set(outputs.values())) == 1, "C output differs"
+
+os.remove(sourcePath)
+os.remove(headerPath)
+os.rmdir(outputDir)
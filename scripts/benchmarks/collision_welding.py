@@ -0,0 +1,122 @@
+"""
+Times SM64 and OoT collision export on grid meshes of increasing size.
+For small grids, also checks that the output is the same as with the linear scan welding fast64 used before:
+the SM64 vertices and triangles against the mesh's triangle corners welded by a linear scan,
+the OoT vertices and polygons against an export with the linear scan put back into CollisionUtility.
+Must be run with fast64 enabled.
+
+Usage:
+blender --background --python-exit-code 1 --python collision_welding.py -- [triangle counts...]
+
+Example:
+blender --background --python-exit-code 1 --python collision_welding.py -- 1000 10000 50000 200000
+"""
+
+import os
+import sys
+
+import bpy
+from mathutils import Matrix
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from common import getArgs, getFast64Module, timeIt
+
+args = getArgs()
+triangleCounts = [int(arg) for arg in args] if len(args) > 0 else [1000, 10000, 50000, 200000]
+linearScanLimit = 10000  # above this, the linear scan takes too long to be worth comparing
+
+sm64Collision = getFast64Module("sm64.sm64_collision")
+ootCollision = getFast64Module("z64.exporter.collision")
+
+
+def makeGrid(triangleCount: int):
+    """Makes a wavy grid so that faces are not all coplanar, parented to an empty for the OoT exporter"""
+    size = max(1, int((triangleCount / 2) ** 0.5))
+    bpy.ops.object.empty_add(location=(0, 0, 0))
+    root = bpy.context.active_object
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=size, y_subdivisions=size, size=size * 10)
+    grid = bpy.context.active_object
+    for vert in grid.data.vertices:
+        vert.co.z = ((vert.co.x + vert.co.y) % 7) * 3
+    grid.data.materials.append(bpy.data.materials.new("benchmark_collision"))
+    grid.parent = root
+    return root, grid
+
+
+def linearScanWeld(faces: list) -> tuple[list, list]:
+    positions, indices = [], []
+    for faceVerts in faces:
+        for position in faceVerts:
+            if position in positions:
+                indices.append(positions.index(position))
+            else:
+                positions.append(position)
+                indices.append(len(positions) - 1)
+    return positions, indices
+
+
+def linearScanVertexIndex(vertexPos, vertexList, indexFromPos):
+    """CollisionUtility.getVertexIndex as it was before the position hash map, ignores indexFromPos"""
+    for i, vertex in enumerate(vertexList):
+        if vertex.pos == vertexPos:
+            return i
+    vertexList.append(ootCollision.CollisionVertex(vertexPos))
+    return len(vertexList) - 1
+
+
+def getOOTCollisionData(root):
+    return ootCollision.CollisionUtility.getCollisionData(root, Matrix.Identity(4), True, True)
+
+
+def checkSM64Collision(grid, collision):
+    """The grid has an identity transform, so its triangle corners are the positions the exporter rounds"""
+    grid.data.calc_loop_triangles()
+    faces = [
+        [sm64Collision.roundPosition(grid.data.vertices[index].co) for index in face.vertices]
+        for face in grid.data.loop_triangles
+    ]
+    (positions, indices), linearTime = timeIt(lambda: linearScanWeld(faces))
+    assert [vertex.position for vertex in collision.vertices] == positions, "sm64 vertices differ"
+    triangleIndices = [
+        index for triangles in collision.triangles.values() for tri in triangles for index in tri.indices
+    ]
+    assert triangleIndices == indices, "sm64 triangles differ"
+    return linearTime
+
+
+def checkOOTCollision(root, vertexList, polyList):
+    getVertexIndex = ootCollision.CollisionUtility.getVertexIndex
+    ootCollision.CollisionUtility.getVertexIndex = staticmethod(linearScanVertexIndex)
+    try:
+        (_, linearVertexList, linearPolyList, _), linearTime = timeIt(lambda: getOOTCollisionData(root))
+    finally:
+        ootCollision.CollisionUtility.getVertexIndex = getVertexIndex
+    assert len(vertexList) == len(linearVertexList), "oot vertex count differs"
+    for i, (vertex, linearVertex) in enumerate(zip(vertexList, linearVertexList)):
+        assert vertex == linearVertex, f"oot vertex {i} differs"
+    assert len(polyList) == len(linearPolyList), "oot polygon count differs"
+    for i, (poly, linearPoly) in enumerate(zip(polyList, linearPolyList)):
+        assert poly == linearPoly, f"oot polygon {i} differs"
+    return linearTime
+
+
+for triangleCount in triangleCounts:
+    root, grid = makeGrid(triangleCount)
+    triangles = len(grid.data.polygons) * 2
+
+    collision, sm64Time = timeIt(
+        lambda: sm64Collision.exportCollisionCommon(grid, Matrix.Identity(4), False, False, "benchmark", None)
+    )
+    (_, vertexList, polyList, _), ootTime = timeIt(lambda: getOOTCollisionData(root))
+    print(
+        f"{triangles} triangles: sm64 {sm64Time:.3f}s ({len(collision.vertices)} vertices), "
+        f"oot {ootTime:.3f}s ({len(vertexList)} vertices)"
+    )
+
+    if triangles <= linearScanLimit:
+        sm64LinearTime = checkSM64Collision(grid, collision)
+        ootLinearTime = checkOOTCollision(root, vertexList, polyList)
+        print(f"    linear scan: sm64 welding alone {sm64LinearTime:.3f}s, oot export {ootLinearTime:.3f}s")
+
+    bpy.data.meshes.remove(grid.data)
+    bpy.data.objects.remove(root)
@@ -0,0 +1,29 @@
+"""
+Helpers shared by the benchmark scripts.
+Blender does not add a script's directory to sys.path, so each script adds it before importing this module:
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from common import getArgs, getFast64Module, timeIt
+"""
+
+import importlib
+import sys
+import time
+
+
+def getArgs() -> list[str]:
+    """Arguments after "--", Blender leaves those to the script"""
+    return sys.argv[(sys.argv.index("--") + 1) :] if "--" in sys.argv else []
+
+
+def getFast64Module(name: str):
+    """The addon's package name depends on how it was installed, exporters are only imported on first use"""
+    package = next(module for module in sys.modules if module.endswith(".fast64_internal"))
+    return importlib.import_module(f"{package}.{name}")
+
+
+def timeIt(func):
+    """Returns func's result and how long it took in seconds"""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
@@ -0,0 +1,86 @@
+"""
+Times converting a skinned SM64 armature to a geolayout, for chains of increasing joint counts.
+Each joint owns a ring of a cylinder, so every joint except the first has skinned faces connecting it to its parent.
+Must be run with fast64 enabled.
+
+Usage:
+blender --background --python-exit-code 1 --python skinned_export.py -- [ring segments] [joint counts...]
+
+Example:
+blender --background --python-exit-code 1 --python skinned_export.py -- 32 8 32 128
+"""
+
+import os
+import sys
+from math import cos, pi, sin
+
+import bpy
+from mathutils import Matrix
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from common import getArgs, getFast64Module, timeIt
+
+args = getArgs()
+segments = int(args[0]) if len(args) > 0 else 16
+jointCounts = [int(arg) for arg in args[1:]] if len(args) > 1 else [8, 32, 128]
+
+geolayoutWriter = getFast64Module("sm64.sm64_geolayout_writer")
+createF3DMat = getFast64Module("f3d.f3d_material").createF3DMat
+DLFormat = getFast64Module("f3d.f3d_gbi").DLFormat
+
+
+def makeSkinnedChain(jointCount: int):
+    """Makes a chain of bones, with a cylinder parented to it that has one ring of vertices per bone"""
+    bpy.ops.object.armature_add(enter_editmode=True, location=(0, 0, 0))
+    armatureObj = bpy.context.active_object
+    editBones = armatureObj.data.edit_bones
+    editBones.remove(editBones[0])
+    parent = None
+    for i in range(jointCount):
+        bone = editBones.new(f"joint_{i}")
+        bone.head, bone.tail = (0, 0, i * 10), (0, 0, i * 10 + 10)
+        bone.parent = parent
+        parent = bone
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+    # rings of vertices at each joint's head, and one more at the last joint's tail
+    verts = [
+        (5 * cos(2 * pi * j / segments), 5 * sin(2 * pi * j / segments), i * 10)
+        for i in range(jointCount + 1)
+        for j in range(segments)
+    ]
+    faces = [
+        (
+            i * segments + j,
+            i * segments + (j + 1) % segments,
+            (i + 1) * segments + (j + 1) % segments,
+            (i + 1) * segments + j,
+        )
+        for i in range(jointCount)
+        for j in range(segments)
+    ]
+    mesh = bpy.data.meshes.new("benchmark_skinned")
+    mesh.from_pydata(verts, [], faces)
+    mesh.uv_layers.new(name="UVMap")
+    obj = bpy.data.objects.new("benchmark_skinned", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+
+    groups = [obj.vertex_groups.new(name=f"joint_{i}") for i in range(jointCount)]
+    for vert in mesh.vertices:
+        groups[min(vert.index // segments, jointCount - 1)].add([vert.index], 1, "REPLACE")
+    createF3DMat(obj)
+    obj.parent = armatureObj
+    return armatureObj, obj
+
+
+for jointCount in jointCounts:
+    armatureObj, obj = makeSkinnedChain(jointCount)
+    _, elapsed = timeIt(
+        lambda: geolayoutWriter.convertArmatureToGeolayout(
+            armatureObj, obj, Matrix.Identity(4), None, "benchmark", DLFormat.Static, True
+        )
+    )
+    print(f"{jointCount} joints, {len(obj.data.vertices)} vertices: {elapsed:.3f}s")
+
+    bpy.data.meshes.remove(obj.data)
+    bpy.data.armatures.remove(armatureObj.data)
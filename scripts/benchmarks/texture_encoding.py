@@ -0,0 +1,109 @@
+"""
+Compares the NumPy texture encoder against the legacy per pixel conversion, checks that both produce the same bytes.
+Must be run with fast64 enabled.
+
+Usage:
+blender --background --python-exit-code 1 --python texture_encoding.py -- [texture count] [size]
+
+Example:
+blender --background --python-exit-code 1 --python texture_encoding.py -- 200 64
+"""
+
+import os
+import sys
+import random
+
+import bpy
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from common import getArgs, getFast64Module, timeIt
+
+args = getArgs()
+textureCount = int(args[0]) if len(args) > 0 else 100
+size = int(args[1]) if len(args) > 1 else 64
+
+textureWriter = getFast64Module("f3d.f3d_texture_writer")
+FImage = getFast64Module("f3d.f3d_gbi").FImage
+
+
+def getColorsUsedInImageLegacy(image, palFormat):
+    """Per pixel version of getColorsUsedInImage, how palettes were built before the NumPy encoder"""
+    palette = []
+    # N64 is -Y, Blender is +Y
+    pixels = image.pixels[:]
+    for j in reversed(range(image.size[1])):
+        for i in range(image.size[0]):
+            pixelColor = textureWriter.extractConvertCIPixel(image, pixels, i, j, palFormat)
+            if pixelColor not in palette:
+                palette.append(pixelColor)
+    return palette
+
+
+def getColorIndicesOfTextureLegacy(image, palette, palFormat):
+    """Per pixel version of getColorIndicesOfTexture, how indices were found before the NumPy encoder"""
+    texture = []
+    # N64 is -Y, Blender is +Y
+    pixels = image.pixels[:]
+    for j in reversed(range(image.size[1])):
+        for i in range(image.size[0]):
+            pixelColor = textureWriter.extractConvertCIPixel(image, pixels, i, j, palFormat)
+            if pixelColor not in palette:
+                raise ValueError(f"Bug: {image.name} palette len {len(palette)} missing CI")
+            texture.append(palette.index(pixelColor))
+    return texture
+
+
+nonCIFormats = ["RGBA16", "RGBA32", "IA4", "IA8", "IA16", "I4", "I8"]
+ciFormats = [("CI4", "RGBA16", 16), ("CI8", "RGBA16", 256), ("CI4", "IA16", 16), ("CI8", "IA16", 256)]
+
+random.seed(0)
+images = []
+for i in range(textureCount):
+    image = bpy.data.images.new(f"benchmark_{i}", size, size, alpha=True)
+    image.pixels[:] = [random.randrange(256) / 255 for _ in range(size * size * 4)]
+    images.append(image)
+
+
+def makeCIImage(image: bpy.types.Image, colorCount: int):
+    """Reduce an image to a few colors so it fits in a palette"""
+    colors = [[random.randrange(256) / 255 for _ in range(4)] for _ in range(colorCount)]
+    ciImage = bpy.data.images.new(image.name + "_ci", size, size, alpha=True)
+    ciImage.pixels[:] = [value for _ in range(size * size) for value in random.choice(colors)]
+    return ciImage
+
+
+for texFmt in nonCIFormats:
+    legacyTime = newTime = 0
+    for image in images:
+        legacy, new = FImage("", "", "", size, size, ""), FImage("", "", "", size, size, "")
+        _, elapsed = timeIt(lambda: textureWriter.writeNonCITextureDataPerPixel(image, legacy, texFmt))
+        legacyTime += elapsed
+        _, elapsed = timeIt(lambda: textureWriter.writeNonCITextureData(image, new, texFmt))
+        newTime += elapsed
+        assert legacy.data == new.data, f"{texFmt} output differs for {image.name}"
+    print(f"{texFmt}: legacy {legacyTime:.3f}s, numpy {newTime:.3f}s, {legacyTime / newTime:.1f}x")
+
+for texFmt, palFmt, colorCount in ciFormats:
+    legacyTime = newTime = 0
+    for image in images[: max(1, textureCount // 4)]:
+        ciImage = makeCIImage(image, colorCount)
+        legacyPalette, elapsed = timeIt(lambda: getColorsUsedInImageLegacy(ciImage, palFmt))
+        legacyTime += elapsed
+        newPalette, elapsed = timeIt(lambda: textureWriter.getColorsUsedInImage(ciImage, palFmt))
+        newTime += elapsed
+        assert legacyPalette == newPalette, f"{palFmt} palette differs for {image.name}"
+
+        legacyIndices, elapsed = timeIt(lambda: getColorIndicesOfTextureLegacy(ciImage, legacyPalette, palFmt))
+        legacyTime += elapsed
+        legacyData = (
+            textureWriter.compactNibbleArray(legacyIndices, size, size) if texFmt == "CI4" else bytearray(legacyIndices)
+        )
+        new = FImage("", "", "", size, size, "")
+        _, elapsed = timeIt(lambda: textureWriter.writeCITextureData(ciImage, new, newPalette, palFmt, texFmt))
+        newTime += elapsed
+        assert legacyData == new.data, f"{texFmt} {palFmt} output differs for {image.name}"
+        bpy.data.images.remove(ciImage)
+    print(f"{texFmt} {palFmt}: legacy {legacyTime:.3f}s, numpy {newTime:.3f}s, {legacyTime / newTime:.1f}x")
+
+for image in images:
+    bpy.data.images.remove(image)
@@ -0,0 +1,58 @@
+"""
+Times converting many textures with the background conversion threads against converting them one by one,
+and checks that both produce the same bytes. The texture cache is disabled while it runs.
+Must be run with fast64 enabled.
+
+Usage:
+blender --background --python-exit-code 1 --python texture_threads.py -- [texture count] [size] [thread count]
+
+Example:
+blender --background --python-exit-code 1 --python texture_threads.py -- 500 64 8
+"""
+
+import os
+import sys
+import random
+
+import bpy
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from common import getArgs, getFast64Module, timeIt
+
+args = getArgs()
+textureCount = int(args[0]) if len(args) > 0 else 500
+size = int(args[1]) if len(args) > 1 else 64
+threadCount = int(args[2]) if len(args) > 2 else 4
+
+textureWriter = getFast64Module("f3d.f3d_texture_writer")
+FImage = getFast64Module("f3d.f3d_gbi").FImage
+settings = bpy.context.scene.fast64.settings
+settings.use_texture_cache = False
+
+formats = ["RGBA16", "RGBA32", "IA8", "IA16", "I4", "I8"]
+random.seed(0)
+images = []
+for i in range(textureCount):
+    image = bpy.data.images.new(f"benchmark_{i}", size, size, alpha=True)
+    image.pixels[:] = [random.randrange(256) / 255 for _ in range(size * size * 4)]
+    images.append(image)
+
+
+def convertAll():
+    fImages = []
+    for i, image in enumerate(images):
+        fImage = FImage(image.name, "", "", size, size, "")
+        textureWriter.writeNonCITextureData(image, fImage, formats[i % len(formats)])
+        fImages.append(fImage)
+    return [fImage.data for fImage in fImages]  # waits for the background conversions
+
+
+settings.texture_conversion_threads = 1
+serial, serialTime = timeIt(convertAll)
+settings.texture_conversion_threads = threadCount
+threaded, threadedTime = timeIt(convertAll)
+assert serial == threaded, "threaded conversion output differs"
+print(f"{textureCount} textures: serial {serialTime:.3f}s, {threadCount} threads {threadedTime:.3f}s")
+
+for image in images:
+    bpy.data.images.remove(image)
@@ -0,0 +1,70 @@
+"""
+Measures the memory used to hold vertices and triangle commands of a large generated model,
+comparing a list of Vtx objects (how VtxList used to store them) against the packed VtxList storage,
+and times converting both to binary and C. Must be run with fast64 enabled.
+
+Usage:
+blender --background --python-exit-code 1 --python vertex_storage.py -- [vertex count]
+
+Example:
+blender --background --python-exit-code 1 --python vertex_storage.py -- 500000
+"""
+
+import os
+import sys
+import random
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from common import getArgs, getFast64Module, timeIt
+
+args = getArgs()
+vertexCount = int(args[0]) if len(args) > 0 else 200000
+
+gbi = getFast64Module("f3d.f3d_gbi")
+
+random.seed(0)
+
+
+def randomVtx():
+    return gbi.Vtx(
+        [random.randint(-(2**15), 2**15 - 1) for _ in range(3)],
+        [random.randint(-(2**15), 2**15 - 1) for _ in range(2)],
+        [random.randrange(256) for _ in range(4)],
+    )
+
+
+def measure(name: str, count: int, build):
+    tracemalloc.start()
+    result, elapsed = timeIt(build)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name}: {size / 2**20:.1f} MiB, {size / count:.0f} bytes each, built in {elapsed:.2f}s")
+    return result
+
+
+vertexObjects = measure("list of Vtx", vertexCount, lambda: [randomVtx() for _ in range(vertexCount)])
+vertexList = gbi.VtxList("benchmark_vtx")
+measure("VtxList", vertexCount, lambda: vertexList.vertices.extend(vertexObjects))
+triangles = measure(
+    "SP2Triangles",
+    vertexCount // 6,
+    lambda: [gbi.SP2Triangles(0, 1, 2, 0, 3, 4, 5, 0) for _ in range(vertexCount // 6)],
+)
+
+
+def perVtxOutput():
+    legacyBinary = bytearray()
+    for vert in vertexObjects:
+        legacyBinary.extend(vert.to_binary())
+    return legacyBinary, "".join(f"\t{vert.to_c()},\n" for vert in vertexObjects)
+
+
+(legacyBinary, legacyC), elapsed = timeIt(perVtxOutput)
+print(f"per Vtx binary and C: {elapsed:.2f}s")
+
+(binary, data), elapsed = timeIt(lambda: (vertexList.to_binary(), vertexList.to_c()))
+print(f"VtxList binary and C: {elapsed:.2f}s")
+
+assert binary == legacyBinary, "binary output differs"
+assert data.source.endswith(legacyC + "};\n\n"), "C output differs"
@@ -0,0 +1,45 @@
+"""
+Times switching the game editor mode between OoT and MM, which rebuilds the XML actor/object/enum data.
+Measures parsing the XML, loading the cached snapshots, and switching back to an already loaded game.
+Must be run with fast64 enabled.
+
+Usage:
+blender --background --python-exit-code 1 --python z64_game_switch.py -- [switch count]
+
+Example:
+blender --background --python-exit-code 1 --python z64_game_switch.py -- 20
+"""
+
+import os
+import sys
+import shutil
+
+import bpy
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from common import getArgs, getFast64Module, timeIt
+
+args = getArgs()
+switchCount = int(args[0]) if len(args) > 0 else 10
+
+z64Common = getFast64Module("data.z64.common")
+z64Data = getFast64Module("game_data").game_data.z64
+scene = bpy.context.scene
+
+
+def timeSwitches(clearMemory: bool, clearDisk: bool):
+    total = 0
+    for i in range(switchCount):
+        if clearMemory:
+            z64Data.tables_by_game.clear()
+        if clearDisk:
+            shutil.rmtree(z64Common.get_cache_dir(), ignore_errors=True)
+        _, elapsed = timeIt(lambda: setattr(scene, "gameEditorMode", "MM" if i % 2 == 0 else "OOT"))
+        total += elapsed
+    return total / switchCount
+
+
+scene.gameEditorMode = "OOT"
+print(f"parsing the XML: {timeSwitches(True, True) * 1000:.1f}ms per switch")
+print(f"loading the snapshots: {timeSwitches(True, False) * 1000:.1f}ms per switch")
+print(f"already loaded: {timeSwitches(False, False) * 1000:.1f}ms per switch")
@@ -0,0 +1,47 @@
+"""
+Writes a runtime cost report of the display lists of mesh objects, the same as the
+"Analyze Display List Cost" button, as <name>_cost.json and <name>_cost.txt in the output directory.
+Uses the scene's microcode, scale, material write method and inline setting. Must be run with fast64 enabled.
+
+Usage:
+blender <blend file> --background --python-exit-code 1 --python gfx_report.py -- <output directory> <object names...>
+
+Example:
+blender level.blend --background --python-exit-code 1 --python gfx_report.py -- reports bob_area_1 bob_area_2
+"""
+
+import os
+import sys
+from math import radians
+
+import bpy
+from mathutils import Matrix
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+from common import getArgs, getFast64Module
+
+args = getArgs()
+if len(args) < 2:
+    raise ValueError("Expected an output directory and at least one object name")
+outputDir, objectNames = args[0], args[1:]
+
+f3dWriter = getFast64Module("f3d.f3d_writer")
+gfxAnalysis = getFast64Module("f3d.f3d_gfx_analysis")
+utility = getFast64Module("utility")
+
+scene = bpy.context.scene
+transform = Matrix.Diagonal((scene.blenderF3DScale,) * 3).to_4x4()
+matWriteMethod = f3dWriter.getWriteMethodFromEnum(scene.matWriteMethod)
+os.makedirs(outputDir, exist_ok=True)
+
+for objectName in objectNames:
+    obj = bpy.data.objects[objectName]
+    name = utility.toAlnum(objectName)
+    utility.applyRotation([obj], radians(90), "X")
+    try:
+        results = f3dWriter.analyzeF3DCost(obj, transform, name, matWriteMethod)
+    finally:
+        utility.applyRotation([obj], radians(-90), "X")
+    reportPath = os.path.join(outputDir, name + "_cost")
+    gfxAnalysis.write_gfx_report(results, reportPath + ".json", reportPath + ".txt")
+    print(gfxAnalysis.get_gfx_report_text(results))